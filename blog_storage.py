@@ -4,13 +4,18 @@
 
 - 단일 버전(content) / 다중 버전(versions) 포맷을 모두 지원
 - 웹/CLI/MCP 서버가 동일한 JSON 스키마를 사용하도록 통합
+- 정리된 source_bundle에는 source_bundle_version을 기록해 다시 읽을 때 재정리하지 않음
+- JSON/마크다운은 임시 파일에 쓴 뒤 os.replace로 교체 (읽는 쪽이 반쯤 쓴 파일을 보지 않음)
+- 버전 수정(update_blog_package_version)은 바뀐 버전의 마크다운만 다시 씀
 """
 
 from __future__ import annotations
 
 import copy
 import json
+import os
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -18,6 +23,10 @@ from typing import Any
 from utils import is_meaningful_text_line, sanitize_text_for_display
 
 
+# _sanitize_source_bundle 규칙이 바뀌면 올려서 저장된 번들을 다시 정리하게 한다
+SOURCE_BUNDLE_VERSION = 1
+_EDITABLE_FIELDS = ("title", "content", "tags", "meta_description")
+
 DEFAULT_VERSION_ORDER = ["formal", "balanced", "casual"]
 DEFAULT_VERSION_LABELS = {
     "formal": "포멀",
@@ -149,8 +158,8 @@ def _sanitize_source_bundle(bundle: dict[str, Any] | None) -> dict[str, Any]:
 
 
 def normalize_blog_version(version: dict[str, Any], index: int = 0) -> dict[str, Any]:
-    """개별 버전 dict를 공통 스키마로 정규화."""
-    data = copy.deepcopy(version or {})
+    """개별 버전 dict를 공통 스키마로 정규화 (새 dict 반환, 입력은 수정하지 않음)."""
+    data = version or {}
     version_type = data.get("version_type") or (
         DEFAULT_VERSION_ORDER[index] if index < len(DEFAULT_VERSION_ORDER) else f"variant_{index + 1}"
     )
@@ -171,9 +180,18 @@ def normalize_blog_version(version: dict[str, Any], index: int = 0) -> dict[str,
     }
 
 
-def ensure_blog_package_shape(data: dict[str, Any] | None) -> dict[str, Any]:
-    """레거시 단일 버전 포맷을 포함해 블로그 패키지를 공통 스키마로 변환."""
-    package = copy.deepcopy(data or {})
+def _title_variants(package: dict[str, Any]) -> list[str]:
+    return [
+        version["title"] for version in package.get("versions", [])[:3] if version.get("title")
+    ] or package.get("title_variants", [])
+
+
+def ensure_blog_package_shape(data: dict[str, Any] | None, inplace: bool = False) -> dict[str, Any]:
+    """
+    레거시 단일 버전 포맷을 포함해 블로그 패키지를 공통 스키마로 변환.
+    inplace=True면 복사 없이 data를 직접 고친다 (방금 파일에서 읽은 dict처럼 호출 측만 쓰는 경우).
+    """
+    package = (data if data is not None else {}) if inplace else copy.deepcopy(data or {})
     versions = package.get("versions")
 
     if not isinstance(versions, list) or not versions:
@@ -212,11 +230,11 @@ def ensure_blog_package_shape(data: dict[str, Any] | None) -> dict[str, Any]:
         "tags": primary["tags"],
         "meta_description": primary["meta_description"],
     }
-    package["title_variants"] = [
-        version["title"] for version in normalized_versions[:3] if version.get("title")
-    ] or package.get("title_variants", [])
+    package["title_variants"] = _title_variants(package)
     package["type"] = package.get("type", "blog")
-    package["source_bundle"] = _sanitize_source_bundle(package.get("source_bundle"))
+    if package.get("source_bundle_version") != SOURCE_BUNDLE_VERSION:
+        package["source_bundle"] = _sanitize_source_bundle(package.get("source_bundle"))
+        package["source_bundle_version"] = SOURCE_BUNDLE_VERSION
     package.setdefault("created_at", datetime.now().isoformat())
     return package
 
@@ -244,13 +262,41 @@ def build_blog_package(
     return ensure_blog_package_shape(package)
 
 
-def _write_markdown(path: Path, version: dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(f"# {version.get('title', '')}\n\n")
-        f.write(f"{version.get('content', '')}\n\n")
-        tags = version.get("tags", [])
-        if tags:
-            f.write(f"태그: {', '.join(tags)}\n")
+def _write_atomic(path: Path, text: str) -> None:
+    """같은 폴더의 임시 파일에 쓰고 os.replace로 교체."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _markdown_text(version: dict[str, Any]) -> str:
+    text = f"# {version.get('title', '')}\n\n{version.get('content', '')}\n\n"
+    tags = version.get("tags", [])
+    if tags:
+        text += f"태그: {', '.join(tags)}\n"
+    return text
+
+
+def _write_package_json(json_path: Path, package: dict[str, Any]) -> None:
+    _write_atomic(json_path, json.dumps(package, ensure_ascii=False, separators=(",", ":")))
+
+
+def _write_version_markdown(output_dir: Path, output_id: str, version: dict[str, Any], is_primary: bool) -> dict[str, Path]:
+    """버전 1개의 마크다운 ({output_id}_{version_type}.md, 첫 버전이면 {output_id}.md도)."""
+    paths: dict[str, Path] = {}
+    text = _markdown_text(version)
+    if is_primary:
+        paths["primary"] = output_dir / f"{output_id}.md"
+        _write_atomic(paths["primary"], text)
+    version_type = version.get("version_type", "primary")
+    paths[version_type] = output_dir / f"{output_id}_{version_type}.md"
+    _write_atomic(paths[version_type], text)
+    return paths
 
 
 def save_blog_package(package: dict[str, Any], output_dir: Path) -> tuple[Path, dict[str, Path]]:
@@ -262,31 +308,43 @@ def save_blog_package(package: dict[str, Any], output_dir: Path) -> tuple[Path,
     output_id = normalized["output_id"]
 
     json_path = output_dir / f"{output_id}.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(normalized, f, ensure_ascii=False, indent=2)
+    _write_package_json(json_path, normalized)
 
     markdown_paths: dict[str, Path] = {}
-    versions = normalized.get("versions", [])
-    if versions:
-        primary = versions[0]
-        primary_md = output_dir / f"{output_id}.md"
-        _write_markdown(primary_md, primary)
-        markdown_paths["primary"] = primary_md
-
-        for version in versions:
-            version_type = version.get("version_type", "primary")
-            md_path = output_dir / f"{output_id}_{version_type}.md"
-            _write_markdown(md_path, version)
-            markdown_paths[version_type] = md_path
+    for index, version in enumerate(normalized.get("versions", [])):
+        markdown_paths.update(_write_version_markdown(output_dir, output_id, version, is_primary=index == 0))
 
     return json_path, markdown_paths
 
 
+def blog_package_summary(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    목록 표시용 요약 (제목/버전 수/작성일). ensure_blog_package_shape와 같은 제목 규칙을 따르되
+    복사·본문 정리 없이 필요한 필드만 읽는다.
+    """
+    versions = data.get("versions")
+    if isinstance(versions, list) and versions:
+        title = ((versions[0] or {}).get("title") or "").strip()
+        version_count = len(versions)
+    else:
+        legacy_content = data.get("content", {})
+        has_legacy = isinstance(legacy_content, dict) and bool(legacy_content.get("title"))
+        title = (legacy_content.get("title") or "").strip() if has_legacy else ""
+        version_count = 1 if has_legacy else 0
+    return {
+        "title": title,
+        "client_id": data.get("client_id", ""),
+        "blog_dna_id": data.get("blog_dna_id", ""),
+        "version_count": version_count,
+        "created_at": data.get("created_at", ""),
+    }
+
+
 def load_blog_package(json_path: Path) -> dict[str, Any]:
     """JSON 파일을 읽고 공통 스키마로 반환."""
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
-    return ensure_blog_package_shape(data)
+    return ensure_blog_package_shape(data, inplace=True)
 
 
 def update_blog_package_version(
@@ -295,35 +353,42 @@ def update_blog_package_version(
     version_type: str,
     updated_fields: dict[str, Any],
 ) -> tuple[dict[str, Any], Path]:
-    """기존 블로그 패키지의 특정 버전을 갱신."""
-    json_path = Path(output_dir) / f"{output_id}.json"
+    """
+    기존 블로그 패키지의 특정 버전을 갱신.
+    바뀐 필드가 없으면 아무것도 쓰지 않고, 바뀌었으면 JSON과 해당 버전의 마크다운만 다시 쓴다.
+    """
+    output_dir = Path(output_dir)
+    json_path = output_dir / f"{output_id}.json"
     package = load_blog_package(json_path)
-    versions = package.get("versions", [])
-
-    target = None
-    for version in versions:
-        if version.get("version_type") == version_type:
-            target = version
-            break
+    versions = package["versions"]
 
-    if target is None:
-        target = normalize_blog_version({
+    index = next((i for i, version in enumerate(versions) if version.get("version_type") == version_type), None)
+    is_new = index is None
+    if is_new:
+        index = len(versions)
+        versions.append(normalize_blog_version({
             "version_type": version_type,
             "version_label": DEFAULT_VERSION_LABELS.get(version_type, version_type),
-        }, len(versions))
-        versions.append(target)
+        }, index))
+    target = versions[index]
 
-    target.update({
+    candidate = normalize_blog_version({
+        **target,
         "title": (updated_fields.get("title") or target.get("title") or "").strip(),
         "content": (updated_fields.get("content") or target.get("content") or "").strip(),
         "tags": updated_fields.get("tags", target.get("tags", [])),
         "meta_description": (updated_fields.get("meta_description") or target.get("meta_description") or "").strip(),
-        "is_edited": True,
-        "edited_at": datetime.now().isoformat(),
-    })
-
-    package["versions"] = [normalize_blog_version(version, index) for index, version in enumerate(versions)]
-    package["updated_at"] = datetime.now().isoformat()
-    package = ensure_blog_package_shape(package)
-    save_blog_package(package, output_dir)
+    }, index)
+    changed = [field for field in _EDITABLE_FIELDS if candidate[field] != target[field]]
+    if not changed and not is_new:
+        return package, json_path
+
+    now = datetime.now().isoformat()
+    candidate.update({"is_edited": True, "edited_at": now})
+    versions[index] = candidate
+    package["updated_at"] = now
+    package["title_variants"] = _title_variants(package)
+
+    _write_package_json(json_path, package)
+    _write_version_markdown(output_dir, output_id, candidate, is_primary=index == 0)
     return package, json_path
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+디스크 캐시 저장소 (SQLite).
+
+- key → JSON 값 저장, 전체 크기 상한을 넘으면 오래 안 쓴 항목부터 삭제 (LRU)
+- 네임스페이스별 hit/miss 카운터를 함께 기록
+- 여러 스레드/프로세스(웹 + CLI)가 같은 파일을 써도 되도록 호출마다 연결을 연다
+
+사용 예:
+  cache = get_cache("extract", max_bytes=200 * 1024 * 1024)
+  value = cache.get(key)          # 없으면 None
+  cache.set(key, {"text": ...})
+  cache.stats() -> {"hits", "misses", "entries", "bytes", "max_bytes"}
+  cache.incr("llm:calibrate:hits")  # 사용자 정의 카운터 (cache.counters(prefix)로 조회)
+  cache.prune(max_age_sec)        # 유지보수: 오래된 항목 삭제 + 크기 상한 정리 + WAL 축소
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+CACHE_DIR = Path(os.getenv("MCP_CACHE_DIR", str(Path.home() / "mcp-data" / "cache")))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key          TEXT PRIMARY KEY,
+    value        TEXT NOT NULL,
+    size         INTEGER NOT NULL,
+    created_at   REAL NOT NULL,
+    accessed_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at);
+
+CREATE TABLE IF NOT EXISTS counters (
+    name   TEXT PRIMARY KEY,
+    value  INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class DiskCache:
+    """SQLite 파일 1개 = 캐시 1개."""
+
+    def __init__(self, db_path: Path | str, max_bytes: int = 200 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.max_bytes = max(1, int(max_bytes))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def get(self, key: str) -> Any | None:
+        """값 조회 (hit이면 접근 시각 갱신)."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self._bump(conn, "misses")
+                    return None
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                self._bump(conn, "hits")
+            return json.loads(row[0])
+        except Exception as e:
+            print(f"[WARN] 캐시 조회 실패 ({self.db_path.name}): {e}")
+            return None
+
+    def set(self, key: str, value: Any):
+        """값 저장 후 크기 상한 초과분을 LRU로 정리."""
+        payload = json.dumps(value, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, size, now, now),
+                )
+                self._evict(conn)
+        except Exception as e:
+            print(f"[WARN] 캐시 저장 실패 ({self.db_path.name}): {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            removed += 1
+        if removed:
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES ('evictions', ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + ?",
+                (removed, removed),
+            )
+        return removed
+
+    def prune(self, max_age_sec: float | None = None) -> dict:
+        """
+        유지보수용: created_at이 max_age_sec보다 오래된 항목 삭제(None이면 생략),
+        크기 상한 초과분 LRU 삭제, WAL 파일 축소.
+        """
+        with self._connect() as conn:
+            expired = 0
+            if max_age_sec is not None:
+                expired = conn.execute(
+                    "DELETE FROM entries WHERE created_at < ?", (time.time() - max_age_sec,)
+                ).rowcount
+            evicted = self._evict(conn)
+        with self._connect() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return {"expired": expired, "evicted": evicted}
+
+    def incr(self, name: str, n: int = 1):
+        """사용자 정의 카운터 증가 (엔드포인트별 hit/miss 등)."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO counters (name, value) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + ?",
+                    (name, n, n),
+                )
+        except Exception as e:
+            print(f"[WARN] 캐시 카운터 갱신 실패 ({self.db_path.name}): {e}")
+
+    def counters(self, prefix: str = "") -> dict[str, int]:
+        with self._connect() as conn:
+            return dict(conn.execute(
+                "SELECT name, value FROM counters WHERE name >= ? AND name < ?",
+                (prefix, prefix + "\uffff"),
+            ).fetchall())
+
+    def items(self, prefix: str = "") -> list[tuple[str, Any]]:
+        """prefix로 시작하는 항목 전체 (정리 작업용, hit/miss에 반영하지 않음)."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, value FROM entries WHERE key >= ? AND key < ?",
+                (prefix, prefix + "\uffff"),
+            ).fetchall()
+        result = []
+        for key, value in rows:
+            try:
+                result.append((key, json.loads(value)))
+            except ValueError:
+                continue
+        return result
+
+    def delete(self, key: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM counters")
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+            entries, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_caches: dict[str, DiskCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name: str, max_bytes: int = 200 * 1024 * 1024, cache_dir: Path | str | None = None) -> DiskCache:
+    """이름별 캐시 싱글턴 ({CACHE_DIR}/{name}.sqlite3)."""
+    db_path = Path(cache_dir or CACHE_DIR) / f"{name}.sqlite3"
+    key = str(db_path.resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = DiskCache(db_path, max_bytes=max_bytes)
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+HTTP 응답 캐시 — 조건부 요청(ETag / Last-Modified) 기반.
+
+같은 참고 블로그 URL·보도자료 URL을 하루에도 수십 번 다시 받지 않도록 응답 본문을 SQLite에 저장하고,
+호스트별 신선도 기간 안이면 네트워크 없이 돌려준다. 기간이 지나면 If-None-Match / If-Modified-Since로
+재검증해 304면 저장본을 그대로 쓴다.
+
+- 저장소: {CACHE_DIR}/http.sqlite3 (cache_store와 같은 폴더), 크기 상한 초과 시 LRU 삭제
+- 신선도: HTTP_CACHE_FRESH_SEC (기본 600초), 호스트별 재정의 HTTP_CACHE_HOST_FRESH_SEC
+  ("blog.naver.com=3600,example.com=0" — 하위 도메인에도 적용, 0이면 매번 재검증)
+  서버의 Cache-Control 값보다 이 설정이 우선 (네이버처럼 no-cache를 보내는 사이트도 캐시)
+- 200 응답만 저장, HTTP_CACHE_MAX_ENTRY_MB보다 큰 본문은 저장하지 않음
+- 재검증 중 네트워크 오류가 나면 오래된 저장본이라도 돌려줌 (stale)
+- hit / revalidated / miss / stale / stored 카운터, 저장본 재사용 비율(reuse_ratio) → stats()
+- HTTP_CACHE_DISABLED=1: 캐시 없이 바로 요청 (max_bytes 상한은 그대로 적용)
+
+사용 예:
+  from http_cache import get_http_cache
+  resp = get_http_cache().get(url, session=session, headers=headers, timeout=20)
+  resp.raise_for_status(); resp.text; resp.content; resp.headers.get("Content-Type")
+  resp.cache_status      # "hit" | "revalidated" | "miss" | "stale" | "bypass"(HTTP_CACHE_DISABLED + max_bytes)
+  get_http_cache().get(url, max_bytes=N)   # 새로 받는 본문 상한 (넘으면 잘라서 반환, 저장 안 함)
+
+session에는 requests.Session, crawler_engine.CrawlerEngine 등 get(url, **kwargs)를 가진 객체를 넘긴다
+(미지정 시 requests.get). 200이 아닌 응답은 session이 돌려준 응답 객체를 그대로 반환한다.
+URL만으로 동작하므로 로컬 스텁 HTTP 서버로 오프라인 테스트 가능.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from cache_store import CACHE_DIR
+
+
+HTTP_CACHE_DISABLED = os.getenv("HTTP_CACHE_DISABLED", "0") == "1"
+HTTP_CACHE_FRESH_SEC = float(os.getenv("HTTP_CACHE_FRESH_SEC", "600"))
+HTTP_CACHE_MAX_BYTES = int(float(os.getenv("HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024)
+HTTP_CACHE_MAX_ENTRY_BYTES = int(float(os.getenv("HTTP_CACHE_MAX_ENTRY_MB", "10")) * 1024 * 1024)
+# 유지보수 정리: 이 기간 동안 재검증도 안 된 항목 삭제
+HTTP_CACHE_TTL_DAYS = float(os.getenv("HTTP_CACHE_TTL_DAYS", "14"))
+
+# 블로그 글은 거의 바뀌지 않으므로 기본값보다 길게
+DEFAULT_HOST_FRESH_SEC = {
+    "blog.naver.com": 3600.0,
+    "m.blog.naver.com": 3600.0,
+}
+
+# 저장하지 않는 응답 헤더 (세션/연결 관련)
+_SKIP_HEADERS = {"set-cookie", "connection", "keep-alive", "transfer-encoding", "content-encoding", "content-length"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url            TEXT PRIMARY KEY,
+    body           BLOB NOT NULL,
+    size           INTEGER NOT NULL,
+    headers        TEXT NOT NULL,
+    encoding       TEXT,
+    etag           TEXT,
+    last_modified  TEXT,
+    validated_at   REAL NOT NULL,
+    accessed_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+
+CREATE TABLE IF NOT EXISTS counters (
+    name   TEXT PRIMARY KEY,
+    value  INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def _parse_host_fresh(spec: str) -> dict[str, float]:
+    result = {}
+    for item in spec.split(","):
+        host, _, seconds = item.partition("=")
+        host = host.strip().lower()
+        if host and seconds.strip():
+            try:
+                result[host] = float(seconds)
+            except ValueError:
+                print(f"[WARN] HTTP_CACHE_HOST_FRESH_SEC 값 무시: {item.strip()}")
+    return result
+
+
+class _Headers(dict):
+    """대소문자 구분 없는 헤더 dict (키는 소문자로 저장)."""
+
+    def __init__(self, items=()):
+        super().__init__((str(k).lower(), v) for k, v in dict(items).items())
+
+    def __getitem__(self, key):
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key):
+        return super().__contains__(key.lower())
+
+    def get(self, key, default=None):
+        return super().get(key.lower(), default)
+
+
+class CachedResponse:
+    """requests.Response 중 호출부가 쓰는 부분만 흉내 낸 200 응답."""
+
+    status_code = 200
+    ok = True
+    truncated = False
+
+    def __init__(self, url: str, body: bytes, headers: dict, encoding: str | None, cache_status: str):
+        self.url = url
+        self.content = body
+        self.headers = _Headers(headers)
+        self.encoding = encoding or "utf-8"
+        self.cache_status = cache_status
+
+    @property
+    def text(self) -> str:
+        try:
+            return self.content.decode(self.encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+    def raise_for_status(self):
+        return None
+
+    def iter_content(self, chunk_size: int = 8192):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        return None
+
+
+class HttpCache:
+    """SQLite 파일 1개 = HTTP 캐시 1개 (호출마다 연결을 열어 여러 스레드/프로세스에서 공유)."""
+
+    def __init__(self, db_path: Path | str, max_bytes: int = HTTP_CACHE_MAX_BYTES,
+                 fresh_sec: float = HTTP_CACHE_FRESH_SEC, host_fresh_sec: dict[str, float] | None = None):
+        self.db_path = Path(db_path)
+        self.max_bytes = max(1, int(max_bytes))
+        self.fresh_sec = fresh_sec
+        self.host_fresh_sec = dict(DEFAULT_HOST_FRESH_SEC)
+        self.host_fresh_sec.update(_parse_host_fresh(os.getenv("HTTP_CACHE_HOST_FRESH_SEC", "")))
+        self.host_fresh_sec.update(host_fresh_sec or {})
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def fresh_for(self, url: str) -> float:
+        """URL 호스트의 신선도 기간(초). 가장 구체적인 도메인 설정 우선."""
+        host = (urlsplit(url).hostname or "").lower()
+        while host:
+            if host in self.host_fresh_sec:
+                return self.host_fresh_sec[host]
+            host = host.partition(".")[2]
+        return self.fresh_sec
+
+    # ──────────────────────────────────────────
+    # 조회 + 요청
+    # ──────────────────────────────────────────
+
+    def get(self, url: str, session=None, headers: dict | None = None, max_bytes: int | None = None,
+            **kwargs) -> Any:
+        """
+        캐시를 거친 GET. 신선하면 네트워크 없이, 오래됐으면 조건부 요청으로 재검증.
+        kwargs(timeout 등)는 session.get에 그대로 전달 (stream은 무시 — 본문을 모두 읽어 저장).
+        max_bytes: 새로 받는 본문을 이만큼만 읽고 연결을 닫음 (잘린 응답은 truncated=True, 저장하지 않음).
+        """
+        kwargs.pop("stream", None)
+        if max_bytes is not None:
+            kwargs["stream"] = True
+        if session is None:
+            import requests
+            session = requests
+        if HTTP_CACHE_DISABLED:
+            resp = session.get(url, headers=headers, **kwargs)
+            if max_bytes is None or resp.status_code != 200:
+                return resp
+            # 캐시를 꺼도 본문 상한은 그대로 적용
+            body, truncated = self._read_body(resp, max_bytes)
+            return self._fresh_response(url, resp, body, truncated, "bypass")
+
+        entry = self._load(url)
+        now = time.time()
+        if entry and now - entry["validated_at"] < self.fresh_for(url):
+            self._touch(url, "hits")
+            return self._response(url, entry, "hit")
+
+        request_headers = dict(headers or {})
+        if entry:
+            if entry["etag"]:
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            resp = session.get(url, headers=request_headers, **kwargs)
+        except Exception as e:
+            if entry is None:
+                raise
+            print(f"[WARN] HTTP 재검증 실패, 저장본 사용 ({url}): {e}")
+            self._touch(url, "stale")
+            return self._response(url, entry, "stale")
+
+        if entry and resp.status_code == 304:
+            self._revalidated(url, resp.headers, entry)
+            return self._response(url, entry, "revalidated")
+
+        self.incr("misses")
+        if resp.status_code != 200:
+            return resp
+        body, truncated = self._read_body(resp, max_bytes)
+        result = self._fresh_response(url, resp, body, truncated, "miss")
+        if not truncated and len(body) <= HTTP_CACHE_MAX_ENTRY_BYTES:
+            self._store(url, body, result.headers, result.encoding)
+        return result
+
+    @staticmethod
+    def _read_body(resp, max_bytes: int | None) -> tuple[bytes, bool]:
+        if max_bytes is None:
+            return resp.content, False
+        parts, size = [], 0
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            parts.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                resp.close()
+                return b"".join(parts)[:max_bytes], True
+        return b"".join(parts), False
+
+    @staticmethod
+    def _fresh_response(url: str, resp, body: bytes, truncated: bool, cache_status: str) -> CachedResponse:
+        encoding = resp.encoding or getattr(resp, "apparent_encoding", None)
+        headers = {k: v for k, v in resp.headers.items() if k.lower() not in _SKIP_HEADERS}
+        result = CachedResponse(url, body, headers, encoding, cache_status)
+        result.truncated = truncated
+        return result
+
+    def _response(self, url: str, entry: dict, cache_status: str) -> CachedResponse:
+        return CachedResponse(url, entry["body"], entry["headers"], entry["encoding"], cache_status)
+
+    # ──────────────────────────────────────────
+    # 저장소
+    # ──────────────────────────────────────────
+
+    def _load(self, url: str) -> dict | None:
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT body, headers, encoding, etag, last_modified, validated_at "
+                    "FROM responses WHERE url = ?", (url,)
+                ).fetchone()
+        except Exception as e:
+            print(f"[WARN] HTTP 캐시 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+        return {
+            "body": bytes(row[0]), "headers": json.loads(row[1]), "encoding": row[2],
+            "etag": row[3], "last_modified": row[4], "validated_at": row[5],
+        }
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str, n: int = 1):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + ?",
+            (name, n, n),
+        )
+
+    def incr(self, name: str, n: int = 1):
+        try:
+            with self._connect() as conn:
+                self._bump(conn, name, n)
+        except Exception as e:
+            print(f"[WARN] HTTP 캐시 카운터 갱신 실패: {e}")
+
+    def _touch(self, url: str, counter: str):
+        try:
+            with self._connect() as conn:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+                self._bump(conn, counter)
+        except Exception as e:
+            print(f"[WARN] HTTP 캐시 갱신 실패: {e}")
+
+    def _revalidated(self, url: str, headers, entry: dict):
+        """304: 저장본은 그대로, 새로 온 검증자/헤더만 반영하고 신선도 기간을 다시 시작."""
+        merged = dict(entry["headers"])
+        merged.update({k: v for k, v in headers.items() if k.lower() not in _SKIP_HEADERS})
+        entry["headers"] = merged
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "UPDATE responses SET headers = ?, etag = ?, last_modified = ?, validated_at = ?, accessed_at = ? "
+                    "WHERE url = ?",
+                    (json.dumps(merged, ensure_ascii=False),
+                     headers.get("ETag") or entry["etag"], headers.get("Last-Modified") or entry["last_modified"],
+                     now, now, url),
+                )
+                self._bump(conn, "revalidated")
+        except Exception as e:
+            print(f"[WARN] HTTP 캐시 갱신 실패: {e}")
+
+    def _store(self, url: str, body: bytes, headers: dict, encoding: str | None):
+        lowered = {k.lower(): v for k, v in headers.items()}
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(url, body, size, headers, encoding, etag, last_modified, validated_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (url, body, len(body), json.dumps(headers, ensure_ascii=False), encoding,
+                     lowered.get("etag"), lowered.get("last-modified"), now, now),
+                )
+                self._bump(conn, "stored")
+                self._evict(conn)
+        except Exception as e:
+            print(f"[WARN] HTTP 캐시 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        for url, size in conn.execute("SELECT url, size FROM responses ORDER BY accessed_at ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            removed += 1
+        if removed:
+            self._bump(conn, "evictions", removed)
+        return removed
+
+    def prune(self, max_age_sec: float | None = HTTP_CACHE_TTL_DAYS * 86400) -> dict:
+        """유지보수용: 오래 재검증되지 않은 항목 삭제 + 크기 상한 정리 + WAL 축소."""
+        with self._connect() as conn:
+            expired = 0
+            if max_age_sec is not None:
+                expired = conn.execute(
+                    "DELETE FROM responses WHERE validated_at < ?", (time.time() - max_age_sec,)
+                ).rowcount
+            evicted = self._evict(conn)
+        with self._connect() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return {"expired": expired, "evicted": evicted}
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+            conn.execute("DELETE FROM counters")
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+            entries, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        requests_total = sum(counters.get(k, 0) for k in ("hits", "revalidated", "misses", "stale"))
+        return {
+            "hits": counters.get("hits", 0),
+            "revalidated": counters.get("revalidated", 0),
+            "misses": counters.get("misses", 0),
+            "stale": counters.get("stale", 0),
+            "stored": counters.get("stored", 0),
+            "evictions": counters.get("evictions", 0),
+            "reuse_ratio": round(
+                (counters.get("hits", 0) + counters.get("revalidated", 0)) / requests_total, 3
+            ) if requests_total else None,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "disabled": HTTP_CACHE_DISABLED,
+        }
+
+
+_caches: dict[str, HttpCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(cache_dir: Path | str | None = None) -> HttpCache:
+    """캐시 폴더별 싱글턴 ({CACHE_DIR}/http.sqlite3)."""
+    db_path = Path(cache_dir or CACHE_DIR) / "http.sqlite3"
+    key = str(db_path.resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = HttpCache(db_path)
+            _caches[key] = cache
+        return cache
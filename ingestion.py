@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+첨부 자료 병렬 수집(ingestion) 단계.
+
+- 파일별 텍스트 추출(PDF/HWP/OCR 등 CPU 작업)은 프로세스 풀에서 실행
+  PDF는 캐시 확인만 여기서 하고 페이지 구간 단위로 같은 풀에 보냄 (큰 PDF 1개도 여러 프로세스가 나눠 처리)
+- Gemini 업로드/이미지 추출처럼 I/O가 대부분인 작업은 스레드 풀에서 실행
+- 결과는 입력 순서를 그대로 유지하고, 파일별 소요 시간을 함께 기록
+- on_pdf_page(파일 순번, 페이지 텍스트)를 주면 PDF 페이지가 추출되는 대로 호출 (파일마다 한 스레드에서 순서대로)
+
+사용 예:
+  results = ingest_files(
+      [{"name": "보도자료.pdf", "path": "/tmp/x.pdf"}],
+      upload=lambda p: upload_to_gemini(p, client),
+      should_upload=lambda p: p.suffix.lower() in {".pdf", ".jpg"},
+      extract_images=extract_images_from_file,
+  )
+  sources = [r for r in results if r["text"] is not None]
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from utils import extract_text_cached
+
+
+# 0이면 프로세스 풀 없이 스레드에서 추출
+INGEST_PROCESSES = int(os.getenv("INGEST_PROCESSES", str(min(4, os.cpu_count() or 1))))
+INGEST_THREADS = int(os.getenv("INGEST_THREADS", "8"))
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor | None:
+    global _process_pool
+    if INGEST_PROCESSES <= 0:
+        return None
+    with _process_pool_lock:
+        if _process_pool is None:
+            try:
+                # fork는 스케줄러/SQLite 스레드가 도는 서버 프로세스를 복제해 잠금 상태까지 물려받으므로 spawn 고정
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=INGEST_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+                )
+            except Exception as e:
+                print(f"[WARN] 추출 프로세스 풀 생성 실패, 스레드로 처리: {e}")
+                return None
+        return _process_pool
+
+
+def _reset_process_pool():
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _extract_worker(path: str) -> dict:
+    """프로세스 풀 워커 (피클 가능한 모듈 함수여야 함)."""
+    return extract_text_cached(Path(path))
+
+
+def extract_text_parallel(path: Path, on_pdf_page: Callable[[str], None] | None = None) -> dict:
+    """
+    프로세스 풀에서 텍스트 추출. 풀을 쓸 수 없으면 현재 스레드에서 실행.
+    PDF는 이 스레드에서 페이지 구간을 풀에 나눠 보내므로 on_pdf_page도 이 스레드에서 호출된다.
+    """
+    pool = _get_process_pool()
+    if pool is not None:
+        try:
+            if Path(path).suffix.lower() == ".pdf":
+                return extract_text_cached(Path(path), pdf_executor=pool, on_pdf_page=on_pdf_page)
+            return pool.submit(_extract_worker, str(path)).result()
+        except BrokenProcessPool as e:
+            print(f"[WARN] 추출 프로세스 풀 중단, 스레드로 재시도: {e}")
+            _reset_process_pool()
+    return extract_text_cached(Path(path), on_pdf_page=on_pdf_page)
+
+
+def _timed(timings: dict, spans: list, key: str, func: Callable, *args) -> Any:
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        finished = time.perf_counter()
+        timings[key] = round(finished - started, 3)
+        spans.append((started, finished))
+
+
+def _ingest_one(item: dict, upload, should_upload, timings: dict, spans: list, on_pdf_page=None) -> dict:
+    path = Path(item["path"])
+    result = {
+        "name": item.get("name") or path.name,
+        "path": str(path),
+        "kind": path.suffix.lower().lstrip(".") or "file",
+        "text": None,
+        "warnings": [],
+        "cached": False,
+        "uploaded": None,
+        "error": "",
+        "timings": timings,
+    }
+
+    if upload and (should_upload is None or should_upload(path)):
+        try:
+            result["uploaded"] = _timed(timings, spans, "upload_sec", upload, path)
+        except Exception as e:
+            result["warnings"].append(f"업로드 실패: {e}")
+        if result["uploaded"]:
+            return result
+        # 업로드 실패 시 텍스트 추출로 폴백
+
+    try:
+        extracted = _timed(timings, spans, "extract_sec", extract_text_parallel, path, on_pdf_page)
+        result["text"] = extracted["text"]
+        result["warnings"].extend(extracted["warnings"])
+        result["cached"] = extracted["cached"]
+    except Exception as e:
+        result["error"] = str(e)
+        print(f"[WARN] 텍스트 추출 실패 ({result['name']}): {e}")
+    return result
+
+
+def ingest_files(
+    files: list[dict],
+    upload: Callable[[Path], Any] | None = None,
+    should_upload: Callable[[Path], bool] | None = None,
+    extract_images: Callable[[Path], list] | None = None,
+    on_pdf_page: Callable[[int, str], None] | None = None,
+) -> list[dict]:
+    """
+    파일 목록을 병렬 처리. files: [{"name", "path"}, ...]
+
+    파일마다:
+      - should_upload(path)가 참이면 upload(path) (실패 시 텍스트 추출로 폴백)
+      - 아니면 텍스트 추출 (프로세스 풀)
+      - extract_images 지정 시 이미지 추출을 별도 스레드 작업으로 동시에 실행
+      - on_pdf_page 지정 시 PDF 페이지마다 on_pdf_page(파일 순번, 텍스트) (캐시 hit/업로드면 호출 안 됨)
+
+    Returns:
+        입력 순서 그대로의 결과 목록
+        [{"name", "path", "kind", "text", "warnings", "cached", "uploaded",
+          "images", "error", "timings": {"upload_sec", "extract_sec", "images_sec", "total_sec"}}]
+    """
+    if not files:
+        return []
+
+    started = time.perf_counter()
+    workers = max(1, min(INGEST_THREADS, len(files) * (2 if extract_images else 1)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as pool:
+        jobs = []
+        for index, item in enumerate(files):
+            timings: dict = {}
+            spans: list = []
+            page_callback = partial(on_pdf_page, index) if on_pdf_page else None
+            main = pool.submit(_ingest_one, item, upload, should_upload, timings, spans, page_callback)
+            images = (
+                pool.submit(_timed, timings, spans, "images_sec", extract_images, Path(item["path"]))
+                if extract_images else None
+            )
+            jobs.append((main, images, spans))
+
+        results = []
+        for main, images, spans in jobs:
+            result = main.result()
+            result["images"] = []
+            if images is not None:
+                try:
+                    result["images"] = images.result() or []
+                except Exception as e:
+                    result["warnings"].append(f"이미지 추출 실패: {e}")
+            # 업로드/추출과 이미지 추출은 동시에 돌므로 합이 아니라 첫 시작~마지막 종료 (파일별 wall time)
+            result["timings"]["total_sec"] = round(
+                max(end for _, end in spans) - min(start for start, _ in spans), 3
+            ) if spans else 0.0
+            results.append(result)
+
+    elapsed = time.perf_counter() - started
+    print(f"[OK] 자료 수집: {len(files)}개 파일 {elapsed:.2f}초 "
+          f"(파일별 합계 {sum(r['timings']['total_sec'] for r in results):.2f}초)")
+    return results
+
+
+def timing_report(results: list[dict]) -> list[dict]:
+    """응답에 실을 파일별 소요 시간 요약."""
+    return [
+        {
+            "name": r["name"],
+            "kind": r["kind"],
+            "mode": "upload" if r.get("uploaded") else ("text" if r.get("text") is not None else "failed"),
+            "cached": r.get("cached", False),
+            "timings": r["timings"],
+        }
+        for r in results
+    ]
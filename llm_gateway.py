@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Gemini 호출 게이트웨이 — 공유 클라이언트 + 응답 캐시.
+
+공유 클라이언트:
+- get_client()는 API 키별 genai.Client 하나를 프로세스 전체에서 재사용 (요청마다 생성/TLS 핸드셰이크 없음)
+- 내부 httpx 연결 풀 크기/keep-alive는 GEMINI_MAX_CONNECTIONS, GEMINI_KEEPALIVE_SEC로 조정
+- GEMINI_API_KEY가 바뀌면 다음 호출에서 새 클라이언트로 교체
+- client_health()로 연결 상태 확인 (실패 시 클라이언트를 버리고 다음 호출에서 재생성)
+
+응답 캐시:
+같은 모델 + 같은 프롬프트(정규화) + 같은 첨부 파일 + 같은 생성 설정으로 다시 호출하면
+API를 부르지 않고 저장된 응답 텍스트를 돌려준다 (재클릭, UI 오류 후 재시도, 변경 없는 블로그 재분석 등).
+
+- 저장소: cache_store (SQLite, {CACHE_DIR}/llm.sqlite3), 크기 상한 초과 시 LRU 삭제
+- TTL: LLM_CACHE_TTL_HOURS (기본 72시간) 지나면 miss 처리
+- bypass=True: 캐시를 읽지 않고 새로 호출한 뒤 결과로 캐시를 갱신
+- LLM_CACHE_DISABLED=1: 캐시 전체 비활성화
+- 엔드포인트별 hit/miss/bypass 카운터 → stats()
+
+사용 예:
+  from llm_gateway import get_client, generate as llm_generate
+  client = get_client()          # 키가 없으면 None
+  response = llm_generate(client, model="gemini-2.0-flash", contents=prompt, endpoint="calibrate_blog")
+  response.text          # 캐시 hit이면 CachedResponse (text, cached=True)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from typing import Any
+
+from cache_store import get_cache
+
+
+LLM_CACHE_TTL_HOURS = float(os.getenv("LLM_CACHE_TTL_HOURS", "72"))
+LLM_CACHE_MAX_BYTES = int(float(os.getenv("LLM_CACHE_MAX_MB", "100")) * 1024 * 1024)
+LLM_CACHE_DISABLED = os.getenv("LLM_CACHE_DISABLED", "0") == "1"
+
+GEMINI_MAX_CONNECTIONS = int(os.getenv("GEMINI_MAX_CONNECTIONS", "20"))
+GEMINI_KEEPALIVE_SEC = float(os.getenv("GEMINI_KEEPALIVE_SEC", "120"))
+HEALTH_CHECK_INTERVAL_SEC = 300
+HEALTH_CHECK_MODEL = "gemini-2.0-flash"
+
+# 키 형식이 바뀌면 올려서 이전 항목을 무효화
+KEY_VERSION = "1"
+_COUNTER_PREFIX = "endpoint:"
+
+
+class CachedResponse:
+    """캐시 hit 응답. generate_content 응답 중 .text만 쓰는 호출부와 호환."""
+
+    cached = True
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _Uncacheable(Exception):
+    """키로 만들 수 없는 입력 (캐시 없이 바로 호출)."""
+
+
+def _cache():
+    return get_cache("llm", max_bytes=LLM_CACHE_MAX_BYTES)
+
+
+# ──────────────────────────────────────────
+# 공유 클라이언트
+# ──────────────────────────────────────────
+
+_clients: dict[str, Any] = {}
+_default_fingerprint = ""
+_clients_lock = threading.Lock()
+_health: dict[str, dict] = {}
+
+
+def _fingerprint(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+def _build_client(api_key: str):
+    from google import genai
+    try:
+        import httpx
+        from google.genai import types as _gtypes
+        limits = httpx.Limits(
+            max_connections=GEMINI_MAX_CONNECTIONS,
+            max_keepalive_connections=GEMINI_MAX_CONNECTIONS,
+            keepalive_expiry=GEMINI_KEEPALIVE_SEC,
+        )
+        return genai.Client(api_key=api_key, http_options=_gtypes.HttpOptions(client_args={"limits": limits}))
+    except (ImportError, TypeError, ValueError) as e:
+        # 구버전 SDK는 client_args 미지원 → 기본 설정 (클라이언트 재사용만으로도 연결은 유지됨)
+        print(f"[INFO] Gemini 연결 풀 설정 생략: {e}")
+        return genai.Client(api_key=api_key)
+
+
+def _close_client(client):
+    close = getattr(client, "close", None) or getattr(getattr(client, "_api_client", None), "close", None)
+    if close:
+        try:
+            close()
+        except Exception:
+            pass
+
+
+def get_client(api_key: str | None = None):
+    """
+    API 키별 genai.Client 싱글턴 (키 미지정 시 GEMINI_API_KEY). 키가 없으면 None.
+    환경변수 키가 바뀌면 이전 기본 클라이언트를 닫고 새로 만든다.
+    """
+    use_env = api_key is None
+    api_key = (os.getenv("GEMINI_API_KEY", "") if use_env else api_key).strip()
+    if not api_key:
+        return None
+
+    global _default_fingerprint
+    fp = _fingerprint(api_key)
+    with _clients_lock:
+        client = _clients.get(fp)
+        if client is None:
+            client = _build_client(api_key)
+            _clients[fp] = client
+            print(f"[OK] Gemini 클라이언트 생성 (key {fp[:6]}…)")
+        if use_env and _default_fingerprint != fp:
+            stale = _clients.pop(_default_fingerprint, None) if _default_fingerprint else None
+            if stale is not None:
+                _close_client(stale)
+                _health.pop(_default_fingerprint, None)
+                print("[OK] GEMINI_API_KEY 변경 → Gemini 클라이언트 교체")
+            _default_fingerprint = fp
+        return client
+
+
+def reset_client(api_key: str | None = None):
+    """해당 키의 공유 클라이언트를 닫고 제거 (다음 get_client에서 재생성)."""
+    api_key = (os.getenv("GEMINI_API_KEY", "") if api_key is None else api_key).strip()
+    if not api_key:
+        return
+    fp = _fingerprint(api_key)
+    with _clients_lock:
+        client = _clients.pop(fp, None)
+        _health.pop(fp, None)
+    if client is not None:
+        _close_client(client)
+
+
+def client_health(force: bool = False) -> dict:
+    """
+    기본 클라이언트로 가벼운 메타데이터 호출(models.get)을 보내 상태 확인.
+    결과는 HEALTH_CHECK_INTERVAL_SEC 동안 재사용하고, 실패하면 클라이언트를 재생성 대상으로 돌린다.
+    """
+    client = get_client()
+    if client is None:
+        return {"ok": False, "error": "GEMINI_API_KEY가 설정되지 않았습니다."}
+    fp = _default_fingerprint
+    cached = _health.get(fp)
+    if cached and not force and time.time() - cached["checked_at"] < HEALTH_CHECK_INTERVAL_SEC:
+        return cached
+
+    started = time.perf_counter()
+    try:
+        client.models.get(model=HEALTH_CHECK_MODEL)
+        result = {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000)}
+    except Exception as e:
+        result = {"ok": False, "error": str(e)[:200]}
+        reset_client()
+    result["checked_at"] = time.time()
+    _health[fp] = result
+    return result
+
+
+# ──────────────────────────────────────────
+# 캐시 키
+# ──────────────────────────────────────────
+
+def _normalize_text(text: str) -> str:
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).strip()
+
+
+def _normalize(value: Any) -> Any:
+    """contents/config를 JSON 직렬화 가능한 안정적인 형태로 변환."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return _normalize_text(value)
+    if isinstance(value, (bytes, bytearray)):
+        return {"bytes": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    # Gemini File API 업로드 파일 — 내용 해시(없으면 리소스 이름)로 식별
+    if hasattr(value, "uri") and hasattr(value, "mime_type") and hasattr(value, "name"):
+        return {"file": getattr(value, "sha256_hash", None) or value.name, "mime": value.mime_type}
+    # PIL 이미지
+    if hasattr(value, "tobytes") and hasattr(value, "size") and hasattr(value, "mode"):
+        return {"image": hashlib.sha256(value.tobytes()).hexdigest(),
+                "size": list(value.size), "mode": value.mode}
+    # google.genai types (Part, GenerateContentConfig 등 pydantic 모델)
+    if hasattr(value, "model_dump"):
+        return _normalize(value.model_dump(mode="json", exclude_none=True))
+    raise _Uncacheable(type(value).__name__)
+
+
+def cache_key(model: str, contents: Any, config: Any = None) -> str:
+    payload = json.dumps(
+        {"v": KEY_VERSION, "model": model, "contents": _normalize(contents), "config": _normalize(config)},
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ──────────────────────────────────────────
+# 호출
+# ──────────────────────────────────────────
+
+def generate(client, model: str, contents: Any, config: Any = None, *,
+             endpoint: str = "default", bypass: bool = False, ttl_hours: float | None = None):
+    """
+    client.models.generate_content 대체. 캐시 hit이면 CachedResponse, 아니면 원래 응답 객체.
+    예외는 그대로 전달하고, 빈 응답/예외는 캐시하지 않는다.
+    """
+    kwargs = {"model": model, "contents": contents}
+    if config is not None:
+        kwargs["config"] = config
+    if LLM_CACHE_DISABLED:
+        return client.models.generate_content(**kwargs)
+
+    try:
+        key = cache_key(model, contents, config)
+    except _Uncacheable as e:
+        print(f"[INFO] LLM 캐시 제외 ({endpoint}): {e}")
+        return client.models.generate_content(**kwargs)
+
+    cache = _cache()
+    counter = f"{_COUNTER_PREFIX}{endpoint}:"
+    ttl = (LLM_CACHE_TTL_HOURS if ttl_hours is None else ttl_hours) * 3600
+
+    if bypass:
+        cache.incr(counter + "bypassed")
+    else:
+        entry = cache.get(key)
+        if entry and time.time() - entry.get("created_at", 0) < ttl:
+            cache.incr(counter + "hits")
+            print(f"[OK] LLM 캐시 hit: {endpoint}")
+            return CachedResponse(entry["text"])
+        if entry:
+            cache.delete(key)
+        cache.incr(counter + "misses")
+
+    response = client.models.generate_content(**kwargs)
+    try:
+        text = response.text
+    except Exception:
+        text = None
+    if text:
+        cache.set(key, {"text": text, "model": model, "endpoint": endpoint, "created_at": time.time()})
+    return response
+
+
+def stats() -> dict:
+    """엔드포인트별 hit/miss/bypass 집계 + 캐시 크기."""
+    cache = _cache()
+    endpoints: dict[str, dict] = {}
+    for name, value in cache.counters(_COUNTER_PREFIX).items():
+        endpoint, _, kind = name[len(_COUNTER_PREFIX):].rpartition(":")
+        entry = endpoints.setdefault(endpoint, {"hits": 0, "misses": 0, "bypassed": 0})
+        entry[kind] = value
+    for entry in endpoints.values():
+        lookups = entry["hits"] + entry["misses"]
+        entry["hit_rate"] = round(entry["hits"] / lookups, 3) if lookups else 0.0
+    info = cache.stats()
+    return {
+        "enabled": not LLM_CACHE_DISABLED,
+        "ttl_hours": LLM_CACHE_TTL_HOURS,
+        "entries": info["entries"],
+        "bytes": info["bytes"],
+        "max_bytes": info["max_bytes"],
+        "evictions": info["evictions"],
+        "endpoints": endpoints,
+    }
+
+
+def prune() -> dict:
+    """TTL이 지난 응답 삭제 (유지보수 스케줄러에서 호출)."""
+    return _cache().prune(LLM_CACHE_TTL_HOURS * 3600)
+
+
+def clear():
+    _cache().clear()
@@ -4,6 +4,8 @@
 
 - 여러 파일의 텍스트를 하나의 브리프(source bundle)로 통합
 - 긴 원문을 프롬프트 친화적인 핵심 요약으로 압축
+- LineScanner: 줄 분리/필터/점수 계산을 한 번만 하고, 텍스트를 조각(페이지) 단위로 받을 수 있음
+  (build_material_bundle_from_paths는 PDF 페이지가 추출되는 대로 받아 마지막 페이지 전에 점수 계산 시작)
 """
 
 from __future__ import annotations
@@ -13,7 +15,8 @@ from collections import Counter
 from pathlib import Path
 from typing import Iterable
 
-from utils import extract_text_from_file, is_meaningful_text_line, sanitize_text_for_display
+from ingestion import ingest_files, timing_report
+from utils import is_meaningful_text_line, sanitize_text_for_display
 
 
 IMPORTANT_KEYWORDS = [
@@ -69,31 +72,48 @@ def _dedupe_lines(lines: Iterable[str]) -> list[str]:
     return result
 
 
-def _extract_key_lines(text: str, limit: int = 12) -> list[str]:
-    scored = sorted(
-        _extract_lines(text),
-        key=lambda line: (_line_score(line), len(line)),
-        reverse=True,
-    )
-    return _dedupe_lines(scored)[:limit]
+_CONTACT_PATTERN = re.compile(r"문의|연락처|전화|상담|홈페이지|접수|신청", re.IGNORECASE)
+_DATE_PATTERN = re.compile(r"\d{4}|\d{1,2}[./월-]\d{1,2}|까지|예정|오전|오후")
 
 
-def _extract_contact_lines(text: str) -> list[str]:
-    lines = _extract_lines(text)
-    picks = [
-        line for line in lines
-        if re.search(r"문의|연락처|전화|상담|홈페이지|접수|신청", line, re.IGNORECASE)
-    ]
-    return _dedupe_lines(picks)[:5]
+class LineScanner:
+    """
+    텍스트를 받는 대로 의미 있는 줄로 나누고 점수를 매겨 둔다.
+    핵심/문의/일정 줄은 전체 텍스트를 세 번 다시 나누지 않고 모아 둔 줄에서 뽑는다.
 
+      scanner = LineScanner()
+      for page_text in iter_pdf_pages(path):
+          scanner.feed(page_text)
+      scanner.key_lines(), scanner.contact_lines(), scanner.date_lines()
 
-def _extract_date_lines(text: str) -> list[str]:
-    lines = _extract_lines(text)
-    picks = [
-        line for line in lines
-        if re.search(r"\d{4}|\d{1,2}[./월-]\d{1,2}|까지|예정|오전|오후", line)
-    ]
-    return _dedupe_lines(picks)[:6]
+    줄 단위로만 처리하므로 조각으로 나눠 넣어도 합친 텍스트를 한 번에 넣은 것과 결과가 같다.
+    """
+
+    def __init__(self):
+        self.lines: list[str] = []
+        self._scores: list[tuple[int, int]] = []
+
+    def feed(self, text: str) -> "LineScanner":
+        for line in _extract_lines(text):
+            self.lines.append(line)
+            self._scores.append((_line_score(line), len(line)))
+        return self
+
+    def extend(self, other: "LineScanner") -> "LineScanner":
+        """다른 스캐너가 모아 둔 줄(미리 점수 계산됨)을 뒤에 이어 붙임."""
+        self.lines.extend(other.lines)
+        self._scores.extend(other._scores)
+        return self
+
+    def key_lines(self, limit: int = 12) -> list[str]:
+        order = sorted(range(len(self.lines)), key=self._scores.__getitem__, reverse=True)
+        return _dedupe_lines(self.lines[i] for i in order)[:limit]
+
+    def contact_lines(self) -> list[str]:
+        return _dedupe_lines(line for line in self.lines if _CONTACT_PATTERN.search(line))[:5]
+
+    def date_lines(self) -> list[str]:
+        return _dedupe_lines(line for line in self.lines if _DATE_PATTERN.search(line))[:6]
 
 
 def _extract_tag_candidates(text: str) -> list[str]:
@@ -127,11 +147,16 @@ def build_material_bundle(
     direct_text: str = "",
     max_excerpt_chars: int = 7000,
 ) -> dict:
-    """여러 자료를 블로그 작성용 브리프 구조로 통합."""
+    """
+    여러 자료를 블로그 작성용 브리프 구조로 통합.
+    source에 "scanner"(그 자료의 텍스트를 이미 넣은 LineScanner)가 있으면 줄을 다시 나누지 않고 그대로 사용.
+    """
     material_sources = []
     warnings = []
 
     for source in sources or []:
+        for warning in source.get("warnings") or []:
+            warnings.append(f"{source.get('name', '자료')}: {warning}")
         text = _normalize_text(source.get("text", ""))
         if not text:
             warnings.append(f"텍스트 추출 실패: {source.get('name', '이름 없는 자료')}")
@@ -141,6 +166,7 @@ def build_material_bundle(
             "kind": source.get("kind", "file"),
             "text": text,
             "char_count": len(text),
+            "scanner": source.get("scanner"),
         })
 
     if direct_text.strip():
@@ -150,6 +176,7 @@ def build_material_bundle(
             "kind": "text",
             "text": normalized,
             "char_count": len(normalized),
+            "scanner": None,
         })
 
     combined_text = "\n\n".join(
@@ -157,9 +184,17 @@ def build_material_bundle(
         for item in material_sources
     ).strip()
 
-    fact_lines = _extract_key_lines(combined_text)
-    contact_lines = _extract_contact_lines(combined_text)
-    date_lines = _extract_date_lines(combined_text)
+    # combined_text를 통째로 넣은 것과 같은 순서로 자료별 머리줄 + 본문 줄
+    scanner = LineScanner()
+    for item in material_sources:
+        scanner.feed(f"===== {item['name']} =====")
+        if item["scanner"] is not None:
+            scanner.extend(item["scanner"])
+        else:
+            scanner.feed(item["text"])
+    fact_lines = scanner.key_lines()
+    contact_lines = scanner.contact_lines()
+    date_lines = scanner.date_lines()
     tag_candidates = _extract_tag_candidates(combined_text)
     topic = infer_topic(combined_text)
     excerpt = combined_text[:max_excerpt_chars].strip()
@@ -210,13 +245,34 @@ def build_material_bundle(
 
 
 def build_material_bundle_from_paths(file_paths: Iterable[Path], direct_text: str = "") -> dict:
-    """파일 경로 목록으로부터 자료 번들 생성."""
+    """
+    파일 경로 목록으로부터 자료 번들 생성 (파일별 추출은 병렬, 순서는 입력 순서 유지).
+    PDF는 페이지가 추출되는 대로 줄 점수를 계산해 둔다 (나머지 페이지는 프로세스 풀에서 계속 추출 중).
+    캐시 hit·OCR 폴백처럼 최종 텍스트가 받은 페이지와 다르면 그 자료만 최종 텍스트로 다시 계산.
+    """
+    file_paths = [Path(p) for p in file_paths]
+    scanners = [LineScanner() for _ in file_paths]
+    pages: list[list[str]] = [[] for _ in file_paths]
+
+    def _on_page(index: int, text: str):
+        # 파일마다 ingest 스레드 하나에서만 순서대로 호출되므로 잠금 불필요
+        pages[index].append(text)
+        scanners[index].feed(text)
+
+    results = ingest_files([{"name": p.name, "path": str(p)} for p in file_paths], on_pdf_page=_on_page)
     sources = []
-    for file_path in file_paths:
-        path = Path(file_path)
+    for index, item in enumerate(results):
+        if item["error"]:
+            raise ValueError(item["error"])
+        text = item["text"] or ""
+        streamed = bool(pages[index]) and "\n".join(pages[index]).strip() == text
         sources.append({
-            "name": path.name,
-            "kind": path.suffix.lower().lstrip(".") or "file",
-            "text": extract_text_from_file(path),
+            "name": item["name"],
+            "kind": item["kind"],
+            "text": text,
+            "warnings": item["warnings"],
+            "scanner": scanners[index] if streamed else None,
         })
-    return build_material_bundle(sources=sources, direct_text=direct_text)
+    bundle = build_material_bundle(sources=sources, direct_text=direct_text)
+    bundle["ingest_timings"] = timing_report(results)
+    return bundle
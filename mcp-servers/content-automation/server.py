@@ -21,6 +21,7 @@ if str(PROJECT_ROOT) not in sys.path:
 from blog_storage import build_blog_package, save_blog_package
 from material_pipeline import build_material_bundle
 from offline_engines import generate_single_blog_offline
+from llm_gateway import generate as llm_generate
 
 
 def extract_json_from_response(text: str) -> dict:
@@ -62,7 +63,8 @@ else:
 def generate_blog_post(
     client_id: str,
     press_release: str,
-    target_keywords: list[str] = None
+    target_keywords: list[str] = None,
+    no_cache: bool = False
 ) -> dict:
     """
     블로그 글 자동 생성 (페르소나 기반)
@@ -71,6 +73,7 @@ def generate_blog_post(
         client_id: 광고주 ID
         press_release: 보도자료 원문
         target_keywords: SEO 키워드 (선택)
+        no_cache: True면 같은 입력의 이전 응답을 재사용하지 않고 새로 생성
     
     Returns:
         생성된 블로그 글
@@ -121,9 +124,12 @@ JSON으로 반환:
         if not client:
             raise ValueError("Gemini API가 구성되지 않았습니다.")
 
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model='gemini-2.0-flash',
-            contents=blog_prompt
+            contents=blog_prompt,
+            endpoint="mcp_generate_blog_post",
+            bypass=no_cache,
         )
         blog_content = extract_json_from_response(response.text)
         generation_mode = "ai"
@@ -173,7 +179,8 @@ JSON으로 반환:
 def generate_cardnews_script(
     client_id: str,
     press_release: str,
-    slide_count: int = 6
+    slide_count: int = 6,
+    no_cache: bool = False
 ) -> dict:
     """
     카드뉴스 스크립트 생성 (텍스트만)
@@ -182,6 +189,7 @@ def generate_cardnews_script(
         client_id: 광고주 ID
         press_release: 보도자료
         slide_count: 슬라이드 개수
+        no_cache: True면 같은 입력의 이전 응답을 재사용하지 않고 새로 생성
     
     Returns:
         슬라이드별 텍스트 스크립트
@@ -244,9 +252,12 @@ JSON으로:
         if not client:
             raise ValueError("Gemini API가 구성되지 않았습니다.")
             
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model='gemini-2.0-flash',
-            contents=script_prompt
+            contents=script_prompt,
+            endpoint="mcp_generate_cardnews_script",
+            bypass=no_cache,
         )
         script = extract_json_from_response(response.text)
 
@@ -15,6 +15,13 @@ from pathlib import Path
 from PIL import Image
 from collections import Counter
 from dotenv import load_dotenv
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from llm_gateway import generate as llm_generate
 
 
 def extract_json_from_response(text: str) -> dict:
@@ -207,9 +214,11 @@ def analyze_images_with_gemini(
             
         full_content = [prompt] + image_contents
         
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model='gemini-2.0-flash',
-            contents=full_content
+            contents=full_content,
+            endpoint="mcp_extract_visual_persona",
         )
         visual_dna = extract_json_from_response(response.text)
         
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+PDF 텍스트 추출 서비스.
+
+업로드 파일(경로)과 URL로 받은 PDF(bytes / 파일 객체)가 같은 경로를 탄다.
+- PyMuPDF(fitz)로 연다 — bytes/스트림은 메모리에서 바로 (임시 파일 없음)
+- fitz가 못 여는 파일은 전체를, 못 읽은 페이지는 그 페이지만 pdfplumber로 (bytes는 BytesIO로)
+- 페이지/글자 예산: max_pages, max_chars (글자 예산이 차면 남은 페이지는 읽지 않음)
+- executor(프로세스 풀)를 주면 큰 문서는 페이지 구간을 워커에 나눠 추출 (경로만 — bytes는 워커마다 피클되므로 현재 프로세스에서)
+- iter_pdf_pages / on_page로 앞 페이지부터 스트리밍 (material_pipeline이 마지막 페이지 전에 줄 점수 계산 시작)
+- 텍스트 레이어가 거의 없으면(OCR_MIN_CHARS 미만) OCR 폴백 — RapidOCR 병렬(메모리 렌더링),
+  없으면 페이지 PNG → Windows OCR/Tesseract
+
+사용 예:
+  from pdf_extract import extract_pdf_text
+  text = extract_pdf_text(path, warnings=warnings)                      # 업로드 파일
+  text = extract_pdf_text(resp.content, max_pages=15, max_chars=10000)  # URL로 받은 PDF
+  for page_text in iter_pdf_pages(path, executor=pool): ...             # 페이지 순서대로 스트리밍
+  text = extract_pdf_text(path, executor=pool, on_page=scanner.feed)    # 추출하면서 페이지마다 콜백
+
+벤치마크: python pdf_extract.py --bench [폴더 또는 파일 ...]   (기본: input/ 아래 PDF 전체)
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from concurrent.futures import Executor
+from typing import BinaryIO, Callable, Iterator, Union
+
+from utils import OCR_DPI, OCR_MAX_PAGES, _extract_text_from_image, _ocr_pool
+
+
+PdfSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+# 공백 제외 글자 수가 이보다 적으면 스캔 PDF로 보고 OCR
+OCR_MIN_CHARS = 80
+# 프로세스 풀이 주어졌을 때 이 쪽수 이상이면 PDF_RANGE_PAGES쪽씩 나눠 병렬 추출 (미만이면 워커 1개에 통째로)
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "32"))
+PDF_RANGE_PAGES = max(1, int(os.getenv("PDF_RANGE_PAGES", "16")))
+
+
+def _as_source(source: PdfSource) -> Path | bytes:
+    """경로는 Path로, 나머지(bytes/파일 객체)는 bytes로 정리."""
+    if isinstance(source, (str, Path)):
+        return Path(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    return source.read()
+
+
+def open_pdf(source: PdfSource):
+    """fitz 문서 열기 (경로 또는 메모리)."""
+    import fitz
+
+    source = _as_source(source)
+    if isinstance(source, Path):
+        return fitz.open(str(source))
+    return fitz.open(stream=source, filetype="pdf")
+
+
+def _page_ranges(count: int) -> list[tuple[int, int]]:
+    """PDF_PARALLEL_MIN_PAGES쪽 이상이면 PDF_RANGE_PAGES쪽씩, 아니면 전체를 한 구간으로."""
+    if count < PDF_PARALLEL_MIN_PAGES:
+        return [(0, count)] if count else []
+    return [(start, min(start + PDF_RANGE_PAGES, count)) for start in range(0, count, PDF_RANGE_PAGES)]
+
+
+def _extract_range(path: str, start: int, stop: int) -> list[str | None]:
+    """
+    프로세스 풀 워커 (피클 가능한 모듈 함수여야 함): 문서를 직접 열어 [start, stop) 페이지 텍스트 반환.
+    읽지 못한 페이지는 None (호출 측에서 그 페이지만 pdfplumber로 재시도).
+    """
+    with open_pdf(Path(path)) as doc:
+        return [_page_text(doc, index) for index in range(start, stop)]
+
+
+def _page_text(doc, index: int) -> str | None:
+    try:
+        return doc.load_page(index).get_text("text")
+    except Exception:
+        return None
+
+
+class _PdfplumberPages:
+    """fitz가 읽지 못한 페이지만 pdfplumber로 (문서는 처음 필요할 때 한 번만 연다)."""
+
+    def __init__(self, source: Path | bytes):
+        self.source = source
+        self._pdf = None
+
+    def text(self, index: int) -> str:
+        if self._pdf is None:
+            import pdfplumber
+
+            self._pdf = pdfplumber.open(self.source if isinstance(self.source, Path) else io.BytesIO(self.source))
+        return self._pdf.pages[index].extract_text() or ""
+
+    def close(self):
+        if self._pdf is not None:
+            self._pdf.close()
+
+
+def iter_pdf_pages(source: PdfSource, max_pages: int | None = None, max_chars: int | None = None,
+                   executor: Executor | None = None, warnings: list[str] | None = None) -> Iterator[str]:
+    """
+    페이지 텍스트를 앞 페이지부터 순서대로 하나씩 돌려준다 (마지막 페이지를 기다리지 않고 바로 처리 가능).
+
+    executor(ProcessPoolExecutor)를 주면 페이지 구간을 워커에 나눠 보내고(워커마다 경로로 문서를 따로 연다),
+    끝난 구간부터 순서대로 내보낸다. 없거나 source가 메모리(bytes)면 현재 스레드에서 한 쪽씩 추출
+    (구간마다 문서 전체를 피클해 보내지 않도록).
+    max_chars만큼 모이면 남은 구간은 취소한다.
+    """
+    if warnings is None:
+        warnings = []
+    source = _as_source(source)
+    try:
+        doc = open_pdf(source)
+    except Exception as e:
+        # fitz로 열리지 않는 파일 → 전체를 pdfplumber로
+        print("  PDF 읽는 중입니다... (레이아웃 방식 전환)")
+        warnings.append(f"PyMuPDF 실패로 pdfplumber 사용: {e}")
+        yield from _iter_pdfplumber(source, max_pages, max_chars)
+        return
+
+    count = min(len(doc), max_pages or len(doc))
+    if executor is None or isinstance(source, bytes):
+        chunks = ([_page_text(doc, index)] for index in range(count))
+        futures = []
+    else:
+        futures = [executor.submit(_extract_range, str(source), start, stop) for start, stop in _page_ranges(count)]
+        chunks = (future.result() for future in futures)
+
+    fallback = _PdfplumberPages(source)
+    failed, size, index = 0, 0, 0
+    try:
+        for chunk in chunks:
+            for text in chunk:
+                if text is None:
+                    failed += 1
+                    try:
+                        text = fallback.text(index)
+                    except Exception:
+                        text = ""
+                index += 1
+                yield text
+                size += len(text)
+                if max_chars is not None and size >= max_chars:
+                    return
+    finally:
+        for future in futures:
+            future.cancel()
+        doc.close()
+        fallback.close()
+        if failed:
+            warnings.append(f"PyMuPDF가 읽지 못한 {failed}쪽은 pdfplumber로 추출")
+
+
+def _iter_pdfplumber(source: Path | bytes, max_pages: int | None, max_chars: int | None) -> Iterator[str]:
+    import pdfplumber
+
+    size = 0
+    with pdfplumber.open(source if isinstance(source, Path) else io.BytesIO(source)) as pdf:
+        for page in pdf.pages[:max_pages]:
+            text = page.extract_text()
+            if text:
+                yield text
+                size += len(text)
+                if max_chars is not None and size >= max_chars:
+                    return
+
+
+def extract_pdf_text(source: PdfSource, max_pages: int | None = None, max_chars: int | None = None,
+                     warnings: list[str] | None = None, ocr: bool = True,
+                     executor: Executor | None = None, on_page: Callable[[str], None] | None = None) -> str:
+    """
+    PDF 텍스트 추출 (PyMuPDF → 읽지 못한 쪽만 pdfplumber → 텍스트 레이어가 없으면 OCR).
+
+    Args:
+        source: 파일 경로, bytes, 또는 read()가 되는 파일 객체
+        max_pages: 앞에서부터 읽을 최대 페이지 수 (None이면 전체)
+        max_chars: 결과 글자 수 상한 (None이면 제한 없음)
+        warnings: 지정 시 폴백/OCR 사용 등 경고를 추가
+        ocr: False면 텍스트 레이어가 없어도 OCR하지 않음
+        executor: 프로세스 풀 — 페이지 구간 추출과 OCR을 워커에서 실행 (ingestion의 풀을 넘겨 받음)
+        on_page: 페이지 텍스트가 나오는 대로 순서대로 호출 (OCR 폴백 결과는 전달하지 않음 — 반환값으로 확인)
+    """
+    if warnings is None:
+        warnings = []
+    source = _as_source(source)
+
+    # 페이지별 문자열을 리스트에 모아 마지막에 한 번만 합침
+    pages = []
+    for page_text in iter_pdf_pages(source, max_pages, max_chars, executor, warnings):
+        pages.append(page_text)
+        if on_page is not None:
+            on_page(page_text)
+    text = "\n".join(pages).strip()
+    if ocr and len(re.sub(r"\s+", "", text)) < OCR_MIN_CHARS:
+        ocr_pages = min(max_pages or OCR_MAX_PAGES, OCR_MAX_PAGES)
+        if executor is not None:
+            ocr_text = executor.submit(ocr_pdf, source if isinstance(source, bytes) else str(source), ocr_pages).result()
+        else:
+            ocr_text = ocr_pdf(source, max_pages=ocr_pages)
+        if ocr_text:
+            text = ocr_text
+            warnings.append("텍스트 레이어가 없어 OCR로 추출")
+        else:
+            warnings.append("PDF에서 텍스트를 거의 추출하지 못함")
+    return text[:max_chars] if max_chars is not None else text
+
+
+# ──────────────────────────────────────────
+# OCR 폴백 (스캔 PDF)
+# ──────────────────────────────────────────
+
+def _pixmap_to_array(pix):
+    """fitz Pixmap → numpy 배열 (BGR, 임시 PNG 없이 메모리에서 바로 변환)."""
+    import numpy as np
+
+    arr = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+    if pix.n >= 3:
+        arr = arr[:, :, 2::-1]
+    return np.ascontiguousarray(arr)
+
+
+def ocr_pdf(source: PdfSource, max_pages: int | None = None, dpi: int | None = None) -> str:
+    """
+    텍스트가 거의 없는 스캔 PDF를 이미지 OCR로 보완.
+    RapidOCR 사용 가능 시 페이지를 메모리에서 렌더링해 병렬 OCR,
+    없으면 페이지별 PNG를 만들어 Windows OCR/Tesseract로 처리.
+    """
+    source = _as_source(source)
+    max_pages = max_pages or OCR_MAX_PAGES
+    dpi = dpi or OCR_DPI
+    if _ocr_pool.available:
+        try:
+            return _ocr_pdf_in_memory(source, max_pages, dpi)
+        except Exception as e:
+            print(f"[WARN] 메모리 OCR 실패, 파일 방식으로 재시도: {e}")
+    return _ocr_pdf_via_files(source, max_pages, dpi)
+
+
+def _ocr_pdf_in_memory(source: Path | bytes, max_pages: int, dpi: int) -> str:
+    from concurrent.futures import ThreadPoolExecutor
+
+    import fitz
+
+    # 렌더링은 fitz 문서 객체가 스레드 안전하지 않으므로 순차, OCR만 병렬
+    zoom = dpi / 72
+    with open_pdf(source) as doc:
+        pages = [
+            _pixmap_to_array(doc.load_page(i).get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False))
+            for i in range(min(len(doc), max_pages))
+        ]
+    if not pages:
+        return ""
+
+    with ThreadPoolExecutor(max_workers=min(_ocr_pool.size, len(pages)), thread_name_prefix="ocr") as pool:
+        texts = list(pool.map(_ocr_pool.recognize, pages))
+    return "\n\n".join(t.strip() for t in texts if t.strip()).strip()
+
+
+def _ocr_pdf_via_files(source: Path | bytes, max_pages: int, dpi: int) -> str:
+    temp_dir = Path(tempfile.mkdtemp(prefix="pdf_ocr_"))
+    ocr_texts = []
+
+    try:
+        import fitz
+
+        zoom = dpi / 72
+        doc = open_pdf(source)
+        page_count = min(len(doc), max_pages)
+        for page_index in range(page_count):
+            page = doc.load_page(page_index)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            image_path = temp_dir / f"page_{page_index + 1}.png"
+            pix.save(str(image_path))
+            text = _extract_text_from_image(image_path)
+            if text.strip():
+                ocr_texts.append(text.strip())
+        doc.close()
+    except Exception:
+        return ""
+    finally:
+        for image_file in temp_dir.glob("*"):
+            try:
+                image_file.unlink()
+            except Exception:
+                pass
+        try:
+            temp_dir.rmdir()
+        except Exception:
+            pass
+
+    return "\n\n".join(ocr_texts).strip()
+
+
+# ──────────────────────────────────────────
+# python pdf_extract.py --bench [폴더 또는 파일 ...]
+# ──────────────────────────────────────────
+
+def _best_of(repeat: int, fn):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, result
+
+
+def _concat_baseline(path: Path) -> str:
+    """이전 방식: 한 스레드에서 페이지 문자열을 += 로 이어 붙임."""
+    import fitz
+
+    text = ""
+    with fitz.open(str(path)) as doc:
+        for page in doc:
+            text += page.get_text("text") + "\n"
+    return text.strip()
+
+
+def benchmark(targets: list[str], processes: int, repeat: int = 3) -> int:
+    """대상 PDF마다 이전 방식 / 순차 / 페이지 병렬 / 첫 페이지까지 시간을 비교 출력."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    from material_pipeline import LineScanner
+
+    paths: list[Path] = []
+    for target in targets:
+        target_path = Path(target)
+        paths.extend(sorted(target_path.rglob("*.pdf")) if target_path.is_dir() else [target_path])
+    if not paths:
+        print(f"[WARN] PDF 없음: {', '.join(targets)}")
+        return 1
+
+    print("=" * 96)
+    print(f"  PDF 추출 벤치마크 ({len(paths)}개 파일, 프로세스 {processes}개, {repeat}회 중 최소값, OCR 제외)")
+    print("=" * 96)
+    print(f"  {'파일':<34}{'쪽':>5}{'글자':>9}{'이전(+=)':>11}{'순차':>9}{'병렬':>9}{'첫 쪽':>9}{'첫 점수':>9}  일치")
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        list(pool.map(abs, range(processes)))  # 워커 미리 띄우기 (기동 시간 제외)
+        for path in paths:
+            with open_pdf(path) as doc:
+                pages = len(doc)
+            old_ms, old = _best_of(repeat, lambda: _concat_baseline(path))
+            seq_ms, seq = _best_of(repeat, lambda: extract_pdf_text(path, ocr=False))
+            par_ms, par = _best_of(repeat, lambda: extract_pdf_text(path, ocr=False, executor=pool))
+
+            started = time.perf_counter()
+            scanner = LineScanner()
+            first_page_ms = first_scored_ms = None
+            for page_text in iter_pdf_pages(path, executor=pool):
+                if first_page_ms is None:
+                    first_page_ms = (time.perf_counter() - started) * 1000
+                scanner.feed(page_text)
+                if first_scored_ms is None and scanner.lines:
+                    scanner.key_lines()
+                    first_scored_ms = (time.perf_counter() - started) * 1000
+
+            same = "O" if old == seq == par else "X"
+            name = path.name if len(path.name) <= 32 else path.name[:31] + "…"
+            print(f"  {name:<34}{pages:>5}{len(seq):>9,}{old_ms:>10.1f}ms{seq_ms:>7.1f}ms{par_ms:>7.1f}ms"
+                  f"{first_page_ms or 0:>7.1f}ms{first_scored_ms or 0:>7.1f}ms  {same}")
+    print(f"\n  ※ 병렬 분할 기준: {PDF_PARALLEL_MIN_PAGES}쪽 이상이면 {PDF_RANGE_PAGES}쪽씩 (미만은 워커 1개)")
+    return 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PDF 텍스트 추출")
+    parser.add_argument("--bench", nargs="*", metavar="PATH", help="벤치마크 대상 (기본: input/)")
+    parser.add_argument("--processes", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if args.bench is None:
+        parser.print_help()
+        raise SystemExit(0)
+    raise SystemExit(benchmark(args.bench or [str(Path(__file__).parent / "input")], args.processes, args.repeat))
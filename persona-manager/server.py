@@ -12,6 +12,13 @@ import re
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from llm_gateway import generate as llm_generate
 
 
 def extract_json_from_response(text: str) -> dict:
@@ -122,9 +129,11 @@ def onboard_new_client(
         if not client:
             raise ValueError("Gemini API가 구성되지 않았습니다.")
             
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model='gemini-2.0-flash',
-            contents=analysis_prompt
+            contents=analysis_prompt,
+            endpoint="mcp_onboard_new_client",
         )
         persona_analysis = extract_json_from_response(response.text)
         
@@ -431,7 +431,7 @@ def merge_dna(client_id: str, blog_dna: Dict) -> Optional[Dict]:
         업데이트된 persona_data dict (파일도 저장됨), 실패 시 None
     """
     import os
-    from google import genai
+    from llm_gateway import get_client
 
     result = load_latest_persona(client_id)
     if not result:
@@ -451,7 +451,7 @@ def merge_dna(client_id: str, blog_dna: Dict) -> Optional[Dict]:
         print("GEMINI_API_KEY가 없어 unified_persona를 생성할 수 없습니다.")
         return None
 
-    client = genai.Client(api_key=api_key)
+    client = get_client()
 
     merge_prompt = f"""
 당신은 광고 콘텐츠 페르소나 전문가입니다.
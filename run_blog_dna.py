@@ -27,6 +27,7 @@ sys.path.insert(0, str(Path(__file__).parent / "blog_pull"))
 from run_crawler import get_blog_id, get_post_list, get_post_content
 
 from utils import LoadingSpinner, parse_json_response, load_api_key, setup_logger
+from llm_gateway import generate as llm_generate
 
 load_api_key("GEMINI_API_KEY")
 from google import genai
@@ -187,9 +188,11 @@ def analyze_blog_dna(blog_url: str, count: int = 15) -> dict | None:
 ---
 
 요약 (300자 이내, 구체적 예시 포함):"""
-            resp = gemini_client.models.generate_content(
+            resp = llm_generate(
+                gemini_client,
                 model='gemini-2.0-flash',
-                contents=summary_prompt
+                contents=summary_prompt,
+                endpoint="blog_dna_chunk",
             )
             chunk_summaries.append(f"[구간 {i}]\n{resp.text.strip()}")
             # [MINOR-4] OK/FAILED 영문 -> 한국어 변환
@@ -250,9 +253,11 @@ def analyze_blog_dna(blog_url: str, count: int = 15) -> dict | None:
 """
 
     try:
-        dna_resp = gemini_client.models.generate_content(
+        dna_resp = llm_generate(
+            gemini_client,
             model='gemini-2.0-flash',
-            contents=dna_prompt
+            contents=dna_prompt,
+            endpoint="blog_dna",
         )
         blog_dna = parse_json_response(dna_resp.text)
         # [MINOR-4] OK/FAILED 영문 -> 한국어 변환
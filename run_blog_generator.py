@@ -19,10 +19,11 @@ from typing import Dict
 if sys.platform == 'win32' and not isinstance(sys.stdout, io.TextIOWrapper):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
-from utils import LoadingSpinner, parse_json_response, load_api_key, extract_text_from_file
+from utils import LoadingSpinner, parse_json_response, load_api_key, extract_text_cached
 from blog_storage import build_blog_package, save_blog_package, sanitize_filename_component
 from material_pipeline import build_material_bundle
 from offline_engines import generate_single_blog_offline
+from llm_gateway import generate as llm_generate
 
 # API 키 로드
 load_api_key("GEMINI_API_KEY")
@@ -49,8 +50,8 @@ from persona_version_manager import (
 SUPPORTED_EXTENSIONS = ['.txt', '.pdf', '.hwp', '.docx', '.jpg', '.jpeg', '.png']
 
 
-# [M-5] extract_text_from_file은 utils.py에서 import하여 사용
-# (위 import 라인: from utils import ..., extract_text_from_file)
+# [M-5] 파일 텍스트 추출은 utils.py의 extract_text_cached(내용 해시 캐시)를 import하여 사용
+# (위 import 라인: from utils import ..., extract_text_cached)
 
 
 def get_file_type_icon(ext: str) -> str:
@@ -186,7 +187,10 @@ def select_press_release():
     all_texts = []
     for selected_file in selected_files:
         try:
-            text = extract_text_from_file(selected_file)
+            extracted = extract_text_cached(selected_file)
+            text = extracted["text"]
+            if extracted["cached"]:
+                print(f"   ⚡ 캐시된 추출 결과 사용: {selected_file.name}")
             if text.strip():
                 if len(selected_files) > 1:
                     # 여러 파일인 경우 구분선 추가
@@ -269,7 +273,7 @@ def _analyze_press_release(client, press_release: str) -> dict | None:
   "emphasis_points": ["강조할 포인트1", "강조할 포인트2"]
 }}"""
     try:
-        resp = client.models.generate_content(model='gemini-2.0-flash', contents=prompt)
+        resp = llm_generate(client, model='gemini-2.0-flash', contents=prompt, endpoint="analyze_press_release")
         return parse_json_response(resp.text)
     except Exception:
         return None
@@ -908,9 +912,11 @@ def _parse_free_text_feedback_with_ai(free_text: str) -> Dict:
     try:
         spinner = LoadingSpinner("자유 피드백 AI 분석 중")
         spinner.start()
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model='gemini-2.0-flash',
-            contents=prompt
+            contents=prompt,
+            endpoint="parse_feedback",
         )
         spinner.stop("분석 완료")
 
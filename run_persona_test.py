@@ -22,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent / "persona-manager"))
 
 from utils import LoadingSpinner, parse_json_response, load_api_key, extract_text_from_file
 from offline_engines import analyze_persona_offline
+from llm_gateway import generate as llm_generate
 
 
 # ============================================================
@@ -116,9 +117,11 @@ def summarize_chunk(client, chunk: str, chunk_idx: int, total: int) -> str:
 요약:"""
 
     try:
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model='gemini-2.0-flash',
-            contents=prompt
+            contents=prompt,
+            endpoint="summarize_chunk",
         )
         return response.text.strip()
     except Exception as e:
@@ -389,9 +392,11 @@ def analyze_persona(client_name: str, organization: str, kakao_chat_log: str, ca
     
     if client:
         try:
-            response = client.models.generate_content(
+            response = llm_generate(
+                client,
                 model='gemini-2.0-flash',
-                contents=analysis_prompt
+                contents=analysis_prompt,
+                endpoint="analyze_persona",
             )
             spinner.stop("심층 분석 완료")
             
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+블로그 크롤러 오프라인 테스트 — 로컬 스텁 HTTP 서버 대상
+CrawlerEngine(mobile_base/pc_base)과 run_crawler를 네이버 대신 127.0.0.1 스텁 서버로 돌려
+속도 제한, 호스트별 동시 요청 상한, 429 재시도, 증분 목록 수집을 확인한다.
+
+실행: python test_crawler_stub.py   (또는 pytest test_crawler_stub.py)
+"""
+
+import io
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Windows 터미널 UTF-8 출력 설정
+if sys.platform == 'win32' and not isinstance(sys.stdout, io.TextIOWrapper):
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 경로 설정 (run_crawler/crawler_engine은 web/, http_cache는 루트)
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "web"))
+
+import http_cache
+import run_crawler
+from crawler_engine import CrawlerEngine
+
+BLOG_ID = "stubblog"
+PAGE_SIZE = 5
+TOTAL_POSTS = 20
+
+
+class _StubState:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight: dict[str, int] = {}
+        self.max_in_flight: dict[str, int] = {}
+        self.times: list[float] = []
+        self.paths: list[str] = []
+        self.fail_once: set[str] = set()
+
+
+def _make_server(state: _StubState) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            host = self.headers.get("Host", "")
+            with state.lock:
+                state.times.append(time.monotonic())
+                state.paths.append(self.path)
+                state.in_flight[host] = state.in_flight.get(host, 0) + 1
+                state.max_in_flight[host] = max(state.max_in_flight.get(host, 0), state.in_flight[host])
+                fail = self.path in state.fail_once
+                state.fail_once.discard(self.path)
+            try:
+                if state.delay:
+                    time.sleep(state.delay)
+                if fail:
+                    self._send(429, b"slow down", "text/plain", {"Retry-After": "0"})
+                    return
+                parts = urlsplit(self.path)
+                if parts.path == f"/api/blogs/{BLOG_ID}/post-list":
+                    page = int(parse_qs(parts.query).get("page", ["1"])[0])
+                    first = (page - 1) * PAGE_SIZE
+                    items = [
+                        {"logNo": str(1000 - n), "titleWithInspectMessage": f"글 {1000 - n}",
+                         "addDate": 1767225600000 - n * 86400000}
+                        for n in range(first, min(first + PAGE_SIZE, TOTAL_POSTS))
+                    ]
+                    body = json.dumps({"isSuccess": True, "result": {"items": items}}).encode()
+                    self._send(200, body, "application/json")
+                elif parts.path.startswith(f"/{BLOG_ID}/"):
+                    log_no = parts.path.rsplit("/", 1)[-1]
+                    html = f'<html><body><div class="se-main-container"><p>본문 {log_no}</p></div></body></html>'
+                    self._send(200, html.encode("utf-8"), "text/html; charset=utf-8")
+                else:
+                    self._send(200, b"<html></html>", "text/html")
+            finally:
+                with state.lock:
+                    state.in_flight[host] -= 1
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class _Stub:
+    """with _Stub(delay) as (state, base_url): ..."""
+
+    def __init__(self, delay: float = 0.0):
+        self.state = _StubState(delay)
+
+    def __enter__(self):
+        self._cache_disabled = http_cache.HTTP_CACHE_DISABLED
+        http_cache.HTTP_CACHE_DISABLED = True  # 본문 요청이 모두 스텁 서버까지 가도록
+        self.server = _make_server(self.state)
+        return self.state, f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+        http_cache.HTTP_CACHE_DISABLED = self._cache_disabled
+
+
+def _posts(log_nos):
+    return [{"logNo": str(n), "title": f"글 {n}"} for n in log_nos]
+
+
+def test_rate_limit():
+    """rate=20/s, burst=2: 요청 12개(쿠키 1 + 본문 11)는 최소 (12-2)/20 = 0.5초."""
+    with _Stub() as (state, base):
+        with CrawlerEngine(BLOG_ID, rate=20, burst=2, max_workers=6, per_host_limit=6,
+                           mobile_base=base, pc_base=base) as engine:
+            posts = engine.fetch_post_contents(_posts(range(990, 1001)))
+        elapsed = state.times[-1] - state.times[0]
+    assert [p["content"] for p in posts] == [f"본문 {n}" for n in range(990, 1001)]
+    assert len(state.times) == 12
+    # 앞의 burst개를 뺀 나머지는 1/rate 간격 이상으로 퍼져야 함 (타이머 오차 여유 0.05초)
+    assert elapsed >= (12 - 2) / 20 - 0.05, elapsed
+
+
+def test_per_host_concurrency():
+    """스레드 6개여도 호스트별 동시 요청은 per_host_limit(2)를 넘지 않고, 호스트가 다르면 따로 센다."""
+    with _Stub(delay=0.1) as (state, base):
+        other = base.replace("127.0.0.1", "localhost")
+        with CrawlerEngine(BLOG_ID, rate=1000, burst=100, max_workers=6, per_host_limit=2,
+                           mobile_base=base, pc_base=base, warm_up=False) as engine:
+            def _fetch(url):
+                engine.get(url).raise_for_status()
+
+            threads = [threading.Thread(target=_fetch, args=(f"{host}/{BLOG_ID}/{n}",))
+                       for n in range(6) for host in (base, other)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+    assert set(state.max_in_flight) == {base.split("//")[1], other.split("//")[1]}
+    assert all(n == 2 for n in state.max_in_flight.values()), state.max_in_flight
+
+
+def test_retry_after_429():
+    with _Stub() as (state, base):
+        state.fail_once.add(f"/{BLOG_ID}/1000")
+        with CrawlerEngine(BLOG_ID, rate=1000, burst=100, backoff=0.01,
+                           mobile_base=base, pc_base=base, warm_up=False) as engine:
+            posts = engine.fetch_post_contents(_posts([1000]))
+            retries = engine.stats["retries"]
+    assert posts[0]["content"] == "본문 1000"
+    assert retries == 1
+
+
+def test_incremental_post_list():
+    """증분 목록: 최신 count개 안에서 저장소에 없는 logNo만, 필요한 페이지까지만 요청."""
+    with _Stub() as (state, base):
+        with CrawlerEngine(BLOG_ID, rate=1000, burst=100, mobile_base=base, pc_base=base,
+                           warm_up=False) as engine:
+            known = {"1000", "999", "997"}
+            posts = run_crawler.get_post_list(BLOG_ID, 7, session=engine, known_log_nos=known)
+            list_requests = sum(1 for p in state.paths if "post-list" in p)
+            no_new = run_crawler.get_post_list(BLOG_ID, 3, session=engine, known_log_nos={"1000", "999", "998"})
+    assert [p["logNo"] for p in posts] == ["998", "996", "995", "994"]
+    assert posts[0]["url"] == f"{base}/{BLOG_ID}/998"
+    assert list_requests == 2
+    assert no_new == []
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("블로그 크롤러 스텁 서버 테스트")
+    print("=" * 60)
+    failed = 0
+    for name, fn in list(globals().items()):
+        if not name.startswith("test_") or not callable(fn):
+            continue
+        try:
+            fn()
+            print(f"[OK] {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {name}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+HTTP 응답 캐시 오프라인 테스트 — 로컬 스텁 HTTP 서버 대상
+200 저장 → 신선도 기간 안 hit(네트워크 없음) → 기간 지나면 ETag 조건부 요청 304 재검증 →
+서버가 죽으면 저장본(stale) 반환, max_bytes 상한(캐시 꺼도 적용)을 확인한다.
+
+실행: python test_http_cache.py   (또는 pytest test_http_cache.py)
+"""
+
+import io
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Windows 터미널 UTF-8 출력 설정
+if sys.platform == 'win32' and not isinstance(sys.stdout, io.TextIOWrapper):
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+import requests
+
+import http_cache
+from http_cache import HttpCache
+
+ETAG = '"v1"'
+PAGE = "<html><body><p>보도자료 본문</p></body></html>".encode("utf-8")
+BIG = b"x" * 300_000
+
+
+class _Stub:
+    """with _Stub() as stub: stub.url("/page"), stub.requests, stub.conditional"""
+
+    def __init__(self):
+        self.requests = 0
+        self.conditional = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub.requests += 1
+                if self.headers.get("If-None-Match") == ETAG:
+                    stub.conditional += 1
+                    self.send_response(304)
+                    self.send_header("ETag", ETAG)
+                    self.end_headers()
+                    return
+                body = BIG if self.path == "/big" else PAGE
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", ETAG)
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}{path}"
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _cache(fresh_sec: float) -> HttpCache:
+    return HttpCache(os.path.join(tempfile.mkdtemp(), "http.sqlite3"), fresh_sec=fresh_sec)
+
+
+def test_miss_then_hit():
+    cache = _cache(fresh_sec=600)
+    with _Stub() as stub:
+        first = cache.get(stub.url("/page"), timeout=5)
+        second = cache.get(stub.url("/page"), timeout=5)
+        assert stub.requests == 1  # 두 번째는 네트워크 없이
+    assert (first.cache_status, second.cache_status) == ("miss", "hit")
+    assert second.content == PAGE
+    assert "보도자료 본문" in second.text
+    assert second.headers.get("content-type") == "text/html; charset=utf-8"
+    stats = cache.stats()
+    assert stats["misses"] == 1 and stats["hits"] == 1
+
+
+def test_revalidated_with_304():
+    cache = _cache(fresh_sec=0)  # 매번 재검증
+    with _Stub() as stub:
+        cache.get(stub.url("/page"), timeout=5)
+        again = cache.get(stub.url("/page"), timeout=5)
+        assert stub.requests == 2 and stub.conditional == 1
+    assert again.cache_status == "revalidated"
+    assert again.content == PAGE
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_stale_when_offline():
+    cache = _cache(fresh_sec=0)
+    stub = _Stub().__enter__()
+    url = stub.url("/page")
+    cache.get(url, timeout=5)
+    stub.stop()  # 네트워크 없음
+    stale = cache.get(url, timeout=2)
+    assert stale.cache_status == "stale"
+    assert stale.content == PAGE
+    # 저장본이 없는 URL은 원래 예외 그대로
+    try:
+        cache.get(stub.url("/never"), timeout=2)
+    except requests.RequestException:
+        pass
+    else:
+        raise AssertionError("저장본 없는 URL은 연결 오류가 나야 함")
+
+
+def test_max_bytes_not_stored():
+    cache = _cache(fresh_sec=600)
+    with _Stub() as stub:
+        capped = cache.get(stub.url("/big"), timeout=5, max_bytes=100_000)
+        again = cache.get(stub.url("/big"), timeout=5)
+        assert stub.requests == 2  # 잘린 본문은 저장하지 않으므로 다시 받음
+    assert capped.truncated and len(capped.content) == 100_000
+    assert again.cache_status == "miss" and len(again.content) == len(BIG)
+
+
+def test_max_bytes_when_disabled():
+    cache = _cache(fresh_sec=600)
+    saved = http_cache.HTTP_CACHE_DISABLED
+    http_cache.HTTP_CACHE_DISABLED = True
+    try:
+        with _Stub() as stub:
+            capped = cache.get(stub.url("/big"), timeout=5, max_bytes=100_000)
+            plain = cache.get(stub.url("/page"), timeout=5)
+    finally:
+        http_cache.HTTP_CACHE_DISABLED = saved
+    assert capped.cache_status == "bypass"
+    assert capped.truncated and len(capped.content) == 100_000
+    assert plain.content == PAGE
+    assert cache.stats()["stored"] == 0
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("HTTP 캐시 스텁 서버 테스트")
+    print("=" * 60)
+    failed = 0
+    for name, fn in list(globals().items()):
+        if not name.startswith("test_") or not callable(fn):
+            continue
+        try:
+            fn()
+            print(f"[OK] {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {name}: {e}")
+    sys.exit(1 if failed else 0)
@@ -6,11 +6,10 @@ LoadingSpinner, JSON 추출, API 키 로드, 파일 텍스트 추출 등 공통
 
 import os
 import base64
+import hashlib
 import json
 import re
-import struct
 import subprocess
-import tempfile
 import threading
 import time
 import logging
@@ -241,19 +240,10 @@ def _dedupe_preserve_order(items: list[str]) -> list[str]:
 
 # ============================================================
 # [M-5] 공통 파일 텍스트 추출 함수 (web/app.py에서 통합)
-# 지원 형식: .txt, .pdf (PyMuPDF 우선 → pdfplumber fallback),
-#            .docx, .hwp, .jpg/.jpeg/.png
+# 지원 형식: .txt, .pdf (pdf_extract.py: PyMuPDF 우선 → pdfplumber fallback → OCR),
+#            .docx, .hwp (hwp_extract.py), .jpg/.jpeg/.png
 # ============================================================
 
-# HWP 지원 여부
-try:
-    import olefile as _olefile
-    import zlib as _zlib
-    _HWP_SUPPORTED = True
-except ImportError:
-    _HWP_SUPPORTED = False
-
-
 def _run_windows_ocr(image_path: Path) -> str:
     """
     Windows 기본 OCR(WinRT)을 이용해 이미지에서 텍스트 추출.
@@ -314,16 +304,74 @@ Write-Output $result.Text
     return result.stdout.strip()
 
 
+# OCR 설정 — 스캔 PDF 처리량/정확도 조절
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(min(4, os.cpu_count() or 1))))
+OCR_MAX_PAGES = int(os.getenv("OCR_MAX_PAGES", "8"))
+OCR_DPI = int(os.getenv("OCR_DPI", "144"))
+
+
+class _RapidOCRPool:
+    """
+    RapidOCR 엔진 풀 (지연 생성, 스레드 안전).
+    엔진 생성 시 ONNX 모델을 디스크에서 읽으므로 프로세스당 최대 size개만 만들고 재사용한다.
+    """
+
+    def __init__(self, size: int):
+        import queue
+
+        self.size = max(1, size)
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._available: bool | None = None
+
+    @property
+    def available(self) -> bool:
+        if self._available is None:
+            try:
+                import rapidocr_onnxruntime  # noqa: F401
+                self._available = True
+            except Exception:
+                self._available = False
+        return self._available
+
+    def _acquire(self):
+        import queue
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                from rapidocr_onnxruntime import RapidOCR
+
+                engine = RapidOCR()
+                self._created += 1
+                return engine
+        return self._idle.get()
+
+    def recognize(self, image) -> str:
+        """image: 파일 경로(str) 또는 numpy 배열. 인식 실패 시 빈 문자열."""
+        engine = self._acquire()
+        try:
+            result, _ = engine(image)
+        finally:
+            self._idle.put(engine)
+        if not result:
+            return ""
+        lines = [item[1] for item in result if len(item) >= 2 and item[1]]
+        return "\n".join(lines).strip()
+
+
+_ocr_pool = _RapidOCRPool(OCR_WORKERS)
+
+
 def _extract_text_from_image(file_path: Path) -> str:
     """이미지 파일 OCR."""
     try:
-        from rapidocr_onnxruntime import RapidOCR
-
-        engine = RapidOCR()
-        result, _ = engine(str(file_path))
-        if result:
-            lines = [item[1] for item in result if len(item) >= 2 and item[1]]
-            text = "\n".join(lines).strip()
+        if _ocr_pool.available:
+            text = _ocr_pool.recognize(str(file_path))
             if text:
                 return text
     except Exception:
@@ -342,125 +390,22 @@ def _extract_text_from_image(file_path: Path) -> str:
         return ""
 
 
-def _ocr_pdf_with_windows(file_path: Path, max_pages: int = 8) -> str:
-    """텍스트가 거의 없는 스캔 PDF를 이미지 OCR로 보완."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="pdf_ocr_"))
-    ocr_texts = []
-
-    try:
-        import fitz
-
-        doc = fitz.open(str(file_path))
-        page_count = min(len(doc), max_pages)
-        for page_index in range(page_count):
-            page = doc.load_page(page_index)
-            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False)
-            image_path = temp_dir / f"page_{page_index + 1}.png"
-            pix.save(str(image_path))
-            text = _extract_text_from_image(image_path)
-            if text.strip():
-                ocr_texts.append(text.strip())
-        doc.close()
-    except Exception:
-        return ""
-    finally:
-        for image_file in temp_dir.glob("*"):
-            try:
-                image_file.unlink()
-            except Exception:
-                pass
-        try:
-            temp_dir.rmdir()
-        except Exception:
-            pass
-
-    return "\n\n".join(ocr_texts).strip()
-
-
-def _iter_hwp_records(raw: bytes):
-    """압축 해제된 HWP section에서 레코드를 순회."""
-    offset = 0
-    total = len(raw)
-    while offset + 4 <= total:
-        header = struct.unpack_from("<I", raw, offset)[0]
-        tag_id = header & 0x3FF
-        level = (header >> 10) & 0x3FF
-        size = (header >> 20) & 0xFFF
-        offset += 4
-        if size == 0xFFF:
-            if offset + 4 > total:
-                break
-            size = struct.unpack_from("<I", raw, offset)[0]
-            offset += 4
-        if offset + size > total:
-            break
-        yield tag_id, level, raw[offset:offset + size]
-        offset += size
-
-
-def _clean_hwp_text_chunk(text: str) -> str:
-    """HWP PARA_TEXT 레코드에서 사람이 읽을 수 있는 텍스트만 남긴다."""
-    cleaned = sanitize_text_for_display(text, allow_cjk=False)
-    cleaned = re.sub(r"^[A-Za-z]{4,}(?=[가-힣])", "", cleaned)
-    cleaned = re.sub(r"(?<=[가-힣])[A-Za-z]{4,}$", "", cleaned)
-
-    if re.search(r"[가-힣]", cleaned):
-        tokens = []
-        for token in cleaned.split():
-            if re.fullmatch(r"[a-z]{4,}", token):
-                continue
-            tokens.append(token)
-        cleaned = " ".join(tokens)
-
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" -|\t")
-    return cleaned
-
-
-def _extract_text_from_hwp(file_path: Path) -> str:
-    """HWP 본문에서 PARA_TEXT 레코드만 읽어 텍스트를 추출."""
-    if not _HWP_SUPPORTED:
-        raise ValueError("HWP 지원을 위해 'pip install olefile'를 실행하세요.")
-
-    text_parts = []
-    try:
-        ole = _olefile.OleFileIO(str(file_path))
-        for stream in ole.listdir():
-            if "BodyText" not in stream or not any(part.startswith("Section") for part in stream):
-                continue
-            try:
-                data = ole.openstream(stream).read()
-                raw = _zlib.decompress(data, -15)
-            except Exception:
-                continue
-
-            for tag_id, _level, payload in _iter_hwp_records(raw):
-                if tag_id != 67:
-                    continue
-                try:
-                    chunk = payload.decode("utf-16-le", errors="ignore")
-                except Exception:
-                    continue
-                chunk = _clean_hwp_text_chunk(chunk)
-                if is_meaningful_text_line(chunk):
-                    text_parts.append(chunk)
-        ole.close()
-    except Exception as e:
-        raise ValueError(f"HWP 파일 읽기 실패: {e}")
-
-    return "\n".join(_dedupe_preserve_order(text_parts))
-
-
-def extract_text_from_file(file_path: Path) -> str:
+def extract_text_from_file(file_path: Path, warnings: list[str] | None = None, pdf_executor=None,
+                           on_pdf_page=None) -> str:
     """
     다양한 파일 형식에서 텍스트 추출 (공통 유틸).
 
     지원 형식:
     - .txt  : UTF-8 텍스트
-    - .pdf  : PyMuPDF(fitz) 우선, 실패 시 pdfplumber fallback
+    - .pdf  : PyMuPDF(fitz) 우선, 실패 시 pdfplumber fallback, 텍스트 레이어가 없으면 OCR (pdf_extract.py)
     - .docx : python-docx (단락 + 표)
-    - .hwp  : olefile + zlib 압축 해제
+    - .hwp  : olefile + zlib 스트리밍 압축 해제, PARA_TEXT 레코드만 (hwp_extract.py)
     - .jpg/.jpeg/.png : 이미지 경로 마커 반환 (Gemini Vision 처리용)
 
+    Args:
+        warnings: 지정 시 추출 중 경고(폴백/OCR 사용 등)를 추가
+        pdf_executor: 지정 시 PDF 페이지 구간 추출/OCR을 이 프로세스 풀에서 실행
+        on_pdf_page: 지정 시 PDF 페이지 텍스트가 나오는 대로 순서대로 호출 (pdf_extract의 on_page)
     Returns:
         추출된 텍스트 문자열
     Raises:
@@ -468,6 +413,8 @@ def extract_text_from_file(file_path: Path) -> str:
     """
     file_path = Path(file_path)
     ext = file_path.suffix.lower()
+    if warnings is None:
+        warnings = []
 
     if ext == '.txt':
         for enc in ('utf-8', 'cp949', 'euc-kr'):
@@ -479,29 +426,9 @@ def extract_text_from_file(file_path: Path) -> str:
         raise ValueError(f"TXT 파일 인코딩을 인식할 수 없습니다: {file_path}")
 
     elif ext == '.pdf':
-        text = ""
-        # 1차 시도: PyMuPDF (fitz) — 레이아웃 보존, 빠름
-        try:
-            import fitz  # PyMuPDF
-            doc = fitz.open(str(file_path))
-            for page in doc:
-                text += page.get_text("text") + "\n"
-            doc.close()
-        except Exception as e:
-            print("  PDF 읽는 중입니다... (레이아웃 방식 전환)")
-            # 2차 시도: pdfplumber (백업)
-            import pdfplumber
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        text = text.strip()
-        if len(re.sub(r"\s+", "", text)) < 80:
-            ocr_text = _ocr_pdf_with_windows(file_path)
-            if ocr_text:
-                text = ocr_text
-        return text
+        # PyMuPDF 우선 → pdfplumber 폴백 → 텍스트 레이어가 없으면 OCR (pdf_extract 공통 경로)
+        from pdf_extract import extract_pdf_text
+        return extract_pdf_text(file_path, warnings=warnings, executor=pdf_executor, on_page=on_pdf_page)
 
     elif ext == '.docx':
         text = ""
@@ -523,7 +450,8 @@ def extract_text_from_file(file_path: Path) -> str:
         return text
 
     elif ext == '.hwp':
-        return _extract_text_from_hwp(file_path)
+        from hwp_extract import extract_hwp_text
+        return extract_hwp_text(file_path)
 
     elif ext in ['.jpg', '.jpeg', '.png']:
         return _extract_text_from_image(file_path)
@@ -544,3 +472,77 @@ def extract_text_from_file(file_path: Path) -> str:
 
     else:
         raise ValueError(f"지원되지 않는 파일 형식: {ext}")
+
+
+# ============================================================
+# 텍스트 추출 캐시 — 같은 파일(내용 해시 기준) 재업로드 시 재파싱/OCR 생략
+# ============================================================
+
+# 추출 로직이 바뀌면 올려서 기존 캐시를 무효화
+# 2: PDF 페이지 단위 pdfplumber 폴백 + 페이지 구간 병렬 추출
+# 3: HWP 비압축 문서 지원 + 손상된 섹션의 앞부분 유지
+EXTRACTOR_VERSION = "3"
+EXTRACT_CACHE_MAX_BYTES = int(os.getenv("EXTRACT_CACHE_MAX_MB", "200")) * 1024 * 1024
+# 파싱 비용이 읽기 비용과 같은 형식은 캐시하지 않음
+_UNCACHED_EXTS = {".txt"}
+
+
+def file_sha256(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extraction_cache():
+    from cache_store import get_cache
+
+    return get_cache("extract", max_bytes=EXTRACT_CACHE_MAX_BYTES)
+
+
+def extract_text_cached(file_path: Path, pdf_executor=None, on_pdf_page=None) -> dict:
+    """
+    extract_text_from_file + 디스크 캐시.
+    키: sha256(파일 내용) + 확장자 + EXTRACTOR_VERSION + OCR 설정
+    pdf_executor, on_pdf_page: extract_text_from_file에 그대로 전달 (캐시 hit이면 on_pdf_page는 호출되지 않음)
+
+    Returns:
+        {"text": str, "warnings": list[str], "cached": bool}
+    Raises:
+        ValueError: extract_text_from_file과 동일 (실패 결과는 캐시하지 않음)
+    """
+    file_path = Path(file_path)
+    ext = file_path.suffix.lower()
+    if ext in _UNCACHED_EXTS:
+        warnings: list[str] = []
+        return {"text": extract_text_from_file(file_path, warnings), "warnings": warnings, "cached": False}
+
+    cache = None
+    key = ""
+    try:
+        cache = _extraction_cache()
+        # OCR 해상도/페이지 상한이 바뀌면 결과도 달라지므로 키에 포함
+        key = f"v{EXTRACTOR_VERSION}:ocr{OCR_DPI}x{OCR_MAX_PAGES}:{ext}:{file_sha256(file_path)}"
+        hit = cache.get(key)
+        if hit is not None:
+            return {"text": hit.get("text", ""), "warnings": hit.get("warnings", []), "cached": True}
+    except Exception as e:
+        print(f"[WARN] 추출 캐시 사용 불가: {e}")
+        cache = None
+
+    warnings = []
+    text = extract_text_from_file(file_path, warnings, pdf_executor=pdf_executor, on_pdf_page=on_pdf_page)
+    if cache is not None:
+        cache.set(key, {"text": text, "warnings": warnings, "name": file_path.name})
+    return {"text": text, "warnings": warnings, "cached": False}
+
+
+def extraction_cache_stats() -> dict:
+    """추출 캐시 hit/miss/크기 통계."""
+    return _extraction_cache().stats()
+
+
+def prune_extraction_cache() -> dict:
+    """추출 캐시 크기 상한 정리 + WAL 축소 (내용 해시 키라 TTL 없음)."""
+    return _extraction_cache().prune()
@@ -57,6 +57,7 @@ async function initAuth() {
 
             loadCollectHistory();
             loadDNAList();
+            resumeBlogJob();
         } else {
             // ── 비로그인 → 로그인 화면 ─────────────────────────
             document.getElementById('login-gate').classList.remove('hidden');
@@ -223,6 +224,7 @@ function renderCollectResult(data) {
         <div class="result-card">
             <div class="result-card-row"><span class="result-label">블로그 ID</span><span class="result-value">${data.blog_id}</span></div>
             <div class="result-card-row"><span class="result-label">수집 글 수</span><span class="result-value">${data.post_count}개</span></div>
+            ${data.incremental ? `<div class="result-card-row"><span class="result-label">새 글</span><span class="result-value">${data.new_post_count || 0}개</span></div>` : ''}
             <div class="result-card-row"><span class="result-label">총 글자 수</span><span class="result-value">${(data.total_chars || 0).toLocaleString()}자</span></div>
         </div>`;
 
@@ -469,8 +471,13 @@ async function generateBlog() {
         const res = await fetch(`${API}/api/blog/generate`, { method: 'POST', body: fd });
         const data = await res.json();
         if (!res.ok) throw new Error(data.error || '생성 실패');
-        renderWriteResult(data, dnaId);
+        // 새로고침해도 이어볼 수 있도록 작업 ID 보관
+        localStorage.setItem(BLOG_JOB_KEY, JSON.stringify({ jobId: data.job_id, dnaId }));
+        const result = await waitForBlogJob(data.job_id);
+        localStorage.removeItem(BLOG_JOB_KEY);
+        renderWriteResult(result, dnaId);
     } catch (err) {
+        localStorage.removeItem(BLOG_JOB_KEY);
         alert(err.message);
         document.getElementById('write-preview-empty').classList.remove('hidden');
     } finally {
@@ -479,6 +486,91 @@ async function generateBlog() {
     }
 }
 
+// ── 블로그 생성 작업 (job) 추적 ─────────────────────────────
+const BLOG_JOB_KEY = 'blogGenerateJob';
+let _activeJobSource = null;
+
+// SSE로 단계별 진행상황을 받고, 실패하면 폴링으로 전환. 완료 시 결과 반환
+function waitForBlogJob(jobId) {
+    showLoadingCancel(jobId);
+    return new Promise((resolve, reject) => {
+        let settled = false;
+        let pollTimer = null;
+
+        const finish = async () => {
+            if (settled) return;
+            settled = true;
+            if (_activeJobSource) { _activeJobSource.close(); _activeJobSource = null; }
+            clearInterval(pollTimer);
+            try {
+                const res = await fetch(`${API}/api/blog/jobs/${jobId}`);
+                const job = await res.json();
+                if (!res.ok) throw new Error(job.error || '작업 조회 실패');
+                if (job.status === 'done') resolve(job.result);
+                else reject(new Error(job.error || '생성 실패'));
+            } catch (e) {
+                reject(e);
+            }
+        };
+
+        const startPolling = () => {
+            if (pollTimer || settled) return;
+            pollTimer = setInterval(async () => {
+                try {
+                    const res = await fetch(`${API}/api/blog/jobs/${jobId}`);
+                    const job = await res.json();
+                    if (!res.ok) { clearInterval(pollTimer); settled = true; reject(new Error(job.error || '작업 조회 실패')); return; }
+                    updateLoadingModal(job.message, job.progress);
+                    if (['done', 'failed', 'cancelled'].includes(job.status)) finish();
+                } catch { /* 네트워크 일시 오류 — 다음 주기에 재시도 */ }
+            }, 2000);
+        };
+
+        if (!window.EventSource) { startPolling(); return; }
+
+        const es = new EventSource(`${API}/api/blog/jobs/${jobId}/events`);
+        _activeJobSource = es;
+        resetLoadingDraft();
+        es.addEventListener('stage', e => {
+            const d = JSON.parse(e.data);
+            updateLoadingModal(d.message, d.progress);
+        });
+        es.addEventListener('draft', e => appendLoadingDraft(JSON.parse(e.data).text));
+        es.addEventListener('end', () => finish());
+        es.onerror = () => {
+            // 서버가 주기적으로 연결을 닫으면 EventSource가 자동 재연결한다.
+            // 연결 자체가 불가능한 경우(CLOSED)에만 폴링으로 전환
+            if (es.readyState === EventSource.CLOSED) {
+                _activeJobSource = null;
+                startPolling();
+            }
+        };
+    });
+}
+
+// 새로고침 전에 시작한 생성 작업이 있으면 이어서 결과 표시
+async function resumeBlogJob() {
+    let saved = null;
+    try { saved = JSON.parse(localStorage.getItem(BLOG_JOB_KEY) || 'null'); } catch { saved = null; }
+    if (!saved || !saved.jobId) return;
+
+    const form = document.getElementById('write-form');
+    goToPanel('write');
+    setFormLoading(form, true);
+    showLoadingModal();
+    try {
+        const result = await waitForBlogJob(saved.jobId);
+        document.getElementById('write-preview-empty').classList.add('hidden');
+        renderWriteResult(result, saved.dnaId || '');
+    } catch (err) {
+        console.warn('이전 생성 작업 복구 실패:', err.message);
+    } finally {
+        localStorage.removeItem(BLOG_JOB_KEY);
+        hideLoadingModal();
+        setFormLoading(form, false);
+    }
+}
+
 function renderWriteResult(data, dnaId) {
     const versions = data.versions || [];
     window._lastVersions = versions;
@@ -1100,7 +1192,8 @@ async function saveVersion(idx) {
 
 async function loadDNAList() {
     try {
-        const res = await fetch(`${API}/api/mypage/dna`);
+        // 블로그별 최신 DNA만 서버에서 골라 받음
+        const res = await fetch(`${API}/api/mypage/dna?latest=1&limit=200`);
         const data = await res.json();
         const items = data.items || [];
 
@@ -1329,14 +1422,12 @@ async function loadDBPanel() {
     listEl.innerHTML = `<div class="loading-hint">불러오는 중...</div>`;
 
     try {
-        const [colRes, dnaRes, blogRes] = await Promise.all([
+        const [colRes, dnaData, blogData] = await Promise.all([
             fetch(`${API}/api/blog/collections`),
-            fetch(`${API}/api/mypage/dna`),
-            fetch(`${API}/api/mypage/blogs`)
+            fetchAllPages('/api/mypage/dna'),
+            fetchAllPages('/api/mypage/blogs')
         ]);
         const colData  = await colRes.json();
-        const dnaData  = await dnaRes.json();
-        const blogData = await blogRes.json();
 
         // blog_id 기준으로 그룹화
         const groups = {};
@@ -1391,6 +1482,21 @@ async function loadDBPanel() {
     }
 }
 
+// /api/mypage 목록은 커서 페이지 단위 — next_cursor를 따라가며 전부 모음
+async function fetchAllPages(path, limit = 200) {
+    const items = [];
+    let cursor = '';
+    do {
+        const sep = path.includes('?') ? '&' : '?';
+        const res = await fetch(`${API}${path}${sep}limit=${limit}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`);
+        const data = await res.json();
+        if (!res.ok) throw new Error(data.error || '목록 조회 실패');
+        items.push(...(data.items || []));
+        cursor = data.next_cursor || '';
+    } while (cursor);
+    return { items };
+}
+
 function renderDBCard(g) {
     const col = g.collections[0] || {};
     const dnaCount = g.dnas.length;
@@ -1796,7 +1902,55 @@ function showLoadingModal() {
     }, 600);
 }
 
+// 서버에서 받은 실제 단계/진행률로 모달 갱신 (자동 순환 메시지 대신)
+function updateLoadingModal(message, progress) {
+    if (message) {
+        clearInterval(_loadingStepTimer);
+        document.getElementById('loading-step').textContent = message;
+    }
+    if (typeof progress === 'number' && progress > _loadingProgress) {
+        _loadingProgress = progress;
+        document.getElementById('loading-bar').style.width = progress + '%';
+    }
+}
+
+// 생성 중 스트리밍되는 초안 (모델 원문 JSON에서 줄바꿈/따옴표 이스케이프만 풀어서 표시)
+let _loadingDraftRaw = '';
+const LOADING_DRAFT_TAIL = 1200;
+
+function resetLoadingDraft() {
+    _loadingDraftRaw = '';
+    const el = document.getElementById('loading-draft');
+    el.textContent = '';
+    el.classList.add('hidden');
+}
+
+function appendLoadingDraft(text) {
+    if (!text) return;
+    _loadingDraftRaw += text;
+    const el = document.getElementById('loading-draft');
+    el.classList.remove('hidden');
+    el.textContent = _loadingDraftRaw.slice(-LOADING_DRAFT_TAIL)
+        .replace(/\\n/g, '\n')
+        .replace(/\\"/g, '"');
+}
+
+function showLoadingCancel(jobId) {
+    const btn = document.getElementById('loading-cancel');
+    btn.disabled = false;
+    btn.classList.remove('hidden');
+    btn.onclick = async () => {
+        btn.disabled = true;
+        try {
+            await fetch(`${API}/api/blog/jobs/${jobId}/cancel`, { method: 'POST' });
+        } catch { btn.disabled = false; }
+    };
+}
+
 function hideLoadingModal() {
+    const cancelBtn = document.getElementById('loading-cancel');
+    cancelBtn.classList.add('hidden');
+    cancelBtn.onclick = null;
     clearInterval(_loadingEmojiTimer);
     clearInterval(_loadingStepTimer);
     clearInterval(_loadingBarTimer);
@@ -1807,6 +1961,7 @@ function hideLoadingModal() {
     setTimeout(() => {
         document.getElementById('loading-modal').classList.add('hidden');
         if (bar) bar.style.width = '0%';
+        resetLoadingDraft();
     }, 400);
 }
 
@@ -8,30 +8,40 @@ import sys
 import os
 import json
 import io
+import multiprocessing
 import tempfile
+import time as _time
+
+# 기동 단계별 시간 측정 기준점 (startup.status() / GET /api/ready)
+_STARTUP_T0 = _time.perf_counter()
+
+from pathlib import Path
+from datetime import datetime
+import re
+from typing import TYPE_CHECKING
+
+# Windows 터미널 UTF-8 출력 설정
+if sys.platform == 'win32' and not isinstance(sys.stdout, io.TextIOWrapper):
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+# 시작 프로파일: python app.py --profile-startup (import 시간 리포트만 출력하고 종료)
+if __name__ == '__main__' and '--profile-startup' in sys.argv[1:]:
+    from startup import profile_startup
+    sys.exit(profile_startup())
+
 try:
     import truststore
     truststore.inject_into_ssl()
 except ImportError:
     pass  # Linux/Mac — 시스템 인증서 사용
-from pathlib import Path
-from datetime import datetime
-from flask import Flask, request, jsonify, send_from_directory, session, redirect, url_for
+from flask import Flask, Response, request, jsonify, send_from_directory, session, redirect, stream_with_context, url_for
 from flask_cors import CORS
-from authlib.integrations.flask_client import OAuth
 from functools import wraps
-import pdfplumber
-import requests as http_requests
-import docx
-import fitz  # PyMuPDF
-import re
-import time as _time
-import statistics as _stats
-from collections import Counter as _Counter
 
-# Windows 터미널 UTF-8 출력 설정
-if sys.platform == 'win32' and not isinstance(sys.stdout, io.TextIOWrapper):
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+# 무거운 파서/SDK(pdfplumber, fitz, docx, requests, google.genai, authlib)는 사용하는 함수 안에서 import
+# — 서버 기동을 막지 않도록 하고, 기동 후 warm-up 스레드가 미리 불러온다 (startup.PRELOAD_MODULES)
+if TYPE_CHECKING:
+    from google import genai
 
 # 프로젝트 루트 설정
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -78,14 +88,14 @@ if _app_root:
 # 세션 시크릿 키 (SSO용)
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
 
-# OAuth 설정
-oauth = OAuth(app)
-
 # Google OAuth 설정 (환경 변수에서 로드)
 GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
 GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
 
 if GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET:
+    # authlib은 SSO를 쓸 때만 로드
+    from authlib.integrations.flask_client import OAuth
+    oauth = OAuth(app)
     google = oauth.register(
         name='google',
         client_id=GOOGLE_CLIENT_ID,
@@ -101,6 +111,7 @@ if GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET:
     SSO_ENABLED = True
     print("[OK] Google OAuth SSO 활성화됨")
 else:
+    oauth = None
     google = None
     SSO_ENABLED = False
     print("[INFO] Google OAuth 미설정 (GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET 환경 변수 필요)")
@@ -147,28 +158,43 @@ BUSINESS_DIR.mkdir(parents=True, exist_ok=True)
 CALIBRATIONS_DIR = OUTPUT_DIR / "calibrations"
 CALIBRATIONS_DIR.mkdir(parents=True, exist_ok=True)
 
-# 생성 파일 TTL 정리 (30일 초과 BLOG_*.json/.md 삭제)
-_ttl_cutoff = _time.time() - 30 * 86400
-for _f in OUTPUT_DIR.glob("BLOG_*"):
-    try:
-        if _f.stat().st_mtime < _ttl_cutoff:
-            _f.unlink()
-    except Exception:
-        pass
+# 보관 기간 — 백그라운드 유지보수 스케줄러(maintenance.py)가 주기적으로 정리
+GENERATED_TTL_DAYS = 30  # BLOG_*.json/.md
+UPLOADS_TTL_DAYS = int(os.getenv("UPLOADS_TTL_DAYS", "30"))  # web/uploads (이전 방식 추출 이미지)
+TEMP_FILE_TTL_HOURS = float(os.getenv("TEMP_FILE_TTL_HOURS", "6"))  # 비정상 종료로 남은 임시 업로드
+ARTIFACT_KEEP_VERSIONS = int(os.getenv("ARTIFACT_KEEP_VERSIONS", "3"))  # 블로그별 DNA / 템플릿별 보정 기록
+ARTIFACT_TTL_DAYS = int(os.getenv("ARTIFACT_TTL_DAYS", "90"))  # 최신 N개 밖의 버전은 이 기간 뒤 삭제
+# URL 본문 다운로드 상한 (PDF 포함, HTML은 html_text.HTML_MAX_BYTES까지만 파싱)
+FETCH_URL_MAX_BYTES = int(float(os.getenv("FETCH_URL_MAX_MB", "20")) * 1024 * 1024)
+# URL에서 가져오는 텍스트 예산 (프롬프트에 넣는 분량)
+URL_TEXT_MAX_CHARS = int(os.getenv("URL_TEXT_MAX_CHARS", "10000"))
+URL_PDF_MAX_PAGES = int(os.getenv("URL_PDF_MAX_PAGES", "15"))
+# 임시 파일 접두사 (유지보수 작업이 남은 파일을 찾을 수 있도록)
+TEMP_PREFIX = "mcpweb_"
 
 # blog_pull 모듈 경로 추가
 sys.path.insert(0, str(PROJECT_ROOT / "blog_pull"))
 # web/ 폴더도 sys.path에 추가 (run_crawler.py 등 web/ 내 모듈 import용)
 sys.path.insert(0, str(Path(__file__).parent))
 
-# 스타일 템플릿 로드
+import startup as _startup
+_startup.begin(_STARTUP_T0)
+_startup.mark("bootstrap")
+
+# 스타일 템플릿 (첫 사용 또는 warm-up 때 로드)
 _STYLE_TEMPLATES_PATH = Path(__file__).parent / "style_templates.json"
-with open(_STYLE_TEMPLATES_PATH, 'r', encoding='utf-8') as _f:
-    STYLE_TEMPLATES: list[dict] = json.load(_f)
-_STYLE_TEMPLATES_MAP: dict[str, dict] = {t["id"]: t for t in STYLE_TEMPLATES}
+_style_templates_cache: tuple[list[dict], dict[str, dict]] | None = None
+
+
+def _load_style_templates() -> tuple[list[dict], dict[str, dict]]:
+    """(템플릿 목록, id → 템플릿) — style_templates.json을 한 번만 읽는다."""
+    global _style_templates_cache
+    if _style_templates_cache is None:
+        with open(_STYLE_TEMPLATES_PATH, 'r', encoding='utf-8') as f:
+            templates: list[dict] = json.load(f)
+        _style_templates_cache = (templates, {t["id"]: t for t in templates})
+    return _style_templates_cache
 
-# Google Gemini API 클라이언트
-from google import genai
 
 def _normalize_naver_blog_url(url: str) -> str:
     """네이버 블로그 URL을 PostView URL로 변환 (JS 렌더링 우회)"""
@@ -184,7 +210,7 @@ def _normalize_naver_blog_url(url: str) -> str:
 
 
 def fetch_url_text(url: str) -> str:
-    """URL에서 텍스트 추출 (HTML 페이지 or PDF URL)"""
+    """URL에서 텍스트 추출 (HTML 페이지 or PDF URL) — 응답은 HTTP 캐시(http_cache)를 거친다"""
     # 네이버 블로그는 JS 렌더링 — PostView URL로 변환
     fetch_url = _normalize_naver_blog_url(url)
 
@@ -194,37 +220,22 @@ def fetch_url_text(url: str) -> str:
         'Referer': 'https://blog.naver.com/',
     }
     try:
-        resp = http_requests.get(fetch_url, headers=headers, timeout=20, stream=True)
+        resp = get_http_cache().get(fetch_url, headers=headers, timeout=20, max_bytes=FETCH_URL_MAX_BYTES)
         resp.raise_for_status()
         content_type = resp.headers.get('Content-Type', '')
 
         if 'application/pdf' in content_type or url.lower().endswith('.pdf'):
-            # PDF URL → 임시 파일로 저장 후 pdfplumber 추출
-            import pdfplumber
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    tmp.write(chunk)
-                tmp_path = Path(tmp.name)
-            try:
-                with pdfplumber.open(tmp_path) as pdf:
-                    pages = [p.extract_text() or '' for p in pdf.pages[:15]]
-                    return '\n'.join(pages)[:10000]
-            finally:
-                tmp_path.unlink(missing_ok=True)
+            if getattr(resp, "truncated", False):
+                raise ValueError(f"PDF가 너무 큽니다 (최대 {FETCH_URL_MAX_BYTES // (1024 * 1024)}MB)")
+            # PDF URL → 메모리에서 바로 추출 (업로드 파일과 같은 pdf_extract 경로, OCR 폴백 포함)
+            return extract_pdf_text(resp.content, max_pages=URL_PDF_MAX_PAGES, max_chars=URL_TEXT_MAX_CHARS)
         else:
-            # HTML 페이지 → 태그 제거 후 텍스트 추출
-            html = resp.text
-            # script/style 제거
-            html = re.sub(r'<(script|style)[^>]*>.*?</(script|style)>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            # HTML 태그 제거
-            text = re.sub(r'<[^>]+>', ' ', html)
-            # 연속 공백/줄바꿈 정리
-            text = re.sub(r'[ \t]+', ' ', text)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            text = text.strip()
+            # HTML 페이지 → 조각 단위로 파싱, 본문 컨테이너 우선, URL_TEXT_MAX_CHARS자 모이면 중단
+            text = html_to_text(resp.iter_content(chunk_size=16 * 1024), encoding=resp.encoding,
+                                max_chars=URL_TEXT_MAX_CHARS)
             if len(text) < 100:
                 raise ValueError(f"추출된 텍스트가 너무 짧습니다 ({len(text)}자). JS 렌더링 페이지일 수 있습니다.")
-            return text[:10000]
+            return text
     except ValueError:
         raise
     except Exception as e:
@@ -304,34 +315,71 @@ from blog_storage import (
     update_blog_package_version,
 )
 from material_pipeline import build_material_bundle, build_material_bundle_from_paths
+from ingestion import ingest_files, timing_report as ingest_timing_report
+from http_cache import get_http_cache
+from html_text import html_to_text
+from pdf_extract import extract_pdf_text
+from llm_gateway import (
+    generate as llm_generate, stats as llm_cache_stats, prune as llm_cache_prune,
+    get_client as get_gemini_client, client_health as gemini_client_health,
+)
 from offline_engines import generate_blog_versions_offline
+import job_queue as _job_queue
+import gemini_files as _gemini_files
+from image_store import get_store as get_image_store, find_media_urls, GC_INTERVAL_SEC as MEDIA_GC_INTERVAL_SEC
+from maintenance import get_scheduler as get_maintenance_scheduler, sweep_files, prune_versions
+from dna_prompt import get_artifact as get_dna_artifact, empty_artifact as empty_dna_artifact
+from collection_index import get_index as get_collection_index
+from catalog_index import get_catalog
+from blog_stats import (
+    get_blog_stats, ensure_metrics as ensure_blog_metrics,
+    render_measured as render_blog_measured, render_visual as render_blog_visual,
+)
+from job_queue import JobCancelled, JobFailed
+_startup.mark("modules")
+
+# 블로그 생성 작업 큐 (요청 스레드와 분리된 워커 풀)
+JOBS_DIR = OUTPUT_DIR / "jobs"
+JOB_SSE_WINDOW = 25  # SSE 연결 1회 유지 시간(초)
+# 생성 스트리밍 조각을 묶어 보내는 간격 (초)
+STREAM_FLUSH_SEC = 0.3
+_job_queue.configure(JOBS_DIR)
 
 
 UPLOADS_DIR = Path(__file__).parent / "uploads"
 UPLOADS_DIR.mkdir(exist_ok=True)
+# 콘텐츠 주소 이미지 저장소 (/media/... 로 서빙, 내용이 같으면 URL도 같음)
+MEDIA_DIR = OUTPUT_DIR / "media"
+MEDIA_URL = "/media"
+MEDIA_CACHE_SECONDS = 365 * 86400
 
 
 def save_uploaded_file(file) -> Path:
     """업로드된 파일을 임시 저장"""
     ext = Path(file.filename).suffix.lower()
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=ext)
+    temp_file = tempfile.NamedTemporaryFile(delete=False, prefix=TEMP_PREFIX, suffix=ext)
     file.save(temp_file.name)
     return Path(temp_file.name)
 
 
 def extract_images_from_file(path: Path) -> list[str]:
-    """파일에서 이미지를 추출해 uploads/에 저장, URL 경로 목록 반환"""
-    import uuid
+    """
+    파일에서 이미지를 추출해 이미지 저장소에 저장, URL 경로 목록 반환.
+    같은 이미지는 내용 해시로 한 번만 저장되고 URL도 항상 같다 (같은 자료 재업로드 시 디스크 증가 없음).
+    """
     ext = path.suffix.lower()
+    store = get_image_store(MEDIA_DIR, MEDIA_URL)
     saved = []
 
+    def _put(img_bytes: bytes, img_ext: str | None = None):
+        url = store.put(img_bytes, kind="extracted", ext=img_ext)["url"]
+        if url not in saved:
+            saved.append(url)
+
     try:
         # ── 이미지 파일 자체 ──────────────────────────
         if ext in {'.jpg', '.jpeg', '.png', '.gif', '.webp'}:
-            uid = uuid.uuid4().hex[:12]
-            dst = UPLOADS_DIR / f"{uid}{ext}"
-            import shutil; shutil.copy2(path, dst)
-            saved.append(f"/uploads/{dst.name}")
+            _put(path.read_bytes(), ext)
 
         # ── PDF → PyMuPDF ────────────────────────────
         elif ext == '.pdf':
@@ -347,10 +395,7 @@ def extract_images_from_file(path: Path) -> list[str]:
                     # 너무 작은 이미지(아이콘 등) 제외
                     if len(img_bytes) < 10_000:
                         continue
-                    uid = uuid.uuid4().hex[:12]
-                    dst = UPLOADS_DIR / f"{uid}.{img_ext}"
-                    dst.write_bytes(img_bytes)
-                    saved.append(f"/uploads/{dst.name}")
+                    _put(img_bytes, img_ext)
             doc.close()
 
         # ── DOCX → python-docx ───────────────────────
@@ -367,11 +412,7 @@ def extract_images_from_file(path: Path) -> list[str]:
                         img_bytes = zf.read(name)
                         if len(img_bytes) < 10_000:
                             continue
-                        uid = uuid.uuid4().hex[:12]
-                        save_ext = img_ext if img_ext != '.jpeg' else '.jpg'
-                        dst = UPLOADS_DIR / f"{uid}{save_ext}"
-                        dst.write_bytes(img_bytes)
-                        saved.append(f"/uploads/{dst.name}")
+                        _put(img_bytes, img_ext)
 
     except Exception as e:
         print(f"[WARN] 이미지 추출 실패 ({path.name}): {e}")
@@ -379,32 +420,9 @@ def extract_images_from_file(path: Path) -> list[str]:
     return saved
 
 
-def upload_to_gemini(path: Path, client: genai.Client):
-    """Gemini File API에 파일 업로드 (PDF / 이미지 네이티브 지원)"""
-    MIME_MAP = {
-        '.pdf':  'application/pdf',
-        '.jpg':  'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.png':  'image/png',
-        '.gif':  'image/gif',
-        '.webp': 'image/webp',
-    }
-    ext = path.suffix.lower()
-    mime_type = MIME_MAP.get(ext)
-    if not mime_type:
-        print(f"[INFO] {ext} → 텍스트 추출 방식 사용")
-        return None
-    try:
-        from google.genai import types as _gtypes
-        gfile = client.files.upload(
-            file=str(path),
-            config=_gtypes.UploadFileConfig(mime_type=mime_type),
-        )
-        print(f"[OK] Gemini 파일 업로드: {path.name} → {gfile.name}")
-        return gfile
-    except Exception as e:
-        print(f"[WARN] Gemini 파일 업로드 실패 ({path.name}): {e}")
-        return None
+def upload_to_gemini(path: Path, client: "genai.Client"):
+    """Gemini File API에 파일 업로드 (PDF / 이미지 네이티브 지원, 내용 해시 기준 재사용)"""
+    return _gemini_files.upload(client, path)
 
 
 # ============================================================
@@ -585,6 +603,45 @@ def delete_allowed_email(email):
     return jsonify({"message": f"{email} 제거됨", "emails": sorted(emails)})
 
 
+@app.route('/api/admin/cache-stats', methods=['GET'])
+@login_required
+def get_cache_stats():
+    """LLM 응답 캐시 엔드포인트별 hit율 + 파일 텍스트 추출 캐시 + URL 응답 캐시 + 공유 Gemini 클라이언트 상태 + 이미지 저장소 사용량"""
+    from utils import extraction_cache_stats
+    return jsonify({
+        "llm": llm_cache_stats(),
+        "extraction": extraction_cache_stats(),
+        "http": get_http_cache().stats(),
+        "gemini_client": gemini_client_health(force=request.args.get("check") == "1"),
+        "media": get_image_store(MEDIA_DIR, MEDIA_URL).stats(),
+    })
+
+
+@app.route('/api/admin/maintenance', methods=['GET'])
+@login_required
+def get_maintenance_status():
+    """유지보수 작업별 간격/예산/마지막 실행 결과"""
+    return jsonify(get_maintenance_scheduler().status())
+
+
+@app.route('/api/admin/maintenance/<name>/run', methods=['POST'])
+@login_required
+def run_maintenance_task(name):
+    """유지보수 작업 즉시 실행 예약"""
+    task = get_maintenance_scheduler().run_now(name)
+    if task is None:
+        return jsonify({"error": f"알 수 없는 유지보수 작업입니다: {name}"}), 404
+    print(f"[ADMIN] 유지보수 작업 실행 요청: {name} (by {session.get('user', {}).get('email', '')})")
+    return jsonify(task), 202
+
+
+@app.route('/api/ready', methods=['GET'])
+def readiness():
+    """기동 warm-up 완료 여부 (로그인 불필요 — systemd/nginx 헬스체크용). 준비 전에는 503."""
+    state = _startup.status()
+    return jsonify(state), (200 if state["ready"] else 503)
+
+
 # ============================================================
 # Static Files (Frontend)
 # ============================================================
@@ -606,6 +663,18 @@ def index():
 def serve_upload(filename):
     return send_from_directory(str(UPLOADS_DIR), filename)
 
+@app.route(f'{MEDIA_URL}/<path:name>')
+def serve_media(name):
+    """이미지 저장소 파일 — 파일명이 내용 해시라 변하지 않으므로 immutable 캐시"""
+    path = get_image_store(MEDIA_DIR, MEDIA_URL).resolve(name)
+    if path is None:
+        return jsonify({"error": "not found"}), 404
+    resp = send_from_directory(str(path.parent), path.name, max_age=MEDIA_CACHE_SECONDS,
+                               etag=False, conditional=False)
+    resp.set_etag(path.stem)
+    resp.headers['Cache-Control'] = f'public, max-age={MEDIA_CACHE_SECONDS}, immutable'
+    return resp.make_conditional(request)
+
 @app.route('/<path:filename>')
 def static_files(filename):
     resp = send_from_directory('.', filename)
@@ -622,7 +691,8 @@ def static_files(filename):
 @app.route('/api/style-templates', methods=['GET'])
 def get_style_templates():
     """10가지 블로그 스타일 템플릿 목록 반환"""
-    return jsonify({"templates": STYLE_TEMPLATES})
+    templates, _ = _load_style_templates()
+    return jsonify({"templates": templates})
 
 
 # 페르소나 기능은 C:\work\email-persona 프로젝트로 이전됨
@@ -660,226 +730,136 @@ def blog_dna_preview():
     if not blog_id:
         return jsonify({"error": "blog_id 필요"}), 400
 
-    dna_analysis = None
-    if DNA_DIR.exists():
-        candidates = sorted(
-            [f for f in DNA_DIR.glob(f"DNA_{blog_id}_*.json")],
-            key=lambda f: f.stat().st_mtime, reverse=True
-        )
-        if candidates:
-            with open(candidates[0], 'r', encoding='utf-8') as f:
-                dna_analysis = json.load(f)
-
-    # 원본 글 샘플 1개 로드
-    sample_post = None
-    if BLOG_COLLECTIONS_DIR.exists():
-        all_posts = []
-        for item in BLOG_COLLECTIONS_DIR.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                data_file = item / "_data.json"
-                if data_file.exists():
-                    try:
-                        with open(data_file, 'r', encoding='utf-8') as f:
-                            col = json.load(f)
-                        if col.get("blog_id") == blog_id:
-                            all_posts.extend(col.get("posts", []))
-                    except Exception:
-                        pass
-        all_posts.sort(key=lambda x: x.get('addDate', ''), reverse=True)
-        seen = set()
-        for p in all_posts:
-            if p.get("url") not in seen:
-                seen.add(p.get("url"))
-                if p.get("content", "").strip():
-                    sample_post = p
-                    break
+    # DNA 파일 + 샘플 글 + 미리보기 텍스트는 생성 API와 같은 아티팩트 캐시에서 가져옴
+    artifact = get_dna_artifact(DNA_DIR, blog_id, _collection_index())
+    dna_analysis = artifact["dna_analysis"]
+    sample_post = artifact["sample_post"]
 
     if not dna_analysis and not sample_post:
         return jsonify({"error": "DNA 분석 결과 없음. 먼저 글쓰기 DNA 분석을 실행하세요."}), 404
 
-    # 미리보기 텍스트 구성
-    lines = []
-    if dna_analysis:
-        c1 = dna_analysis.get("c1_template_structure", {})
-        c2 = dna_analysis.get("c2_tone_mood", {})
-        c3 = dna_analysis.get("c3_speech_style", {})
-        c5 = dna_analysis.get("c5_frequent_expressions", {})
-        c6 = dna_analysis.get("c6_sentence_patterns", {})
-        c9 = dna_analysis.get("c9_opening_closing", {})
-        c10 = dna_analysis.get("c10_visual_formatting", {})
-
-        lines.append("▌ 글 구조 패턴")
-        lines.append(f"  {c1.get('overall_pattern', '-')}")
-        if c1.get('section_flow'):
-            lines.append("  흐름: " + " → ".join(c1['section_flow'])[:120])
-
-        lines.append("")
-        lines.append("▌ 톤 & 어투")
-        lines.append(f"  톤: {c2.get('primary_tone', '-')}  /  격식도: {c2.get('formality_level', '-')}/10")
-        lines.append(f"  종결어미: {', '.join(c3.get('ending_patterns', []))}")
-        lines.append(f"  독자 호칭: {c3.get('reader_address', '-')}")
-
-        lines.append("")
-        lines.append("▌ 이모지 & 특수기호")
-        emoji_list = ', '.join(c10.get('emoji_types', []))
-        lines.append(f"  이모지({c10.get('emoji_usage', '-')}/10): {emoji_list}")
-        special = c10.get('special_symbols', c10.get('special_formatting', []))
-        if special:
-            lines.append(f"  특수기호: {', '.join(special)}")
-
-        c11 = dna_analysis.get("c11_length_stats", {})
-        c12 = dna_analysis.get("c12_typography", {})
-        c13 = dna_analysis.get("c13_brackets_quotes", {})
-        c14 = dna_analysis.get("c14_title_patterns", {})
-
-        lines.append("")
-        lines.append("▌ 시각적 포맷팅 (HTML 분석)")
-        lines.append(f"  중앙정렬: {c10.get('center_align', '-')}")
-        lines.append(f"  볼드 패턴: {c10.get('bold_pattern', '-')}")
-        lines.append(f"  이탤릭: {c10.get('italic_usage', '-')}")
-        lines.append(f"  줄바꿈: {c10.get('line_break_style', '-')}")
-        if c10.get('text_colors'):
-            lines.append(f"  강조 색상: {', '.join(c10['text_colors'][:4])}")
-        if c10.get('highlight_colors'):
-            lines.append(f"  하이라이트: {', '.join(c10['highlight_colors'][:3])}")
-        if c10.get('writing_guide'):
-            lines.append(f"\n  작성 가이드: {c10['writing_guide']}")
-
-        if c11:
-            lines.append("")
-            lines.append("▌ 글자수/분량")
-            lines.append(f"  글당 평균 글자수: {c11.get('avg_chars_per_post', '-')}")
-            lines.append(f"  평균 문장 수: {c11.get('avg_sentences_per_post', '-')} / 문장당: {c11.get('avg_chars_per_sentence', '-')}")
-            lines.append(f"  서론:본론:결론 = {c11.get('content_ratio', '-')}")
-            if c11.get('writing_density_guide'):
-                lines.append(f"  분량 지침: {c11['writing_density_guide']}")
-
-        if c12:
-            lines.append("")
-            lines.append("▌ 폰트/글꼴 스타일")
-            if c12.get('font_families'):
-                lines.append(f"  폰트: {', '.join(c12['font_families'])}")
-            lines.append(f"  본문 크기: {c12.get('base_font_size', '-')} / 소제목: {c12.get('heading_font_size', '-')}")
-            lines.append(f"  볼드 빈도: {c12.get('bold_frequency', '-')}/10  목적: {c12.get('bold_purpose', '-')}")
-            lines.append(f"  기울임: {c12.get('italic_usage', '-')} / 밑줄: {c12.get('underline_usage', '-')}")
-            if c12.get('font_guide'):
-                lines.append(f"  글꼴 지침: {c12['font_guide']}")
-
-        if c13:
-            lines.append("")
-            lines.append("▌ 꺽쇠/괄호/인용부호")
-            if c13.get('angle_bracket_types'):
-                lines.append(f"  꺽쇠 종류: {', '.join(c13['angle_bracket_types'])}  빈도: {c13.get('angle_bracket_frequency', '-')}")
-                lines.append(f"  꺽쇠 목적: {c13.get('angle_bracket_purpose', '-')}")
-            if c13.get('square_bracket_types'):
-                lines.append(f"  대괄호: {', '.join(c13['square_bracket_types'])}  목적: {c13.get('square_bracket_purpose', '-')}")
-            lines.append(f"  소괄호 패턴: {c13.get('round_bracket_usage', '-')}")
-            lines.append(f"  따옴표 방식: {c13.get('quotation_mark_style', '-')}")
-            if c13.get('examples'):
-                for ex in c13['examples'][:2]:
-                    lines.append(f"    예: {ex}")
-
-        if c14:
-            lines.append("")
-            lines.append("▌ 제목 패턴")
-            lines.append(f"  평균 길이: {c14.get('avg_title_length', '-')}  구조: {c14.get('title_structure', '-')}")
-            lines.append(f"  숫자 활용: {c14.get('number_usage', '-')} / 감정 후크: {c14.get('emotion_hook', '-')}")
-            if c14.get('examples'):
-                for ex in c14['examples'][:3]:
-                    lines.append(f"    {ex}")
-
-        lines.append("")
-        lines.append("▌ 시그니처 표현")
-        for phrase in c5.get('signature_phrases', [])[:6]:
-            lines.append(f"  • {phrase}")
-
-        lines.append("")
-        lines.append("▌ 도입부 예시")
-        for ex in c9.get('opening_examples', [])[:2]:
-            lines.append(f"  {ex}")
-
-        lines.append("")
-        lines.append("▌ 마무리 예시")
-        for ex in c9.get('closing_examples', [])[:2]:
-            lines.append(f"  {ex}")
-
-    if sample_post:
-        lines.append("")
-        lines.append("━" * 36)
-        lines.append(f"▌ 실제 글 샘플 (AI가 모방하는 글)")
-        lines.append(f"  제목: {sample_post.get('title', '')}")
-        lines.append(f"  날짜: {sample_post.get('addDate', '')}")
-        lines.append("")
-        lines.append(sample_post.get('content', '')[:1800])
-
-    # c10 시각 스타일 → JS가 HTML 변환에 쓸 구조화 데이터
-    dna_styles = {}
-    if dna_analysis:
-        c10 = dna_analysis.get("c10_visual_formatting", {})
-        # 폰트 패밀리 (Naver CSS font-family 값)
-        raw_font = c10.get("font_family", "")
-        font_map = {
-            "나눔마루부리": "NanumMyeongjo, '나눔마루부리', serif",
-            "나눔고딕": "'나눔고딕', NanumGothic, sans-serif",
-            "나눔명조": "NanumMyeongjo, '나눔명조', serif",
-            "맑은 고딕": "'맑은 고딕', MalgunGothic, sans-serif",
-            "돋움": "Dotum, '돋움', sans-serif",
-            "굴림": "Gulim, '굴림', sans-serif",
-        }
-        css_font = font_map.get(raw_font, font_map.get(raw_font.split()[0], "'맑은 고딕', sans-serif"))
-
-        # 중앙정렬 비율 파싱 (숫자 or "57%" 형태 모두 처리)
-        center_raw = c10.get("center_align", "0")
-        try:
-            center_val = float(str(center_raw).replace("%", "").strip())
-            if center_val > 1:
-                center_val = center_val / 100
-        except Exception:
-            center_val = 0.0
-
-        # 강조 색상 (첫번째 유효색)
-        text_colors = c10.get("text_colors", [])
-        accent_color = text_colors[0] if text_colors else ""
-        highlight_colors = c10.get("highlight_colors", [])
-        highlight_color = highlight_colors[0] if highlight_colors else ""
-
-        dna_styles = {
-            "font_family": css_font,
-            "center_align_ratio": center_val,
-            "accent_color": accent_color,
-            "highlight_color": highlight_color,
-            "has_italic": bool(c10.get("italic_usage", "")),
-            "has_quote": bool(c10.get("quote_style", "")),
-            "font_size_body": "11pt",
-            "font_size_heading": "14pt",
-        }
-
     return jsonify({
         "blog_id": blog_id,
-        "preview_text": "\n".join(lines),
+        "preview_text": artifact["preview_text"],
         "has_dna_analysis": dna_analysis is not None,
         "sample_title": sample_post.get("title", "") if sample_post else "",
-        "dna_styles": dna_styles,
+        "dna_styles": artifact["preview_styles"],
     })
 
 
 @app.route('/api/blog/generate', methods=['POST'])
 @login_required
 def generate_blog():
-    """스타일 템플릿 기반 블로그 글 생성 (통합 DNA 데이터 지원)"""
-    style_template_id = request.form.get("style_template_id", "informational")
+    """스타일 템플릿 기반 블로그 글 생성 — 작업 큐에 등록하고 job_id를 즉시 반환"""
     keywords_str = request.form.get("keywords", "")
-    keywords = [k.strip() for k in keywords_str.split(",") if k.strip()]
-    blog_dna_id = request.form.get("blog_dna_id", "")
-    target_audience = request.form.get("target_audience", "일반 독자")
-    content_angle = request.form.get("content_angle", "정보전달형")
-    direct_text = request.form.get("press_release", "")
-    press_url = request.form.get("press_url", "").strip()
-    reference_blog_url = request.form.get("reference_blog_url", "").strip()
     try:
         active_tags = json.loads(request.form.get("active_tags", "[]"))
     except Exception:
         active_tags = []
+    params = {
+        "style_template_id": request.form.get("style_template_id", "informational"),
+        "keywords": [k.strip() for k in keywords_str.split(",") if k.strip()],
+        "blog_dna_id": request.form.get("blog_dna_id", ""),
+        "target_audience": request.form.get("target_audience", "일반 독자"),
+        "content_angle": request.form.get("content_angle", "정보전달형"),
+        "press_release": request.form.get("press_release", ""),
+        "press_url": request.form.get("press_url", "").strip(),
+        "reference_blog_url": request.form.get("reference_blog_url", "").strip(),
+        "active_tags": active_tags,
+    }
+
+    uploaded_files = [file for file in request.files.getlist("files") if file and file.filename]
+    if not uploaded_files and 'file' in request.files and request.files['file'].filename:
+        uploaded_files = [request.files['file']]
+
+    if not uploaded_files and not params["press_release"].strip() and not params["press_url"]:
+        return jsonify({"error": "보도자료 내용이 필요합니다."}), 400
+
+    # 업로드 스트림은 요청이 끝나면 닫히므로 임시 파일로만 옮겨두고 나머지는 워커에서 처리
+    uploads = []
+    try:
+        for file in uploaded_files:
+            uploads.append({"name": file.filename, "path": str(save_uploaded_file(file))})
+    except Exception as e:
+        _discard_uploads(uploads)
+        return jsonify({"error": f"파일 처리 실패: {str(e)}"}), 500
+
+    try:
+        job_id = _job_queue.submit(
+            "blog_generate", _run_blog_generation, params, uploads,
+            meta={"user": session.get('user', {}).get('email', '')},
+        )
+    except _job_queue.QueueFull as e:
+        _discard_uploads(uploads)
+        return jsonify({"error": str(e)}), 503
+
+    return jsonify({
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": f"/api/blog/jobs/{job_id}",
+        "events_url": f"/api/blog/jobs/{job_id}/events",
+    }), 202
+
+
+def _discard_uploads(uploads: list[dict]):
+    """작업에 넘기지 못한 임시 업로드 파일 삭제"""
+    for upload in uploads:
+        try:
+            Path(upload["path"]).unlink(missing_ok=True)
+        except Exception:
+            pass
+
+
+def _stream_generation(ctx, client, **kwargs) -> str:
+    """
+    generate_content_stream으로 생성하며 부분 텍스트를 'draft' 이벤트로 발행.
+    STREAM_FLUSH_SEC마다 모아서 보내 이벤트 수를 제한하고, 조각마다 취소 여부를 확인한다.
+    반환: 전체 응답 텍스트
+    """
+    stream_fn = getattr(client.models, "generate_content_stream", None)
+    if stream_fn is None:
+        return client.models.generate_content(**kwargs).text
+
+    parts, pending = [], []
+    total = 0
+    last_flush = _time.monotonic()
+    stream = stream_fn(**kwargs)
+    try:
+        for chunk in stream:
+            ctx.check_cancelled()
+            text = getattr(chunk, "text", None) or ""
+            if not text:
+                continue
+            parts.append(text)
+            pending.append(text)
+            total += len(text)
+            if _time.monotonic() - last_flush >= STREAM_FLUSH_SEC:
+                ctx.emit("draft", {"text": "".join(pending), "chars": total})
+                pending = []
+                last_flush = _time.monotonic()
+    finally:
+        close = getattr(stream, "close", None)
+        if close:
+            close()
+    if pending:
+        ctx.emit("draft", {"text": "".join(pending), "chars": total})
+    return "".join(parts)
+
+
+def _run_blog_generation(ctx, params: dict, uploads: list[dict]) -> dict:
+    """작업 큐 워커에서 실행되는 블로그 생성 파이프라인 (통합 DNA 데이터 지원)"""
+    style_template_id = params["style_template_id"]
+    keywords = params["keywords"]
+    blog_dna_id = params["blog_dna_id"]
+    target_audience = params["target_audience"]
+    content_angle = params["content_angle"]
+    direct_text = params["press_release"]
+    press_url = params["press_url"]
+    reference_blog_url = params["reference_blog_url"]
+    active_tags = params["active_tags"]
+
+    if press_url or reference_blog_url:
+        ctx.stage("crawl", "URL 자료를 가져오고 있어요", 5)
 
     # URL로 보도자료 크롤링
     if press_url:
@@ -900,62 +880,47 @@ def generate_blog():
         except Exception as e:
             print(f"[WARN] 참고 블로그 URL 크롤링 실패: {e}")
 
-    uploaded_files = [file for file in request.files.getlist("files") if file and file.filename]
-    if not uploaded_files and 'file' in request.files and request.files['file'].filename:
-        uploaded_files = [request.files['file']]
+    ctx.stage("ingest", "첨부 자료를 분석하고 있어요", 15)
 
     # Gemini가 네이티브로 읽을 수 있는 형식
     GEMINI_NATIVE_EXTS = {'.pdf', '.jpg', '.jpeg', '.png', '.gif', '.webp'}
 
-    temp_paths = []
+    temp_paths = [Path(upload["path"]) for upload in uploads]
     gemini_uploaded_files = []   # Gemini File API 업로드 객체
     text_sources = []            # 로컬 텍스트 추출 결과
     extracted_image_urls = []    # 업로드 자료에서 추출한 이미지 URL 목록
+    ingest_timings = []          # 파일별 처리 시간 (응답에 포함)
 
-    api_key = os.getenv("GEMINI_API_KEY")
-    _gemini_client = genai.Client(api_key=api_key) if api_key else None
+    _gemini_client = get_gemini_client()
 
     try:
-        for file in uploaded_files:
-            temp_path = save_uploaded_file(file)
-            temp_paths.append(temp_path)
-            ext = temp_path.suffix.lower()
-            # 이미지 추출 (PDF/DOCX/이미지 파일 모두)
-            extracted_image_urls.extend(extract_images_from_file(temp_path))
-
-            if ext in GEMINI_NATIVE_EXTS and _gemini_client:
-                # Gemini File API로 직접 업로드
-                gfile = upload_to_gemini(temp_path, _gemini_client)
-                if gfile:
-                    gemini_uploaded_files.append(gfile)
-                    print(f"[OK] Gemini 네이티브 처리: {file.filename}")
-                else:
-                    # 업로드 실패 시 텍스트 추출로 폴백
-                    try:
-                        text = extract_text_from_file(temp_path)
-                        text_sources.append({
-                            "name": file.filename,
-                            "kind": ext.lstrip("."),
-                            "text": text,
-                        })
-                    except Exception:
-                        pass
-            else:
-                # DOCX / HWP / TXT → 로컬 텍스트 추출
-                try:
-                    text = extract_text_from_file(temp_path)
-                    text_sources.append({
-                        "name": file.filename,
-                        "kind": ext.lstrip("."),
-                        "text": text,
-                    })
-                except Exception as ex:
-                    print(f"[WARN] 텍스트 추출 실패 ({file.filename}): {ex}")
+        # 파일별 업로드/텍스트 추출/이미지 추출을 병렬로 실행 (결과는 업로드 순서 유지)
+        #  - PDF/이미지: Gemini File API로 직접 업로드 (실패 시 텍스트 추출로 폴백)
+        #  - DOCX / HWP / TXT: 로컬 텍스트 추출 (프로세스 풀)
+        results = ingest_files(
+            uploads,
+            upload=(lambda p: upload_to_gemini(p, _gemini_client)) if _gemini_client else None,
+            should_upload=lambda p: p.suffix.lower() in GEMINI_NATIVE_EXTS,
+            extract_images=extract_images_from_file,
+        )
+        for item in results:
+            extracted_image_urls.extend(item["images"])
+            if item["uploaded"]:
+                gemini_uploaded_files.append(item["uploaded"])
+                print(f"[OK] Gemini 네이티브 처리: {item['name']}")
+            elif item["text"] is not None:
+                text_sources.append({
+                    "name": item["name"],
+                    "kind": item["kind"],
+                    "text": item["text"],
+                    "warnings": item["warnings"],
+                })
+        ingest_timings = ingest_timing_report(results)
 
         material_bundle = build_material_bundle(sources=text_sources, direct_text=direct_text)
 
     except Exception as e:
-        return jsonify({"error": f"파일 처리 실패: {str(e)}"}), 500
+        raise JobFailed(f"파일 처리 실패: {str(e)}", 500)
     finally:
         for temp_path in temp_paths:
             try:
@@ -964,372 +929,36 @@ def generate_blog():
             except Exception:
                 pass
 
-    if not uploaded_files:
+    if not uploads:
         material_bundle = build_material_bundle(direct_text=direct_text)
 
     has_content = material_bundle.get("combined_text", "").strip() or bool(gemini_uploaded_files)
     if not has_content:
-        return jsonify({"error": "보도자료 내용이 필요합니다."}), 400
+        raise JobFailed("보도자료 내용이 필요합니다.", 400)
+
+    ctx.stage("dna", "블로그 스타일을 파악하고 있어요", 30)
 
     # 스타일 템플릿 로드
-    style_template = _STYLE_TEMPLATES_MAP.get(style_template_id, STYLE_TEMPLATES[0])
+    templates, templates_by_id = _load_style_templates()
+    style_template = templates_by_id.get(style_template_id, templates[0])
 
     blog_dna_text = ""
     dna_analysis = None  # 항상 초기화 (UnboundLocalError 방지)
+    # 스타일 가이드/분량·구조 가이드/HTML 스타일은 DNA 파일·수집 데이터·태그가 같으면 캐시 재사용
+    dna_artifact = empty_dna_artifact()
     if blog_dna_id:
         try:
-            # ① DNA 분석 결과 (스타일 가이드) 로드
-            if DNA_DIR.exists():
-                # blog_dna_id가 전체 파일 ID("DNA_blogid_날짜")인 경우 직접 로드
-                _direct = DNA_DIR / f"{blog_dna_id}.json"
-                if _direct.exists():
-                    with open(_direct, 'r', encoding='utf-8') as f:
-                        dna_analysis = json.load(f)
-                else:
-                    # blog_id만 넘어온 경우 glob으로 가장 최근 파일 검색
-                    candidates = sorted(
-                        [f for f in DNA_DIR.glob(f"DNA_{blog_dna_id}_*.json")],
-                        key=lambda f: f.stat().st_mtime, reverse=True
-                    )
-                    if candidates:
-                        with open(candidates[0], 'r', encoding='utf-8') as f:
-                            dna_analysis = json.load(f)
-
-            # ② 원본 글 샘플 로드 (전문 1개 + 제목 목록)
-            all_dna_posts = []
-            if BLOG_COLLECTIONS_DIR.exists():
-                for item in BLOG_COLLECTIONS_DIR.iterdir():
-                    if item.is_dir() and not item.name.startswith('.'):
-                        data_file = item / "_data.json"
-                        if data_file.exists():
-                            try:
-                                with open(data_file, 'r', encoding='utf-8') as f:
-                                    collection = json.load(f)
-                                if collection.get("blog_id") == blog_dna_id:
-                                    all_dna_posts.extend(collection.get("posts", []))
-                            except Exception:
-                                pass
-
-            seen_urls = set()
-            unique_posts = []
-            for post in all_dna_posts:
-                url = post.get("url")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_posts.append(post)
-            unique_posts.sort(key=lambda x: x.get('addDate', ''), reverse=True)
-
-            # ③ DNA 스타일 가이드 + 샘플 글 조합
-            dna_parts = []
-
-            if dna_analysis:
-                c1  = dna_analysis.get("c1_template_structure", {})
-                c2  = dna_analysis.get("c2_tone_mood", {})
-                # c3: 새 이름 우선, 구버전 하위호환
-                c3  = dna_analysis.get("c3_speech_endings", dna_analysis.get("c3_speech_style", {}))
-                # c4: 문장 구조
-                c4  = dna_analysis.get("c4_sentence_structure", dna_analysis.get("c6_sentence_patterns", {}))
-                # c5: 시그니처 표현
-                c5  = dna_analysis.get("c6_signature_expressions", dna_analysis.get("c5_frequent_expressions", {}))
-                # c6: 단락
-                c6p = dna_analysis.get("c5_paragraph_composition", dna_analysis.get("c8_paragraph_composition", {}))
-                # c8: 화법
-                c8  = dna_analysis.get("c8_rhetoric", dna_analysis.get("c4_rhetoric", {}))
-                # c9: 도입
-                c9  = dna_analysis.get("c9_opening_patterns", dna_analysis.get("c9_opening_closing", {}))
-                # c10: 마무리
-                c10c = dna_analysis.get("c10_closing_patterns", dna_analysis.get("c9_opening_closing", {}))
-                # c11: 시각
-                c11v = dna_analysis.get("c11_visual_symbols", dna_analysis.get("c10_visual_formatting", {}))
-                c12 = dna_analysis.get("c12_typography", {})
-                c13 = dna_analysis.get("c13_brackets_quotes", {})
-                c14 = dna_analysis.get("c14_length_stats", dna_analysis.get("c11_length_stats", {}))
-                c15 = dna_analysis.get("c15_title_patterns", dna_analysis.get("c14_title_patterns", {}))
-                c7  = dna_analysis.get("c7_vocabulary", {})
-
-                dna_parts.append("【블로그 글쓰기 DNA 스타일 가이드 — 모든 항목 100% 재현할 것】")
-                # 구조 & 톤
-                dna_parts.append(f"구조 패턴: {c1.get('overall_pattern', '')} / 섹션 수: {c1.get('section_count', '')}")
-                dna_parts.append(f"섹션 흐름: {' → '.join(c1.get('section_flow', []))}")
-                dna_parts.append(f"소제목 포맷: {c1.get('subheading_format', c1.get('heading_style', ''))}")
-                dna_parts.append(f"톤: {c2.get('primary_tone', '')} / 격식도: {c2.get('formality_level', '')}/10 / 활발함: {c2.get('energy_level', '')}/10")
-                dna_parts.append(f"톤 변화 패턴: {c2.get('tone_shift_pattern', '')}")
-                # 어투/종결어미
-                primary_endings = c3.get('primary_endings', c3.get('ending_patterns', []))
-                dna_parts.append(f"종결어미 TOP5: {', '.join(primary_endings[:5])}")
-                dna_parts.append(f"격식:비격식 비율: {c3.get('formality_mix', '')} / 연속 같은 어미: {c3.get('consecutive_same_ending', '')}")
-                dna_parts.append(f"독자 호칭: {c3.get('reader_address', '')} / 의문형 패턴: {c3.get('question_ending_style', '')}")
-                # 문장 구조
-                dna_parts.append(f"문장 길이: 평균 {c4.get('avg_chars_per_sentence', c4.get('avg_length', ''))}자 / 짧은:{c4.get('short_sentence_ratio', '')} 중간:{c4.get('medium_sentence_ratio', '')} 긴:{c4.get('long_sentence_ratio', '')}")
-                dna_parts.append(f"리듬 패턴: {c4.get('rhythm_pattern', c4.get('rhythm', ''))}")
-                dna_parts.append(f"문장 시작 패턴: {', '.join(c4.get('leading_phrase_patterns', [])[:5])}")
-                # 단락
-                dna_parts.append(f"단락당 문장: {c6p.get('avg_sentences_per_paragraph', '')} / 여백: {c6p.get('whitespace_style', c6p.get('whitespace_usage', ''))}")
-                dna_parts.append(f"단락 시작 패턴: {c6p.get('paragraph_opening_pattern', '')}")
-                # 시그니처 표현
-                sig = c5.get('signature_phrases', [])
-                trans = c5.get('transition_words', [])
-                dna_parts.append(f"시그니처 표현: {', '.join(sig[:7])}")
-                dna_parts.append(f"전환 표현: {', '.join(trans[:6])}")
-                dna_parts.append(f"강조 표현: {', '.join(c5.get('emphasis_expressions', [])[:5])}")
-                dna_parts.append(f"긍정 추임새: {', '.join(c5.get('affirmation_expressions', [])[:5])}")
-                # 어휘
-                dna_parts.append(f"어휘 수준: {c7.get('level', '')} / 순우리말:{c7.get('korean_ratio', '')} 한자어:{c7.get('sino_korean_ratio', '')} 외래어:{c7.get('foreign_word_ratio', '')}")
-                dna_parts.append(f"특징 어휘: {', '.join(c7.get('characteristic_words', [])[:8])}")
-                # 도입/마무리
-                dna_parts.append(f"도입 방식: {', '.join(c9.get('opening_types', []))}")
-                dna_parts.append(f"첫 문장 패턴: {c9.get('first_sentence_pattern', '')}")
-                dna_parts.append(f"마무리 방식: {', '.join(c10c.get('closing_types', []))}")
-                dna_parts.append(f"CTA 방식: {c10c.get('cta_style', '')} / 표현: {', '.join(c10c.get('cta_keywords', [])[:4])}")
-                # 시각 요소
-                emoji_list = c11v.get('emoji_list', c11v.get('emoji_types', []))
-                dna_parts.append(f"이모지 빈도(1-10): {c11v.get('emoji_frequency', c11v.get('emoji_usage', ''))} / 글당 이모지 수: {c11v.get('emoji_per_post', '')}")
-                dna_parts.append(f"자주 쓰는 이모지: {', '.join(emoji_list[:15])}")
-                dna_parts.append(f"이모지 위치: {c11v.get('emoji_position', '')}")
-                dna_parts.append(f"특수기호: {', '.join(c11v.get('special_symbols', [])[:15])}")
-                sep = c11v.get('separator_patterns', [c11v.get('separator_style', '')])
-                dna_parts.append(f"구분선: {', '.join(sep[:3]) if isinstance(sep, list) else sep}")
-                # 글자수/분량 (c14)
-                if c14:
-                    dna_parts.append(f"\n【분량 기준】")
-                    dna_parts.append(f"글당 평균 글자수: {c14.get('avg_chars_per_post', '')}")
-                    dna_parts.append(f"평균 문장 수: {c14.get('avg_sentences_per_post', '')}")
-                    dna_parts.append(f"문장당 평균 글자수: {c14.get('avg_chars_per_sentence', '')}")
-                    dna_parts.append(f"서론:본론:결론 비율: {c14.get('content_ratio', '')}")
-                    if c14.get('writing_density_guide'):
-                        dna_parts.append(f"분량 지침: {c14.get('writing_density_guide', '')}")
-                # 폰트/글꼴 (c12)
-                if c12:
-                    dna_parts.append(f"\n【폰트/글꼴 스타일】")
-                    if c12.get('font_families'):
-                        dna_parts.append(f"사용 폰트: {', '.join(c12.get('font_families', []))}")
-                    dna_parts.append(f"본문 크기: {c12.get('base_font_size', '')} / 소제목 크기: {c12.get('heading_font_size', '')}")
-                    dna_parts.append(f"볼드 빈도(1-10): {c12.get('bold_frequency', '')} / 목적: {c12.get('bold_purpose', '')}")
-                    if c12.get('bold_examples'):
-                        dna_parts.append(f"볼드 예시: {', '.join(c12.get('bold_examples', [])[:3])}")
-                    dna_parts.append(f"기울임꼴: {c12.get('italic_usage', '')} / 밑줄: {c12.get('underline_usage', '')}")
-                    if c12.get('font_guide'):
-                        dna_parts.append(f"글꼴 지침: {c12.get('font_guide', '')}")
-                # 꺽쇠/괄호 (c13)
-                if c13:
-                    dna_parts.append(f"\n【꺽쇠/괄호/인용부호】")
-                    if c13.get('angle_bracket_types'):
-                        dna_parts.append(f"꺽쇠 종류: {', '.join(c13.get('angle_bracket_types', []))} / 목적: {c13.get('angle_bracket_purpose', '')} / 빈도: {c13.get('angle_bracket_frequency', '')}")
-                    if c13.get('square_bracket_types'):
-                        dna_parts.append(f"대괄호 종류: {', '.join(c13.get('square_bracket_types', []))} / 목적: {c13.get('square_bracket_purpose', '')}")
-                    dna_parts.append(f"소괄호 패턴: {c13.get('round_bracket_usage', '')}")
-                    dna_parts.append(f"따옴표 방식: {c13.get('quotation_mark_style', '')}")
-                    if c13.get('examples'):
-                        dna_parts.append(f"꺽쇠/괄호 예시: {' | '.join(c13.get('examples', [])[:3])}")
-                # 제목 패턴 (c14)
-                if c14:
-                    dna_parts.append(f"\n【제목 패턴】")
-                    dna_parts.append(f"평균 제목 길이: {c14.get('avg_title_length', '')} / 구조: {c14.get('title_structure', '')}")
-                    dna_parts.append(f"숫자 활용: {c14.get('number_usage', '')} / 감정 후크: {c14.get('emotion_hook', '')}")
-                    if c14.get('examples'):
-                        dna_parts.append(f"제목 예시: {' | '.join(c14.get('examples', [])[:3])}")
-                # 이미지 (c16 또는 c15 하위호환)
-                c16 = dna_analysis.get("c16_image_media", dna_analysis.get("c15_image_media", {}))
-                if c16:
-                    dna_parts.append(f"\n【이미지/미디어 패턴】")
-                    dna_parts.append(f"글당 이미지 수: {c16.get('avg_images_per_post', c16.get('avg_images', ''))} / 배치: {c16.get('image_placement', c16.get('image_position', ''))}")
-                    dna_parts.append(f"캡션 방식: {c16.get('caption_style', c16.get('image_caption_style', ''))} / 밀도: {c16.get('media_density', '')}")
-
-                # c17 — 문장부호
-                c17 = dna_analysis.get("c17_punctuation", {})
-                if c17:
-                    dna_parts.append(f"\n【문장부호/구두점 패턴 — 반드시 재현할 것】")
-                    dna_parts.append(f"마침표 방식: {c17.get('period_style', '')} / 생략 비율: {c17.get('period_omission_ratio', '')}")
-                    dna_parts.append(f"쉼표 빈도(1-10): {c17.get('comma_frequency', '')} / 방식: {c17.get('comma_style', '')}")
-                    dna_parts.append(f"느낌표 빈도(1-10): {c17.get('exclamation_frequency', '')} / 방식: {c17.get('exclamation_style', '')}")
-                    dna_parts.append(f"물음표 맥락: {c17.get('question_mark_usage', '')}")
-                    dna_parts.append(f"말줄임표: {c17.get('ellipsis_usage', '')} / 물결표: {c17.get('tilde_usage', '')} / 대시: {c17.get('dash_usage', '')}")
-                    if c17.get('multiple_punct_usage'):
-                        dna_parts.append(f"복수 부호(!! ~~): {c17.get('multiple_punct_usage', '')}")
-                    if c17.get('examples'):
-                        dna_parts.append(f"구두점 예시:\n" + "\n".join(c17['examples'][:2]))
-
-                # c18 — 숫자/데이터
-                c18 = dna_analysis.get("c18_numbers_data", {})
-                if c18:
-                    dna_parts.append(f"\n【숫자/단위/데이터 표현 — 반드시 재현할 것】")
-                    dna_parts.append(f"숫자 선호: {c18.get('numeral_preference', '')}")
-                    dna_parts.append(f"가격 형식: {c18.get('price_format', '')} / 날짜 형식: {c18.get('date_format', '')}")
-                    dna_parts.append(f"단위 스타일: {c18.get('unit_style', '')} / 순위 형식: {c18.get('ranking_format', '')}")
-                    dna_parts.append(f"어림수 표현: {c18.get('approximation_style', '')}")
-                    if c18.get('examples'):
-                        dna_parts.append(f"수치 예시: {' | '.join(c18['examples'][:3])}")
-
-                # c19 — 독자 상호작용
-                c19 = dna_analysis.get("c19_reader_engagement", {})
-                if c19:
-                    dna_parts.append(f"\n【독자 참여 유도 방식 — 반드시 재현할 것】")
-                    dna_parts.append(f"독자 질문 빈도(1-10): {c19.get('direct_question_frequency', '')}")
-                    if c19.get('empathy_phrases'):
-                        dna_parts.append(f"공감 표현: {', '.join(c19['empathy_phrases'][:4])}")
-                    if c19.get('inclusive_expressions'):
-                        dna_parts.append(f"포용 표현: {', '.join(c19['inclusive_expressions'][:4])}")
-                    dna_parts.append(f"추천 강도: {c19.get('recommendation_strength', '')}")
-                    if c19.get('recommendation_expressions'):
-                        dna_parts.append(f"추천 표현: {', '.join(c19['recommendation_expressions'][:4])}")
-                    if c19.get('urgency_patterns'):
-                        dna_parts.append(f"긴박감 표현: {', '.join(c19['urgency_patterns'][:3])}")
-                    if c19.get('examples'):
-                        dna_parts.append(f"참여 유도 예시:\n" + "\n".join(c19['examples'][:2]))
-
-                # c20 — 감탄사/추임새
-                c20 = dna_analysis.get("c20_interjections_fillers", {})
-                if c20:
-                    dna_parts.append(f"\n【감탄사/추임새/습관어 — 반드시 재현할 것】")
-                    if c20.get('interjections'):
-                        dna_parts.append(f"감탄사: {', '.join(c20['interjections'][:8])}")
-                    if c20.get('filler_starters'):
-                        dna_parts.append(f"시작 습관어: {', '.join(c20['filler_starters'][:6])}")
-                    if c20.get('affirmations'):
-                        dna_parts.append(f"긍정 추임새: {', '.join(c20['affirmations'][:5])}")
-                    if c20.get('excitement_expressions'):
-                        dna_parts.append(f"흥분 표현: {', '.join(c20['excitement_expressions'][:5])}")
-                    dna_parts.append(f"사용 빈도(1-10): {c20.get('frequency', '')} / 위치: {c20.get('position_pattern', '')}")
-                    if c20.get('examples'):
-                        dna_parts.append(f"추임새 예시:\n" + "\n".join(c20['examples'][:2]))
-
-                # c21 — 인라인 서식 상세 (확장 버전)
-                c21 = dna_analysis.get("c21_inline_formatting", {})
-                if c21:
-                    dna_parts.append(f"\n【인라인 서식 상세 (Naver SE3) — 반드시 재현할 것】")
-                    dna_parts.append(f"폰트 전환 빈도: {c21.get('font_switch_frequency', '')} / 트리거: {c21.get('font_switch_trigger', '')}")
-                    if c21.get('font_families_used'):
-                        dna_parts.append(f"사용 폰트: {', '.join(c21['font_families_used'])}")
-                    if c21.get('size_switch_pattern'):
-                        dna_parts.append(f"크기 전환 패턴: {c21.get('size_switch_pattern', '')}")
-                    if c21.get('size_examples_by_level'):
-                        _sz = c21['size_examples_by_level']
-                        if isinstance(_sz, dict):
-                            dna_parts.append(f"크기별 사용: " + " | ".join(f"{k}={v}" for k, v in _sz.items() if v and v != "어떤 텍스트에 사용?"))
-                    if c21.get('color_switch_pattern'):
-                        dna_parts.append(f"색상 전환 패턴: {c21.get('color_switch_pattern', '')}")
-                    if c21.get('color_switch_examples'):
-                        dna_parts.append(f"색상 전환 예시: {' | '.join(c21['color_switch_examples'][:4])}")
-                    if c21.get('italic_usage') and c21['italic_usage'] != '없음':
-                        dna_parts.append(f"기울임체: {c21.get('italic_usage', '')}")
-                    if c21.get('underline_usage') and c21['underline_usage'] != '없음':
-                        dna_parts.append(f"밑줄: {c21.get('underline_usage', '')}")
-                    if c21.get('strikethrough_usage') and c21['strikethrough_usage'] != '없음':
-                        dna_parts.append(f"취소선: {c21.get('strikethrough_usage', '')}")
-                    if c21.get('background_color_pattern') and c21['background_color_pattern'] != '없음':
-                        dna_parts.append(f"배경색 강조: {c21.get('background_color_pattern', '')}")
-                    if c21.get('background_color_examples'):
-                        dna_parts.append(f"배경색 예시: {' | '.join(c21['background_color_examples'][:3])}")
-                    if c21.get('center_align_pattern'):
-                        dna_parts.append(f"가운데 정렬: {c21.get('center_align_pattern', '')}")
-                    if c21.get('box_quote_pattern') and c21['box_quote_pattern'] != '없음':
-                        dna_parts.append(f"박스/인용구: {c21.get('box_quote_pattern', '')}")
-                    if c21.get('combined_format_examples'):
-                        dna_parts.append(f"복합 서식 예시: {' | '.join(c21['combined_format_examples'][:3])}")
-                    if c21.get('naver_se3_pattern_guide'):
-                        dna_parts.append(f"SE3 서식 가이드: {c21.get('naver_se3_pattern_guide', '')}")
-
-                # c22 — 콘텐츠 패턴
-                c22 = dna_analysis.get("c22_content_patterns", {})
-                if c22:
-                    dna_parts.append(f"\n【콘텐츠 주제/정보 패턴 — 반드시 따를 것】")
-                    if c22.get('main_topics'):
-                        dna_parts.append(f"주요 주제: {', '.join(c22['main_topics'][:5])}")
-                    if c22.get('content_angle'):
-                        dna_parts.append(f"콘텐츠 각도: {c22.get('content_angle', '')}")
-                    if c22.get('must_include_elements'):
-                        dna_parts.append(f"반드시 포함: {', '.join(c22['must_include_elements'][:6])}")
-                    if c22.get('never_include_elements'):
-                        dna_parts.append(f"절대 포함 금지: {', '.join(c22['never_include_elements'][:4])}")
-                    if c22.get('info_ordering'):
-                        dna_parts.append(f"정보 제시 순서: {c22.get('info_ordering', '')}")
-                    if c22.get('local_terminology'):
-                        dna_parts.append(f"지역/기관 용어: {', '.join(c22['local_terminology'][:6])}")
-                    if c22.get('typical_post_template'):
-                        dna_parts.append(f"전형적 글 구성: {c22.get('typical_post_template', '')}")
-
-                # 도입/마무리 실제 예시
-                c9_open = dna_analysis.get("c9_opening_patterns", dna_analysis.get("c9_opening_closing", {}))
-                c10_close = dna_analysis.get("c10_closing_patterns", dna_analysis.get("c9_opening_closing", {}))
-                if c9_open.get("opening_examples"):
-                    dna_parts.append(f"\n실제 도입부 예시 (이대로 따라 쓸 것):\n" + "\n".join(c9_open["opening_examples"][:3]))
-                if c10_close.get("closing_examples"):
-                    dna_parts.append(f"\n실제 마무리 예시 (이대로 따라 쓸 것):\n" + "\n".join(c10_close["closing_examples"][:3]))
-
-            # 원본 글 전문 최대 3개 (스타일 레퍼런스)
-            if unique_posts:
-                dna_parts.append(f"\n【실제 글 샘플 (이 스타일을 최대한 그대로 따라 쓸 것 — 어투·구조·길이·표현 모두)】")
-                for si, sample in enumerate(unique_posts[:3], 1):
-                    dna_parts.append(f"\n[샘플 {si}] 제목: {sample.get('title', '')}")
-                    dna_parts.append(sample.get('content', '')[:1800])
-
-                # 제목 목록 (참고용)
-                title_list = [f"- {p.get('title', '')}" for p in unique_posts[3:12]]
-                if title_list:
-                    dna_parts.append(f"\n【최근 글 제목 목록 (주제 참고용)】\n" + "\n".join(title_list))
-
-            # 활성 페르소나 태그 추가
-            if active_tags:
-                tag_labels = [t.get("label", "") for t in active_tags if t.get("label")]
-                if tag_labels:
-                    dna_parts.append(f"\n[활성화된 스타일 태그 — 이 특징들을 반드시 반영]\n" + "\n".join(f"- {l}" for l in tag_labels))
-
-            blog_dna_text = "\n".join(dna_parts)
-
+            dna_artifact = get_dna_artifact(DNA_DIR, blog_dna_id, _collection_index(), active_tags)
+            dna_analysis = dna_artifact["dna_analysis"]
+            blog_dna_text = dna_artifact["style_guide"]
         except Exception as e:
             print(f"[WARN] 블로그 DNA 로드 실패: {e}")
 
     # ── DNA에서 블로그 신원·분량·구조 가이드 추출 ──────────────
     dna_blog_id = (dna_analysis or {}).get('blog_id', blog_dna_id or '')
 
-    # 분량 가이드: c14_length_stats 또는 c11_length_stats
-    _c14 = (dna_analysis or {}).get("c14_length_stats",
-             (dna_analysis or {}).get("c11_length_stats", {}))
-    if _c14:
-        _avg    = _c14.get('avg_chars_per_post', '')
-        _guide  = _c14.get('density_guide', _c14.get('writing_density_guide', ''))
-        _ratio  = _c14.get('content_ratio', '')
-        length_guide_text = "▸ 이 블로그의 평균 글 길이: " + str(_avg)
-        if _guide: length_guide_text += f"\n▸ 분량 지침: {_guide}"
-        if _ratio: length_guide_text += f"\n▸ 서론:본론:결론 = {_ratio}"
-    else:
-        length_guide_text = "▸ 최소 1,500자 이상, 권장 2,000~2,500자\n▸ 서론(10%) → 본론(75%) → 결론(15%)"
-
-    # 구조 가이드: c1_template_structure
-    _c1 = (dna_analysis or {}).get("c1_template_structure", {})
-    if _c1:
-        _pattern  = _c1.get('overall_pattern', '')
-        _flow     = _c1.get('section_flow', [])
-        _subfmt   = _c1.get('subheading_format', _c1.get('heading_style', ''))
-        struct_guide_text = f"▸ 구조 패턴: {_pattern}"
-        if _flow: struct_guide_text += "\n▸ 섹션 흐름: " + " → ".join(_flow)
-        if _subfmt: struct_guide_text += f"\n▸ 소제목 포맷: {_subfmt}"
-    else:
-        struct_guide_text = "▸ 서론 → 본론(3~5단락) → 결론 구조"
-
-    # 꺽쇠/인용/폰트크기 마커 가이드 (c13 기반)
-    _c13 = (dna_analysis or {}).get("c13_brackets_quotes", {})
-    _bracket_guide = ""
-    if _c13:
-        _ab  = _c13.get("angle_bracket_examples", [])
-        _sq  = _c13.get("square_bracket_purpose", "")
-        _qt  = _c13.get("quotation_style", "")
-        _cbo = _c13.get("bracket_combo_pattern", "")
-        _abf = _c13.get("angle_bracket_frequency", "")
-        if _ab or _qt:
-            _bracket_guide = "\n▸ 이 블로그의 꺽쇠/인용 패턴 (반드시 재현):"
-            if _ab:   _bracket_guide += f"\n  - 꺽쇠 예시 ({_abf}): {' / '.join(_ab[:3])}"
-            if _sq:   _bracket_guide += f"\n  - 대괄호 용도: {_sq[:80]}"
-            if _qt:   _bracket_guide += f"\n  - 인용부호: {_qt}"
-            if _cbo:  _bracket_guide += f"\n  - 조합 패턴: {_cbo}"
-
-    # 폰트 크기 마커 가이드
-    _fs_levels = (dna_analysis or {}).get("c12_typography", {}).get("font_size_levels", [])
-    _size_guide = ""
-    if len(_fs_levels) >= 2:
-        _size_guide = "\n▸ 인라인 크기 마커 (필요시 사용):\n  - [작게]텍스트[/작게] → 작은 글씨 (부가설명, 주석)\n  - [크게]텍스트[/크게] → 강조 큰 글씨"
-
-    struct_guide_text += _bracket_guide + _size_guide
+    length_guide_text = dna_artifact["length_guide"]
+    struct_guide_text = dna_artifact["struct_guide"]
 
     template_name = style_template.get("name", "정보전달형")
     formality_score = style_template.get("formality_score", 5)
@@ -1370,19 +999,15 @@ def generate_blog():
 
     if api_key:
         try:
-            client = genai.Client(api_key=api_key)
+            client = get_gemini_client()
 
             # Gemini 네이티브 파일 처리 대기 (PROCESSING → ACTIVE)
-            active_gfiles = []
-            for gf in gemini_uploaded_files:
-                for _ in range(30):
-                    if gf.state.name == 'ACTIVE':
-                        active_gfiles.append(gf)
-                        break
-                    _time.sleep(1)
-                    gf = client.files.get(name=gf.name)
-                else:
-                    print(f"[WARN] Gemini 파일 처리 타임아웃: {gf.name}")
+            if gemini_uploaded_files:
+                ctx.stage("upload_wait", "첨부 파일 처리를 기다리고 있어요", 40)
+            # 모든 파일을 함께 폴링하다가 전부 ACTIVE가 되는 즉시 진행
+            active_gfiles = _gemini_files.wait_active(
+                client, gemini_uploaded_files, timeout=90, check=ctx.check_cancelled,
+            )
 
             # 파일 첨부 안내 문구
             native_note = ""
@@ -1562,8 +1187,11 @@ DNA에서 벗어나는 순간 실패입니다. DNA를 따르는 것이 곧 이 
                     mime_type=gf.mime_type,
                 ))
 
+            ctx.stage("generate", "AI가 글을 구성하고 있어요", 50)
             from google.genai import types as _cfg_types
-            response = client.models.generate_content(
+            # 스트리밍: 받은 조각을 'draft' 이벤트로 브라우저에 전달, 정리는 끝에서 한 번
+            response_text = _stream_generation(
+                ctx, client,
                 model='gemini-2.5-pro',
                 contents=contents,
                 config=_cfg_types.GenerateContentConfig(
@@ -1572,13 +1200,8 @@ DNA에서 벗어나는 순간 실패입니다. DNA를 따르는 것이 곧 이 
                 ),
             )
 
-            # Gemini 업로드 파일 사용 후 삭제 (48시간 자동 만료지만 즉시 정리)
-            for gf in active_gfiles:
-                try:
-                    client.files.delete(name=gf.name)
-                except Exception:
-                    pass
-            blog_result = parse_ai_json(response.text)
+            # 업로드 파일은 재실행 시 재사용하도록 남겨둔다 (TTL 지난 것은 유지보수 작업 "caches"가 정리)
+            blog_result = parse_ai_json(response_text)
             versions = blog_result.get("versions", [])
             for v in versions:
                 if "title" in v:
@@ -1590,9 +1213,12 @@ DNA에서 벗어나는 순간 실패입니다. DNA를 따르는 것이 곧 이 
                     v["content"] = v["content"].replace('&nbsp;', ' ').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
             if versions:
                 generation_mode = "ai"
+        except JobCancelled:
+            raise
         except Exception as e:
             print(f"[WARN] AI 블로그 생성 실패, 오프라인 모드로 전환: {e}")
 
+    ctx.stage("save", "결과를 저장하고 있어요", 90)
     if not versions:
         versions = generate_blog_versions_offline(
             persona_data={},
@@ -1609,176 +1235,24 @@ DNA에서 벗어나는 순간 실패입니다. DNA를 따르는 것이 곧 이 
         client_name=template_name,
         versions=versions,
         source_bundle=material_bundle,
-        extra={"generation_mode": generation_mode, "style_template_id": style_template_id},
+        extra={
+            "generation_mode": generation_mode,
+            "style_template_id": style_template_id,
+            "images": extracted_image_urls,
+            "blog_dna_id": blog_dna_id,
+        },
     )
-    save_blog_package(package, OUTPUT_DIR)
+    json_path, _ = save_blog_package(package, OUTPUT_DIR)
+    _catalog_record("blogs", json_path, package)
 
-    # ── DNA → HTML 스타일 완전 추출 ────────────────────────────
-    try:
-      _dna_style_ok = True
-      _c12 = (dna_analysis or {}).get("c12_typography", {})
-      _c11 = (dna_analysis or {}).get("c11_visual_symbols",
-              (dna_analysis or {}).get("c10_visual_formatting", {}))
-    except Exception:
-      _dna_style_ok = False
-      _c12, _c11 = {}, {}
-
-    # 1) 폰트 패밀리: Naver SE 클래스명 → CSS font-family
-    _font_map = {
-        # Naver SE3 내부 클래스명 (소문자, 공백 제거)
-        "system":               "'Malgun Gothic', '맑은 고딕', 'Apple SD Gothic Neo', sans-serif",
-        "nanumgothic":          "'NanumGothic', '나눔고딕', 'Malgun Gothic', sans-serif",
-        "nanumsquare":          "'NanumSquare', '나눔스퀘어', 'NanumGothic', sans-serif",
-        "nanumsquareround":     "'NanumSquareRound', 'NanumSquare', 'NanumGothic', sans-serif",
-        "nanumbareunhipi":      "'nanumbareunhipi', '나눔바른히피', 'NanumGothic', sans-serif",
-        "nanumbarungothic":     "'NanumBarunGothic', '나눔바른고딕', 'NanumGothic', sans-serif",
-        "nanummyeongjo":        "'NanumMyeongjo', '나눔명조', serif",
-        "nanumdasisijaghae":    "'nanumdasisijaghae', '나눔다시시작해', cursive",
-        "nanumbrush":           "'NanumBrushScript', '나눔손글씨 붓', cursive",
-        "nanumpen":             "'NanumPen', '나눔손글씨 펜', cursive",
-        "dotum":                "Dotum, '돋움', sans-serif",
-        "gulim":                "Gulim, '굴림', sans-serif",
-        "batang":               "Batang, '바탕', serif",
-        "gungsuh":              "GungsuhChe, '궁서체', serif",
-        "malgun":               "'Malgun Gothic', '맑은 고딕', sans-serif",
-        "malgunbold":           "'Malgun Gothic Bold', '맑은 고딕', sans-serif",
-        "arial":                "Arial, Helvetica, sans-serif",
-        "timesnewroman":        "'Times New Roman', Times, serif",
-        "couriernew":           "'Courier New', Courier, monospace",
-        # 한글 표기
-        "나눔고딕":             "'NanumGothic', '나눔고딕', 'Malgun Gothic', sans-serif",
-        "나눔명조":             "'NanumMyeongjo', '나눔명조', serif",
-        "나눔스퀘어":           "'NanumSquare', 'NanumGothic', sans-serif",
-        "나눔스퀘어라운드":     "'NanumSquareRound', 'NanumSquare', sans-serif",
-        "나눔바른히피":         "'nanumbareunhipi', 'NanumGothic', sans-serif",
-        "나눔바른고딕":         "'NanumBarunGothic', 'NanumGothic', sans-serif",
-        "나눔다시시작해":       "'nanumdasisijaghae', cursive",
-        "나눔손글씨붓":         "'NanumBrushScript', cursive",
-        "나눔손글씨펜":         "'NanumPen', cursive",
-        "맑은고딕":             "'Malgun Gothic', '맑은 고딕', sans-serif",
-        "맑은 고딕":            "'Malgun Gothic', '맑은 고딕', sans-serif",
-        "돋움":                 "Dotum, '돋움', sans-serif",
-        "굴림":                 "Gulim, '굴림', sans-serif",
-        "바탕":                 "Batang, '바탕', serif",
-        "기본폰트":             "'NanumGothic', 'Malgun Gothic', '맑은 고딕', sans-serif",
-        "기본 폰트":            "'NanumGothic', 'Malgun Gothic', '맑은 고딕', sans-serif",
-    }
-    _font_names = _c12.get("font_families", [])
-    _raw_font = _font_names[0] if _font_names else "기본 폰트"
-    html_font = _font_map.get(_raw_font.lower().replace(" ", ""),
-                _font_map.get(_raw_font,
-                f"'{_raw_font}', 'NanumGothic', 'Malgun Gothic', sans-serif"))
-
-    # 2) 폰트 크기: Naver SE 클래스명(fs9~fs30) 및 텍스트 → px
-    def _to_px(val, default):
-        if not val: return default
-        val = str(val).strip()
-        if val.endswith("px"): return val
-        # fsNN 형식 (Naver SE3)
-        import re as _r
-        m = _r.match(r'fs(\d+)', val.lower().split()[0])
-        if m: return f"{m.group(1)}px"
-        _tmap = {"기본": "15px", "작게": "13px", "보통": "15px",
-                 "크게": "17px", "매우크게": "19px"}
-        return _tmap.get(val, default)
-
-    _base_raw = _c12.get("base_font_size", "기본")
-    _head_raw = _c12.get("heading_font_size", "기본")
-    html_base_size = _to_px(_base_raw, "15px")
-    # heading_font_size는 종종 "fs16 (폰트 종류나 굵기로 구분)" 같이 설명 포함
-    html_head_size = _to_px(_head_raw.split()[0] if _head_raw else "기본", "17px")
-    # 소제목은 base보다 2px 크게 (명시 없을 때)
-    if html_head_size == html_base_size:
-        html_head_size = f"{int(html_base_size.replace('px','')) + 2}px"
-
-    # 3) 색상: c11_visual_symbols.text_colors 에서 실제 hex 추출
-    #    (c12.color_examples 는 hex가 아닌 텍스트 설명이므로 사용 금지)
-    _raw_text_colors = _c11.get("text_colors", [])
-    _hex_colors = [c for c in _raw_text_colors
-                   if c and c.startswith("#") and len(c) in (4, 7, 9)]
-    # 기본 글자색(#141414 #333333 등) 및 무채색(gray) 제외하고 강조색 우선
-    _body_defaults = {"#141414", "#333333", "#1a1a1a", "#000000", "#222222"}
-    def _is_gray(hex_c):
-        """R≈G≈B 인 무채색 여부 (threshold 15)"""
-        try:
-            h = hex_c.lstrip('#')
-            if len(h) == 3: h = h[0]*2 + h[1]*2 + h[2]*2
-            r,g,b = int(h[0:2],16), int(h[2:4],16), int(h[4:6],16)
-            return max(r,g,b) - min(r,g,b) < 15
-        except Exception: return False
-    _accent_hex = [c for c in _hex_colors
-                   if c.lower() not in _body_defaults and not _is_gray(c)]
-    html_accent_color  = _accent_hex[0] if _accent_hex else ""
-    html_text_colors   = _hex_colors[:5]  # 전체 색상 목록
-
-    # 4) 하이라이트 색상
-    _raw_highlights = _c11.get("highlight_colors", [])
-    _hl_hex = [c for c in _raw_highlights if c and c.startswith("#")]
-    html_highlight_color = _hl_hex[0] if _hl_hex else ""
-
-    # 5) 중앙정렬
-    _center_txt = str(_c11.get("center_align_usage", "")).lower()
-    html_center_headings = any(w in _center_txt for w in
-                               ["매우", "빈번", "자주", "항상", "많이", "중앙 정렬 사용"])
-
-    # 6) 볼드 허용 (빈도 3 이상, 또는 텍스트값 "빈번/자주/많이" 등)
-    _bold_raw = _c12.get("bold_frequency", 1)
-    try:
-        html_bold_allowed = int(_bold_raw or 1) >= 3
-    except (ValueError, TypeError):
-        _bold_txt = str(_bold_raw).lower()
-        html_bold_allowed = any(w in _bold_txt for w in ["빈번", "자주", "많이", "high", "freq"])
-
-    # 7) 줄간격: Naver 기본 line-height=2.2, 빈번한 줄바꿈 스타일이면 1.8
-    _lbreak = str(_c11.get("line_break_style", "")).lower()
-    html_line_height = "1.8" if any(w in _lbreak for w in ["과감", "잦은", "짧은"]) else "2.2"
-
-    # 8) 소제목용 두 번째 폰트 (font_families[1])
-    _heading_raw_font = _font_names[1] if len(_font_names) > 1 else _raw_font
-    html_heading_font = _font_map.get(_heading_raw_font.lower().replace(" ", ""),
-                        _font_map.get(_heading_raw_font, html_font))
-
-    # 9) 작은 폰트 크기 (font_size_levels 에서 가장 작은 값)
-    _fs_levels = _c12.get("font_size_levels", [])
-    _fs_px = sorted([_to_px(s, "13px") for s in _fs_levels],
-                    key=lambda x: int(x.replace("px", "")))
-    html_small_font_size = _fs_px[0] if _fs_px else "13px"
-
-    # 10) c21 인라인 서식 — 색상 전환 패턴 추출
-    _c21 = (dna_analysis or {}).get("c21_inline_formatting", {})
-    _c21_color_ex = _c21.get("color_switch_examples", [])
-    # c21 색상 예시에서 hex 추출 (없으면 c11 accent 사용)
-    _c21_hex = [c for c in _c21_color_ex if isinstance(c, str) and c.startswith("#")]
-    html_inline_accent = _c21_hex[0] if _c21_hex else html_accent_color
-    # 인라인 폰트 전환 빈도
-    _font_sw = str(_c21.get("font_switch_frequency", "")).lower()
-    html_inline_font_switch = any(w in _font_sw for w in ["자주", "매우", "빈번", "항상"])
-
-    # 11) c22 콘텐츠 패턴 — 반드시 포함 요소 (프롬프트용)
-    _c22 = (dna_analysis or {}).get("c22_content_patterns", {})
-    html_must_include = _c22.get("must_include_elements", [])
+    # 패키지가 쓰는 추출 이미지 참조 기록 → 참조 없는 이미지는 주기적으로 정리
+    media_store = get_image_store(MEDIA_DIR, MEDIA_URL)
+    media_store.add_refs(output_id, extracted_image_urls)
 
-    try:
-        html_style = {
-            "font_family":          html_font,
-            "heading_font_family":  html_heading_font,
-            "base_font_size":       html_base_size,
-            "heading_font_size":    html_head_size,
-            "small_font_size":      html_small_font_size,
-            "accent_color":         html_accent_color,
-            "inline_accent_color":  html_inline_accent,
-            "text_colors":          html_text_colors,
-            "highlight_color":      html_highlight_color,
-            "bold_allowed":         html_bold_allowed,
-            "line_height":          html_line_height,
-            "center_headings":      html_center_headings,
-            "inline_font_switch":   html_inline_font_switch,
-            "must_include":         html_must_include,
-        }
-    except Exception:
-        html_style = {}
+    # DNA → HTML 스타일 (아티팩트에 미리 계산됨)
+    html_style = dna_artifact["html_style"]
 
-    return jsonify({
+    return {
         "success": True,
         "versions": package.get("versions", []),
         "output_id": output_id,
@@ -1789,10 +1263,79 @@ DNA에서 벗어나는 순간 실패입니다. DNA를 따르는 것이 곧 이 
         "source_bundle": {
             "sources": material_bundle.get("sources", []),
             "warnings": material_bundle.get("warnings", []),
+            "ingest_timings": ingest_timings,
         },
+    }
+
+
+@app.route('/api/blog/jobs/<job_id>', methods=['GET'])
+@login_required
+def get_blog_job(job_id):
+    """생성 작업 상태/결과 조회 (폴링용)"""
+    job = _job_queue.get_job(job_id)
+    if not job or not _job_visible(job):
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    return jsonify(job)
+
+
+@app.route('/api/blog/jobs/<job_id>/events', methods=['GET'])
+@login_required
+def blog_job_events(job_id):
+    """생성 작업 진행 이벤트 스트림 (Server-Sent Events)
+
+    연결은 최대 JOB_SSE_WINDOW초만 유지하고 닫는다 — waitress 스레드를 오래 점유하지 않도록
+    EventSource가 Last-Event-ID로 자동 재연결한다.
+    """
+    job = _job_queue.get_job(job_id)
+    if not job or not _job_visible(job):
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+
+    try:
+        after_seq = int(request.headers.get('Last-Event-ID') or request.args.get('since', 0))
+    except ValueError:
+        after_seq = 0
+
+    def _stream():
+        nonlocal after_seq
+        deadline = _time.monotonic() + JOB_SSE_WINDOW
+        yield "retry: 1000\n\n"
+        while _time.monotonic() < deadline:
+            events, finished = _job_queue.wait_events(job_id, after_seq, timeout=10)
+            for ev in events:
+                after_seq = ev["seq"]
+                payload = json.dumps(ev["data"], ensure_ascii=False)
+                yield f"id: {ev['seq']}\nevent: {ev['type']}\ndata: {payload}\n\n"
+            if finished:
+                if not events:
+                    yield f"event: end\ndata: {json.dumps({'status': 'finished'})}\n\n"
+                return
+            if not events:
+                yield ": keep-alive\n\n"
+
+    return Response(stream_with_context(_stream()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
     })
 
 
+@app.route('/api/blog/jobs/<job_id>/cancel', methods=['POST'])
+@login_required
+def cancel_blog_job(job_id):
+    """생성 작업 취소 요청"""
+    job = _job_queue.get_job(job_id)
+    if not job or not _job_visible(job):
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    return jsonify({"ok": _job_queue.cancel(job_id)})
+
+
+def _job_visible(job: dict) -> bool:
+    """SSO 사용 시 작업을 요청한 사용자에게만 노출"""
+    if not SSO_ENABLED:
+        return True
+    owner = (job.get("meta") or {}).get("user", "")
+    return not owner or owner == session.get('user', {}).get('email', '')
+
+
 # ============================================================
 # API: Blog Image Generation (On-Demand)
 # ============================================================
@@ -1814,7 +1357,7 @@ def suggest_blog_prompts():
         return jsonify({"error": "GEMINI_API_KEY가 설정되지 않았습니다."}), 500
     
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_gemini_client()
         from image_service import extract_image_prompts
         prompts = extract_image_prompts(blog_content, client, target_audience, content_angle)
         
@@ -1849,7 +1392,7 @@ def calibrate_blog():
     if not api_key:
         return jsonify({"error": "Gemini API 키가 설정되지 않았습니다."}), 500
 
-    client = genai.Client(api_key=api_key)
+    client = get_gemini_client()
 
     prompt = f"""당신은 블로그 글쓰기 스타일 분석 전문가입니다.
 아래 두 글을 비교해 실제 통과된 글의 특징을 분석해주세요.
@@ -1882,9 +1425,12 @@ def calibrate_blog():
 }}"""
 
     try:
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model='gemini-2.0-flash',
-            contents=prompt
+            contents=prompt,
+            endpoint="calibrate_blog",
+            bypass=bool(data.get("no_cache")),
         )
         analysis = parse_ai_json(response.text)
     except Exception as e:
@@ -1967,7 +1513,7 @@ def calibrate_from_url():
     if not api_key:
         return jsonify({"error": "Gemini API 키가 설정되지 않았습니다."}), 500
 
-    client = genai.Client(api_key=api_key)
+    client = get_gemini_client()
 
     prompt = f"""당신은 블로그 글쓰기 스타일 분석 전문가입니다.
 아래 두 글을 비교해 실제 통과된 글의 특징을 분석해주세요.
@@ -1995,9 +1541,12 @@ def calibrate_from_url():
 }}"""
 
     try:
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model='gemini-2.0-flash',
-            contents=prompt
+            contents=prompt,
+            endpoint="calibrate_from_url",
+            bypass=bool(data.get("no_cache")),
         )
         analysis = parse_ai_json(response.text)
     except Exception as e:
@@ -2113,23 +1662,42 @@ def generate_blog_images():
     target_audience = data.get("target_audience", "일반 시민")
     content_angle = data.get("content_angle", "정보전달형")
     custom_prompts = data.get("prompts", [])
+    # 기본은 저장소 URL + 크기만 반환 / inline: 예전처럼 data_uri(base64)도 포함
+    # stream: 완성되는 순서대로 NDJSON 한 줄씩 전송
+    inline = bool(data.get("inline"))
+    stream = bool(data.get("stream"))
     
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         return jsonify({"error": "GEMINI_API_KEY가 설정되지 않았습니다."}), 500
     
+    if not custom_prompts and (not blog_content or not blog_content.strip()):
+        return jsonify({"error": "이미지 생성을 위한 본문 또는 프롬프트가 필요합니다."}), 400
+    
+    store = get_image_store(MEDIA_DIR, MEDIA_URL)
+    
     try:
-        client = genai.Client(api_key=api_key)
-        from image_service import generate_images_for_blog, generate_images
+        client = get_gemini_client()
+        from image_service import extract_image_prompts, generate_images, iter_images
         
-        if custom_prompts:
-            # 사용자가 수정한 프롬프트로 생성
-            images = generate_images(custom_prompts, client, OUTPUT_DIR)
-        else:
-            # 블로그 본문에서 자동 추출하여 생성 (기존 방식)
-            if not blog_content or not blog_content.strip():
-                return jsonify({"error": "이미지 생성을 위한 본문 또는 프롬프트가 필요합니다."}), 400
-            images = generate_images_for_blog(blog_content, client, target_audience, content_angle, OUTPUT_DIR)
+        # 사용자가 수정한 프롬프트가 없으면 블로그 본문에서 자동 추출 (타겟/앵글 반영)
+        prompts = custom_prompts or extract_image_prompts(blog_content, client, target_audience, content_angle)
+        if not prompts:
+            return jsonify({"error": "이미지 프롬프트를 추출하지 못했습니다. 다시 시도해주세요."}), 500
+        
+        if stream:
+            def _ndjson():
+                count = 0
+                for image in iter_images(prompts, client, inline=inline, store=store):
+                    count += 1
+                    yield json.dumps({"type": "image", **image}, ensure_ascii=False) + "\n"
+                yield json.dumps({"type": "done", "count": count}) + "\n"
+            return Response(stream_with_context(_ndjson()), mimetype='application/x-ndjson', headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no',
+            })
+        
+        images = generate_images(prompts, client, inline=inline, store=store)
         
         if not images:
             return jsonify({"error": "이미지를 생성하지 못했습니다. 다시 시도해주세요."}), 500
@@ -2183,6 +1751,9 @@ def save_blog():
                     "meta_description": data.get("meta_description", ""),
                 },
             )
+            _catalog_record("blogs", save_path, package)
+            # 본문에 넣은 생성/추출 이미지는 패키지가 참조하는 동안 정리 대상에서 제외
+            get_image_store(MEDIA_DIR, MEDIA_URL).add_refs(output_id, find_media_urls(content, MEDIA_URL))
         else:
             filename = f"edited_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             save_path = save_dir / filename
@@ -2224,6 +1795,7 @@ def export_blog_docs():
         return jsonify({"error": "본문 내용이 없습니다."}), 400
     
     try:
+        import docx
         from docx.shared import Pt, Inches, RGBColor
         from docx.enum.text import WD_ALIGN_PARAGRAPH
         
@@ -2296,6 +1868,7 @@ def search_naver_blog_users():
         return jsonify({"results": []})
     try:
         from bs4 import BeautifulSoup as _BS
+        import requests as http_requests
         _headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
             "Accept-Language": "ko-KR,ko;q=0.9",
@@ -2344,22 +1917,55 @@ def search_naver_blog_users():
         return jsonify({"results": [], "error": str(e)})
 
 
-try:
-    from run_crawler import get_blog_id, get_post_list, get_post_content, get_post_content_with_style, save_results
-    import run_crawler as _run_crawler
-    _run_crawler.OUTPUT_DIR = str(BLOG_COLLECTIONS_DIR)
-    BLOG_PULL_AVAILABLE = True
-except Exception as e:
-    BLOG_PULL_AVAILABLE = False
-    get_blog_id = get_post_list = get_post_content = get_post_content_with_style = save_results = None
-    print(f"[WARN] blog_pull 크롤러를 불러오지 못했습니다: {e}")
+def _collection_index():
+    """수집 데이터 인덱스 (blog_id → 폴더/글 목록)"""
+    return get_collection_index(BLOG_COLLECTIONS_DIR)
+
+
+def _catalog():
+    """마이페이지 목록 인덱스 (생성 글 / DNA / 업무 성격 요약)"""
+    return get_catalog(OUTPUT_DIR / "_catalog.sqlite3", {
+        "blogs": (OUTPUT_DIR, "BLOG_*.json"),
+        "dna": (DNA_DIR, "DNA_*.json"),
+        "business": (BUSINESS_DIR, "BIZ_*.json"),
+    })
+
+
+def _catalog_record(kind: str, path: Path, data: dict | None = None):
+    """저장 직후 목록 인덱스 갱신 (실패해도 다음 조회의 동기화가 보정)"""
+    try:
+        catalog = _catalog()
+        if Path(path).parent.resolve() == catalog.sources[kind][0].resolve():
+            catalog.record(kind, path, data)
+    except Exception as e:
+        print(f"[WARN] 목록 인덱스 갱신 실패 ({Path(path).name}): {e}")
+
+
+_crawler_modules = None  # (run_crawler, CrawlerEngine) / False = 불러오기 실패
+
+
+def _load_crawler():
+    """blog_pull 크롤러(requests, bs4 사용)를 첫 수집 때 불러온다. 불러올 수 없으면 None."""
+    global _crawler_modules
+    if _crawler_modules is None:
+        try:
+            import run_crawler as _run_crawler
+            from crawler_engine import CrawlerEngine
+            _run_crawler.OUTPUT_DIR = str(BLOG_COLLECTIONS_DIR)
+            _crawler_modules = (_run_crawler, CrawlerEngine)
+        except Exception as e:
+            _crawler_modules = False
+            print(f"[WARN] blog_pull 크롤러를 불러오지 못했습니다: {e}")
+    return _crawler_modules or None
 
 @app.route('/api/blog/collect', methods=['POST'])
 @login_required
 def collect_blog():
     """네이버 블로그 글 수집 (blog_pull 크롤러 통합)"""
-    if not BLOG_PULL_AVAILABLE:
+    crawler = _load_crawler()
+    if crawler is None:
         return jsonify({"error": "blog_pull 크롤러가 설치되지 않아 블로그 수집 기능을 사용할 수 없습니다."}), 503
+    _run_crawler, CrawlerEngine = crawler
 
     data = request.json
     
@@ -2369,33 +1975,46 @@ def collect_blog():
     if not blog_input:
         return jsonify({"error": "블로그 주소 또는 ID를 입력해주세요."}), 400
     
-    blog_id = get_blog_id(blog_input)
+    blog_id = _run_crawler.get_blog_id(blog_input)
     if not blog_id:
         return jsonify({"error": f"올바른 블로그 주소가 아닙니다: {blog_input}"}), 400
     
+    # 증분 수집(기본): 이미 받은 글은 목록에서 건너뛰고 새 글 본문만 받아 저장소에 병합
+    incremental = bool(data.get("incremental", True))
+    known_log_nos = _collection_index().known_log_nos(blog_id) if incremental else set()
+    
     try:
-        # STEP 1: 글 목록 가져오기
-        posts = get_post_list(blog_id, count)
-        
-        if not posts:
-            return jsonify({"error": "글 목록을 가져올 수 없습니다. 블로그 주소를 확인해주세요."}), 404
+        # 블로그 1개당 세션 1개 재사용 + 속도 제한 아래 병렬 수집
+        with CrawlerEngine(blog_id) as engine:
+            # STEP 1: 글 목록 가져오기 (증분 모드는 최신 count개 중 저장소에 없는 글만)
+            posts = _run_crawler.get_post_list(blog_id, count, session=engine, known_log_nos=known_log_nos)
+            
+            if not posts and not known_log_nos:
+                return jsonify({"error": "글 목록을 가져올 수 없습니다. 블로그 주소를 확인해주세요."}), 404
+            
+            # STEP 2: 새 글만 본문 + 스타일 메타 수집
+            if posts:
+                engine.fetch_post_contents(posts)
+            failed_count = sum(1 for p in posts if p.get("content") == _run_crawler.FETCH_FAILED_TEXT)
+            print(f"[OK] 블로그 수집: {blog_id} 새 글 {len(posts)}개, 본문 실패 {failed_count}개 "
+                  f"(요청 {engine.stats['requests']}, 재시도 {engine.stats['retries']})")
         
-        # STEP 2: 본문 + 스타일 메타 수집
-        for post in posts:
-            result = get_post_content_with_style(blog_id, post['logNo'])
-            post['content'] = result.get('text') or "(본문 추출 실패)"
-            post['style_meta'] = result.get('style_meta', {})
-            _time.sleep(0.3)
-        
-        # STEP 3: 저장
-        folder = save_results(blog_id, posts)
+        # STEP 3: 저장 (증분 저장소에는 본문 실패 글을 넣지 않음 — 다음 수집 때 다시 받음)
+        if incremental:
+            folder, all_posts = _run_crawler.merge_into_store(blog_id, posts)
+        else:
+            folder = _run_crawler.save_results(blog_id, posts)
+            all_posts = posts
         
-        total_chars = sum(len(p.get('content', '')) for p in posts)
+        total_chars = sum(len(p.get('content', '')) for p in all_posts)
         
         return jsonify({
             "blog_id": blog_id,
             "blog_url": f"https://blog.naver.com/{blog_id}",
-            "post_count": len(posts),
+            "post_count": len(all_posts),
+            "new_post_count": len(posts) - failed_count if incremental else len(posts),
+            "failed_post_count": failed_count,
+            "incremental": incremental,
             "total_chars": total_chars,
             "output_folder": os.path.basename(folder),
             "posts": [
@@ -2406,7 +2025,7 @@ def collect_blog():
                     "content_length": len(p.get('content', '')),
                     "content_preview": p.get('content', '')[:200]
                 }
-                for p in posts
+                for p in all_posts
             ]
         })
         
@@ -2417,46 +2036,8 @@ def collect_blog():
 @app.route('/api/blog/collections', methods=['GET'])
 @login_required
 def list_blog_collections():
-    """수집된 블로그 컬렉션 목록 (블로그 ID별 통합 버전)"""
-    blog_map = {}
-    
-    if BLOG_COLLECTIONS_DIR.exists():
-        # 날짜 내림차순 정렬 (최신 폴더 먼저)
-        for item in sorted(BLOG_COLLECTIONS_DIR.iterdir(), reverse=True):
-            if item.is_dir() and not item.name.startswith('.'):
-                data_file = item / "_data.json"
-                if data_file.exists():
-                    try:
-                        with open(data_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        blog_id = data.get("blog_id", "")
-                        if not blog_id: continue
-                        
-                        posts = data.get("posts", [])
-                        post_count = len(posts)
-                        total_chars = sum(len(p.get("content", "")) for p in posts)
-                        collected_at = data.get("collected_at", item.name)
-                        
-                        if blog_id not in blog_map:
-                            blog_map[blog_id] = {
-                                "blog_id": blog_id,
-                                "folders": [item.name],
-                                "post_count": post_count,
-                                "total_chars": total_chars,
-                                "last_collected_at": collected_at
-                            }
-                        else:
-                            # 기존 데이터에 합치기 (Merging)
-                            blog_map[blog_id]["folders"].append(item.name)
-                            blog_map[blog_id]["post_count"] += post_count
-                            blog_map[blog_id]["total_chars"] += total_chars
-                            # (이미 날짜 역순 정렬이므로 처음 발견된 게 가장 최신일 가능성이 높음)
-                    except Exception as _e:
-                        print(f"[WARN] 수집 폴더 읽기 실패: {item.name} — {_e}")
-    
-    # 결과를 리스트로 변환
-    collections = list(blog_map.values())
+    """수집된 블로그 컬렉션 목록 (블로그 ID별 통합 버전) — 인덱스만 조회"""
+    collections = _collection_index().list_blogs()
     return jsonify({"collections": collections})
 
 
@@ -2470,115 +2051,36 @@ def analyze_blog_status():
     if not blog_id:
         return jsonify({"error": "분석할 블로그 ID를 선택해주세요."}), 400
     
-    all_posts = []
-    
-    # 해당 blog_id를 가진 모든 폴더 찾아서 데이터 합치기
-    if BLOG_COLLECTIONS_DIR.exists():
-        for item in BLOG_COLLECTIONS_DIR.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                data_file = item / "_data.json"
-                if data_file.exists():
-                    try:
-                        with open(data_file, 'r', encoding='utf-8') as f:
-                            collection = json.load(f)
-                        if collection.get("blog_id") == blog_id:
-                            all_posts.extend(collection.get("posts", []))
-                    except Exception as _e:
-                        print(f"[WARN] _data.json 읽기 실패: {data_file} — {_e}")
-    
-    if not all_posts:
+    # 해당 blog_id를 가진 폴더만 인덱스로 찾아 데이터 합치기 (url 기준 중복 제거)
+    index = _collection_index()
+    if not index.folders_for_blog(blog_id):
         return jsonify({"error": f"'{blog_id}'에 대한 수집 데이터를 찾을 수 없습니다."}), 404
-    
-    # 중복 글 제거 (url 또는 logNo 기준)
-    seen_urls = set()
-    unique_posts = []
-    for post in all_posts:
-        url = post.get("url")
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            unique_posts.append(post)
-
-    if not unique_posts:
+
+    # 글자수/단락/문장/이미지 실측 통계 + 시각적 스타일 집계 (수집 시 저장된 지표로 캐시 조회 — 본문 읽기 없음)
+    blog_stats = get_blog_stats(index, blog_id)
+    if not blog_stats.get("post_count"):
         return jsonify({"error": f"'{blog_id}'에 대한 유효한 글 데이터가 없습니다."}), 404
 
     try:
-        # 날짜순 정렬 (최신순)
-        unique_posts.sort(key=lambda x: x.get('addDate', ''), reverse=True)
-        
-        # 글자수/단락/문장 실측 통계 사전 계산
-        _char_counts, _para_counts, _sent_counts = [], [], []
-        for post in unique_posts:
-            txt = post.get("content", "")
-            _char_counts.append(len(txt))
-            _para_counts.append(len([p for p in txt.split('\n') if p.strip()]))
-            _sent_counts.append(max(1, txt.count('。') + txt.count('.') + txt.count('!') + txt.count('?')))
-        # 이미지 수 실측 (style_meta.image_count 있으면 사용)
-        _img_counts = [p.get('style_meta', {}).get('image_count', 0) for p in unique_posts]
-        _has_img_data = any(c > 0 for c in _img_counts)
-        _img_line = (
-            f"이미지 수(실측): 평균 {round(_stats.mean(_img_counts), 1)}장 / 최소 {min(_img_counts)}장 / 최대 {max(_img_counts)}장"
-            if _has_img_data else
-            "이미지 수: 실측 데이터 없음 (이전 수집분) — 글 내용에서 추정"
-        )
-        _sorted_chars = sorted(_char_counts)
-        _t1, _t2 = _sorted_chars[len(_sorted_chars)//3], _sorted_chars[2*len(_sorted_chars)//3]
-        _measured_stats = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-【실측 데이터 — 수집된 {len(unique_posts)}개 글 전체 집계 (AI 추정 금지, 이 수치를 그대로 사용)】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-글자수(텍스트 기준): 평균 {round(_stats.mean(_char_counts))}자 / 최소 {min(_char_counts)}자 / 최대 {max(_char_counts)}자 / 중앙값 {round(_stats.median(_char_counts))}자
-단락수: 평균 {round(_stats.mean(_para_counts))}개 / 최소 {min(_para_counts)}개 / 최대 {max(_para_counts)}개
-문장수(추정): 평균 {round(_stats.mean(_sent_counts))}개 / 최소 {min(_sent_counts)}개 / 최대 {max(_sent_counts)}개
-{_img_line}
-분량 분포: 짧은 글({min(_char_counts)}~{_t1}자) {sum(1 for c in _char_counts if c < _t1)}편 / 중간({_t1}~{_t2}자) {sum(1 for c in _char_counts if _t1 <= c < _t2)}편 / 긴 글({_t2}자~) {sum(1 for c in _char_counts if c >= _t2)}편
-"""
+        _measured_stats = render_blog_measured(blog_stats)
+        visual_summary = render_blog_visual(blog_stats)
 
-        # 블로그 글 요약 텍스트 생성 (통합된 데이터 중 최근 15개 분석)
+        # 블로그 글 요약 텍스트 생성 (통합된 데이터 중 최근 15개만 인덱스로 골라 읽음)
+        recent_posts = index.load_posts(blog_id, limit=15)
         blog_summary = ""
-        for i, post in enumerate(unique_posts[:15], 1):
+        for i, post in enumerate(recent_posts, 1):
             txt = post.get("content", "")
-            img_c = post.get('style_meta', {}).get('image_count', None)
+            metrics = ensure_blog_metrics(post)
+            img_c = metrics["images"]
             img_info = f", 이미지: {img_c}장" if img_c is not None else ""
             content = txt[:1500]
-            blog_summary += f"\n\n--- 글 {i}: {post.get('title', '')} (날짜: {post.get('addDate', '')}, 글자수: {len(txt)}자, 단락수: {len([p for p in txt.split(chr(10)) if p.strip()])}개{img_info}) ---\n{content}"
-
-        # 시각적 스타일 메타 집계 (HTML에서 추출한 데이터)
-        style_metas = [p.get("style_meta", {}) for p in unique_posts if p.get("style_meta")]
-        visual_summary = ""
-        if style_metas:
-            avg_center = round(sum(m.get("center_align_ratio", 0) for m in style_metas) / len(style_metas), 2)
-            all_accent = [c for m in style_metas for c, _ in m.get("accent_colors", [])]
-            all_highlight = [c for m in style_metas for c, _ in m.get("highlight_colors", [])]
-            all_fonts = [f for m in style_metas for f in m.get("dominant_fonts", [])]
-            all_sizes = [s for m in style_metas for s in m.get("font_sizes", [])]
-            bold_total = sum(m.get("bold_count", 0) for m in style_metas)
-            italic_total = sum(m.get("italic_count", 0) for m in style_metas)
-            has_quote = any(m.get("has_quote_block") for m in style_metas)
-
-            top_accents = _Counter(all_accent).most_common(5)
-            top_highlights = _Counter(all_highlight).most_common(3)
-            top_fonts = _Counter(all_fonts).most_common(3)
-            top_sizes = _Counter(all_sizes).most_common(3)
-
-            visual_summary = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-【HTML 시각적 스타일 데이터 ({len(style_metas)}개 글 분석)】
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-중앙정렬 비율: {avg_center*100:.0f}% ({"매우 자주 씀" if avg_center > 0.5 else "가끔 씀" if avg_center > 0.2 else "거의 안 씀"})
-강조 색상(텍스트): {', '.join(f'{c}(x{n})' for c, n in top_accents) or '없음'}
-강조 색상(배경/하이라이트): {', '.join(f'{c}(x{n})' for c, n in top_highlights) or '없음'}
-사용 폰트: {', '.join(f for f, _ in top_fonts) or '기본 폰트'}
-폰트 크기: {', '.join(s for s, _ in top_sizes) or '기본'}
-볼드 사용 횟수: {bold_total}회
-이탤릭 사용 횟수: {italic_total}회
-인용구 블록 사용: {"있음" if has_quote else "없음"}
-"""
+            blog_summary += f"\n\n--- 글 {i}: {post.get('title', '')} (날짜: {post.get('addDate', '')}, 글자수: {metrics['chars']}자, 단락수: {metrics['paragraphs']}개{img_info}) ---\n{content}"
 
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             return jsonify({"error": "GEMINI_API_KEY가 설정되지 않았습니다."}), 500
 
-        client = genai.Client(api_key=api_key)
+        client = get_gemini_client()
 
         analysis_prompt = f"""당신은 블로그 글쓰기 DNA 분석 전문가입니다.
 아래는 네이버 블로그 '{blog_id}'에서 수집한 최근 글들입니다.
@@ -2920,15 +2422,18 @@ def analyze_blog_status():
 
 반드시 유효한 JSON으로만 응답하세요. 다른 텍스트는 포함하지 마세요."""
 
-        response = client.models.generate_content(
+        response = llm_generate(
+            client,
             model="gemini-2.0-flash",
-            contents=analysis_prompt
+            contents=analysis_prompt,
+            endpoint="analyze_blog_status",
+            bypass=bool(data.get("no_cache")),
         )
         
         result_text = response.text.strip()
         result = parse_ai_json(result_text)
         result["blog_id"] = blog_id
-        result["post_count"] = len(unique_posts)
+        result["post_count"] = blog_stats["post_count"]
         result["created_at"] = datetime.now().isoformat()
         
         # DNA 분석 결과 자동 저장
@@ -2937,6 +2442,7 @@ def analyze_blog_status():
         dna_path = DNA_DIR / f"{dna_id}.json"
         with open(dna_path, 'w', encoding='utf-8') as f:
             json.dump(result, f, ensure_ascii=False, indent=2)
+        _catalog_record("dna", dna_path, result)
         
         return jsonify(result)
         
@@ -2972,28 +2478,33 @@ def mypage_persona_detail(client_id):
     return jsonify({"error": "이 기능은 이메일 도구로 이전되었습니다."}), 410
 
 
+def _catalog_listing(kind: str):
+    """
+    목록 인덱스 1페이지 응답. 쿼리: limit(기본 50, 최대 200), cursor(이전 응답의 next_cursor),
+    sort(created_at|title), order(desc|asc), q(제목/ID 검색), owner(blog_id/client_id), latest=1(owner별 최신만)
+    """
+    args = request.args
+    try:
+        result = _catalog().list(
+            kind,
+            limit=int(args.get("limit", 50)),
+            cursor=args.get("cursor") or None,
+            sort=args.get("sort", "created_at"),
+            order=args.get("order", "desc"),
+            q=args.get("q", "").strip(),
+            owner=args.get("owner", "").strip(),
+            latest=args.get("latest") == "1",
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(result)
+
+
 @app.route('/api/mypage/blogs', methods=['GET'])
 @login_required
 def mypage_blogs():
-    """생성된 블로그 글 목록"""
-    items = []
-    for fp in OUTPUT_DIR.glob("BLOG_*.json"):
-        try:
-            data = load_blog_package(fp)
-            versions = data.get("versions", [])
-            title = versions[0].get("title", "") if versions else ""
-            items.append({
-                "id": data.get("output_id", fp.stem),
-                "title": title,
-                "client_id": data.get("client_id", ""),
-                "version_count": len(versions),
-                "created_at": data.get("created_at", ""),
-                "filename": fp.name
-            })
-        except Exception:
-            pass
-    items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    return jsonify({"items": items})
+    """생성된 블로그 글 목록 (페이지 단위)"""
+    return _catalog_listing("blogs")
 
 
 @app.route('/api/mypage/blogs/<blog_id>', methods=['GET'])
@@ -3010,26 +2521,8 @@ def mypage_blog_detail(blog_id):
 @app.route('/api/mypage/dna', methods=['GET'])
 @login_required
 def mypage_dna_list():
-    """DNA 분석 결과 목록"""
-    items = []
-    for fp in DNA_DIR.glob("DNA_*.json"):
-        try:
-            with open(fp, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            items.append({
-                "id": data.get("dna_id", fp.stem),
-                "blog_id": data.get("blog_id", ""),
-                "folder": data.get("folder", ""),
-                "post_count": data.get("post_count", 0),
-                "created_at": data.get("created_at", ""),
-                "filename": fp.name,
-                "has_c21": bool(data.get("c21_inline_formatting")),
-                "has_c22": bool(data.get("c22_content_patterns")),
-            })
-        except Exception:
-            pass
-    items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    return jsonify({"items": items})
+    """DNA 분석 결과 목록 (페이지 단위)"""
+    return _catalog_listing("dna")
 
 
 @app.route('/api/mypage/dna/<dna_id>', methods=['GET'])
@@ -3047,25 +2540,8 @@ def mypage_dna_detail(dna_id):
 @app.route('/api/mypage/business', methods=['GET'])
 @login_required
 def mypage_business_list():
-    """업무적 성격 분석 결과 목록"""
-    items = []
-    for fp in BUSINESS_DIR.glob("BIZ_*.json"):
-        try:
-            with open(fp, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            bp = data.get("business_personality", {})
-            items.append({
-                "id": data.get("biz_id", fp.stem),
-                "client_id": data.get("client_id", ""),
-                "blog_folder": data.get("blog_folder", ""),
-                "type": bp.get("type", ""),
-                "created_at": data.get("created_at", ""),
-                "filename": fp.name
-            })
-        except Exception:
-            pass
-    items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    return jsonify({"items": items})
+    """업무적 성격 분석 결과 목록 (페이지 단위)"""
+    return _catalog_listing("business")
 
 
 @app.route('/api/mypage/business/<biz_id>', methods=['GET'])
@@ -3094,6 +2570,7 @@ def update_dna_tags(dna_id):
     data["updated_at"] = datetime.now().isoformat()
     with open(fp, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+    _catalog_record("dna", fp, data)
     return jsonify({"success": True})
 
 
@@ -3115,9 +2592,11 @@ def mypage_delete(data_type, item_id):
         return jsonify({"error": "항목을 찾을 수 없습니다."}), 404
     
     fp.unlink()
+    _catalog().remove(data_type, item_id)
     
-    # 블로그의 경우 MD 파일도 삭제
+    # 블로그의 경우 MD 파일도 삭제 + 이미지 참조 해제
     if data_type == "blogs":
+        get_image_store(MEDIA_DIR, MEDIA_URL).release(item_id)
         primary_md = target_dir / f"{item_id}.md"
         if primary_md.exists():
             primary_md.unlink()
@@ -3141,6 +2620,7 @@ def _get_valid_google_token():
     if expires_at and _time.time() > expires_at - 300:
         if not refresh_token:
             return None  # refresh_token 없으면 재로그인 필요
+        import requests as http_requests
         resp = http_requests.post('https://oauth2.googleapis.com/token', data={
             'client_id': GOOGLE_CLIENT_ID,
             'client_secret': GOOGLE_CLIENT_SECRET,
@@ -3165,6 +2645,7 @@ def export_to_google_docs():
     if not access_token:
         return jsonify({"error": "Google 로그인이 필요합니다. 다시 로그인해주세요.", "login_required": True}), 401
 
+    import requests as http_requests
     data = request.get_json()
     data_type = data.get('type', 'blogs')
     item_id = data.get('id', '')
@@ -3312,6 +2793,120 @@ def _build_doc_content(data_type, data, item_id):
     return doc_title, requests_list
 
 
+# ============================================================
+# Maintenance (백그라운드 정리 작업 — maintenance.py 스케줄러)
+# ============================================================
+
+def _maint_generated_files(budget) -> dict:
+    """보관 기간이 지난 BLOG_*.json/.md 삭제 + 삭제된 패키지의 이미지 참조 해제."""
+    media_store = get_image_store(MEDIA_DIR, MEDIA_URL)
+
+    def _release(path: Path):
+        if path.suffix == ".json":
+            media_store.release(path.stem)
+
+    return sweep_files(OUTPUT_DIR.glob("BLOG_*"), GENERATED_TTL_DAYS * 86400, budget, on_remove=_release)
+
+
+def _maint_uploads(budget) -> dict:
+    return sweep_files((p for p in UPLOADS_DIR.iterdir() if p.is_file()), UPLOADS_TTL_DAYS * 86400, budget)
+
+
+def _maint_temp_files(budget) -> dict:
+    """작업 도중 프로세스가 죽어 남은 임시 업로드/PDF, OCR 임시 폴더 회수."""
+    tmp_dir = Path(tempfile.gettempdir())
+    paths = [*tmp_dir.glob(f"{TEMP_PREFIX}*"), *tmp_dir.glob("pdf_ocr_*")]
+    return sweep_files(paths, TEMP_FILE_TTL_HOURS * 3600, budget)
+
+
+def _maint_artifacts(budget) -> dict:
+    """블로그별 DNA 버전, 스타일 템플릿별 보정 기록 중 최신 ARTIFACT_KEEP_VERSIONS개 밖의 오래된 파일 삭제."""
+    dna_groups: dict[str, list[Path]] = {}
+    for fp in DNA_DIR.glob("DNA_*.json"):
+        m = re.fullmatch(r"DNA_(.+)_\d{8}_\d{6}", fp.stem)
+        dna_groups.setdefault(m.group(1) if m else fp.stem, []).append(fp)
+
+    cal_groups: dict[str, list[Path]] = {}
+    for fp in CALIBRATIONS_DIR.glob("CAL_*.json"):
+        try:
+            key = json.loads(fp.read_text(encoding='utf-8')).get("style_template_id", "")
+        except Exception:
+            key = ""
+        cal_groups.setdefault(key, []).append(fp)
+
+    max_age = ARTIFACT_TTL_DAYS * 86400
+    dna = prune_versions(dna_groups, ARTIFACT_KEEP_VERSIONS, max_age, budget)
+    cal = prune_versions(cal_groups, ARTIFACT_KEEP_VERSIONS, max_age, budget)
+    return {"dna": dna, "calibrations": cal, "partial": bool(dna.get("partial") or cal.get("partial"))}
+
+
+def _maint_collections(budget) -> dict:
+    """남은 수집 스냅샷을 증분 저장소로 병합/정리하고 인덱스를 디스크와 맞춘다."""
+    crawler = _load_crawler()
+    if crawler is None:
+        return {"skipped": "blog_pull 크롤러 없음"}
+    _run_crawler, _ = crawler
+    result = _run_crawler.compact_collections(budget=budget)
+    result["index"] = _collection_index().sync()
+    return result
+
+
+def _maint_caches(budget) -> dict:
+    """LLM 응답 캐시 TTL 정리, 추출/HTTP 캐시 크기 정리, 만료된 Gemini 업로드 파일 삭제."""
+    from utils import prune_extraction_cache
+    result = {"llm": llm_cache_prune(), "extraction": prune_extraction_cache(), "http": get_http_cache().prune()}
+    client = get_gemini_client()
+    if client is not None and not budget.exceeded():
+        result["gemini_files"] = _gemini_files.cleanup_expired(client, force=True)
+    return result
+
+
+def _register_maintenance_tasks(scheduler):
+    # initial_delay를 엇갈려 기동 직후 한꺼번에 돌지 않도록 함
+    scheduler.register("generated_files", _maint_generated_files, 6 * 3600, initial_delay=30)
+    scheduler.register("temp_files", _maint_temp_files, 3600, initial_delay=60)
+    scheduler.register("uploads", _maint_uploads, 24 * 3600, initial_delay=90)
+    scheduler.register("jobs", lambda budget: {"removed": _job_queue.prune_jobs()}, 24 * 3600, initial_delay=120)
+    scheduler.register("caches", _maint_caches, 6 * 3600, initial_delay=180)
+    scheduler.register("media_gc", lambda budget: get_image_store(MEDIA_DIR, MEDIA_URL).gc(budget=budget),
+                       MEDIA_GC_INTERVAL_SEC, initial_delay=240)
+    scheduler.register("artifacts", _maint_artifacts, 24 * 3600, budget_sec=60, initial_delay=300)
+    scheduler.register("collections", _maint_collections, 12 * 3600, budget_sec=120, initial_delay=600)
+    # 폴더 mtime으로 못 잡는 제자리 수정(CLI 재저장 등)까지 맞추는 전체 대조
+    scheduler.register("catalog", lambda budget: _catalog().sync(force=True), 24 * 3600, initial_delay=420)
+
+
+# ============================================================
+# Warm-up (기동 후 백그라운드 스레드)
+# ============================================================
+
+def _warmup_tasks() -> list:
+    tasks = [("style_templates", lambda: len(_load_style_templates()[0]))]
+    if _startup.STARTUP_PRELOAD:
+        tasks.append(("preload", _startup.preload_modules))
+        tasks.append(("crawler", lambda: _load_crawler() is not None))
+        tasks.append(("gemini_client", lambda: get_gemini_client() is not None))
+    return tasks
+
+
+_startup.mark("routes")
+
+
+def start_background_services() -> bool:
+    """
+    warm-up 스레드와 유지보수 스케줄러 시작 — 서버 진입점(__main__)에서만 호출한다.
+    app을 import만 하는 프로세스(ingestion 프로세스 풀의 spawn 자식 등)는 warm-up도, 파일 정리 스케줄러도 띄우지 않는다.
+    WSGI 서버가 app을 import해 띄우는 경우에는 이 함수를 직접 한 번 호출.
+    """
+    if multiprocessing.parent_process() is not None:
+        return False
+    _startup.start_warmup(_warmup_tasks())
+    scheduler = get_maintenance_scheduler()
+    _register_maintenance_tasks(scheduler)
+    scheduler.start()
+    return True
+
+
 # ============================================================
 # Run Server
 # ============================================================
@@ -3324,10 +2919,12 @@ if __name__ == '__main__':
     port = int(os.getenv('PORT', 5050))
     print(f"  서버: http://localhost:{port}")
     print(f"  출력 폴더: {OUTPUT_DIR}")
-    print(f"  스타일 템플릿: {len(STYLE_TEMPLATES)}개")
+    print(f"  스타일 템플릿: {len(_load_style_templates()[0])}개")
     print("=" * 60)
+    start_background_services()
 
     from waitress import serve
     print("  WSGI: waitress (production)")
-    serve(app, host='0.0.0.0', port=port, threads=4)
+    # SSE 연결이 스레드를 잠시 점유하므로 기본 4 → 8 (WAITRESS_THREADS로 조정)
+    serve(app, host='0.0.0.0', port=port, threads=int(os.getenv('WAITRESS_THREADS', 8)))
 
@@ -0,0 +1,162 @@
+"""
+블로그 글 통계 — blog_stats.py
+DNA 분석(analyze_blog_status) 때마다 전체 글 본문을 다시 세지 않도록
+글 단위 지표는 수집 시점에 한 번 계산해 글과 함께 저장하고(post["metrics"]),
+블로그 단위 집계는 수집 인덱스에 저장된 지표만으로 만든 뒤 수집 데이터가 바뀔 때까지 재사용한다.
+
+run_crawler.py / collection_index.py / app.py에서 import하여 사용:
+  ensure_metrics(post) -> dict             # 저장 전 글마다 호출 (이미 있으면 그대로)
+  get_blog_stats(index, blog_id) -> dict   # 인덱스 캐시 hit 시 본문/JSON 읽기 없음
+  render_measured(stats) -> str            # 분석 프롬프트의 【실측 데이터】 블록
+  render_visual(stats) -> str              # 【HTML 시각적 스타일 데이터】 블록 (없으면 "")
+"""
+
+import statistics as _stats
+from collections import Counter
+
+# 지표 계산 방식이 바뀌면 올려서 저장된 지표를 다시 계산하게 한다
+METRICS_VERSION = 1
+
+_STYLE_KEYS = (
+    "center_align_ratio", "accent_colors", "highlight_colors", "dominant_fonts",
+    "font_sizes", "bold_count", "italic_count", "has_quote_block",
+)
+
+
+# ──────────────────────────────────────────
+# 글 단위 지표
+# ──────────────────────────────────────────
+
+def post_metrics(post: dict) -> dict:
+    """글 1개의 글자수/단락수/문장수/이미지수 + 스타일 메타 요약."""
+    txt = post.get("content", "") or ""
+    style_meta = post.get("style_meta") or {}
+    return {
+        "v": METRICS_VERSION,
+        "chars": len(txt),
+        "paragraphs": len([p for p in txt.split('\n') if p.strip()]),
+        "sentences": max(1, txt.count('。') + txt.count('.') + txt.count('!') + txt.count('?')),
+        # 이전 수집분은 image_count가 없음 → None (글 요약에서 생략)
+        "images": style_meta.get("image_count"),
+        "style": {k: style_meta.get(k) for k in _STYLE_KEYS if k in style_meta} if style_meta else None,
+    }
+
+
+def ensure_metrics(post: dict) -> dict:
+    """post["metrics"]가 없거나 버전이 다르면 계산해서 넣고 반환."""
+    metrics = post.get("metrics")
+    if not isinstance(metrics, dict) or metrics.get("v") != METRICS_VERSION:
+        metrics = post_metrics(post)
+        post["metrics"] = metrics
+    return metrics
+
+
+# ──────────────────────────────────────────
+# 블로그 단위 집계
+# ──────────────────────────────────────────
+
+def _summary(values: list[int]) -> dict:
+    return {"mean": _stats.mean(values), "min": min(values), "max": max(values)}
+
+
+def aggregate(metrics_list: list[dict]) -> dict:
+    """
+    글 지표 목록(최신 순) → 블로그 집계.
+    스타일 색상/폰트 순위는 글 순서에 따라 동률이 갈리므로 load_posts와 같은 순서로 넘겨야 한다.
+    """
+    if not metrics_list:
+        return {"post_count": 0}
+
+    char_counts = [m["chars"] for m in metrics_list]
+    img_counts = [m.get("images") or 0 for m in metrics_list]
+    sorted_chars = sorted(char_counts)
+    t1, t2 = sorted_chars[len(sorted_chars) // 3], sorted_chars[2 * len(sorted_chars) // 3]
+
+    stats = {
+        "post_count": len(metrics_list),
+        "chars": {
+            **_summary(char_counts),
+            "median": _stats.median(char_counts),
+            "t1": t1,
+            "t2": t2,
+            "short": sum(1 for c in char_counts if c < t1),
+            "mid": sum(1 for c in char_counts if t1 <= c < t2),
+            "long": sum(1 for c in char_counts if c >= t2),
+        },
+        "paragraphs": _summary([m["paragraphs"] for m in metrics_list]),
+        "sentences": _summary([m["sentences"] for m in metrics_list]),
+        "images": {**_summary(img_counts), "has_data": any(c > 0 for c in img_counts)},
+        "style": None,
+    }
+
+    style_metas = [m["style"] for m in metrics_list if m.get("style")]
+    if style_metas:
+        stats["style"] = {
+            "post_count": len(style_metas),
+            "avg_center": round(sum(s.get("center_align_ratio", 0) for s in style_metas) / len(style_metas), 2),
+            "top_accents": Counter(c for s in style_metas for c, _ in s.get("accent_colors", [])).most_common(5),
+            "top_highlights": Counter(c for s in style_metas for c, _ in s.get("highlight_colors", [])).most_common(3),
+            "top_fonts": Counter(f for s in style_metas for f in s.get("dominant_fonts", [])).most_common(3),
+            "top_sizes": Counter(z for s in style_metas for z in s.get("font_sizes", [])).most_common(3),
+            "bold_total": sum(s.get("bold_count", 0) for s in style_metas),
+            "italic_total": sum(s.get("italic_count", 0) for s in style_metas),
+            "has_quote": any(s.get("has_quote_block") for s in style_metas),
+        }
+    return stats
+
+
+def get_blog_stats(index, blog_id: str) -> dict:
+    """
+    blog_id 집계 조회. 인덱스에 저장된 집계가 현재 수집 데이터(signature)와 같으면 그대로 반환하고,
+    아니면 인덱스의 글 지표만으로 다시 집계해 저장한다.
+    """
+    signature = index.signature(blog_id)
+    stats = index.load_blog_stats(blog_id, signature)
+    if stats is None:
+        stats = aggregate(index.post_metrics(blog_id))
+        index.save_blog_stats(blog_id, signature, stats)
+    return stats
+
+
+# ──────────────────────────────────────────
+# 프롬프트 렌더링
+# ──────────────────────────────────────────
+
+def render_measured(stats: dict) -> str:
+    chars, paras, sents, imgs = stats["chars"], stats["paragraphs"], stats["sentences"], stats["images"]
+    img_line = (
+        f"이미지 수(실측): 평균 {round(imgs['mean'], 1)}장 / 최소 {imgs['min']}장 / 최대 {imgs['max']}장"
+        if imgs["has_data"] else
+        "이미지 수: 실측 데이터 없음 (이전 수집분) — 글 내용에서 추정"
+    )
+    t1, t2 = chars["t1"], chars["t2"]
+    return f"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+【실측 데이터 — 수집된 {stats['post_count']}개 글 전체 집계 (AI 추정 금지, 이 수치를 그대로 사용)】
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+글자수(텍스트 기준): 평균 {round(chars['mean'])}자 / 최소 {chars['min']}자 / 최대 {chars['max']}자 / 중앙값 {round(chars['median'])}자
+단락수: 평균 {round(paras['mean'])}개 / 최소 {paras['min']}개 / 최대 {paras['max']}개
+문장수(추정): 평균 {round(sents['mean'])}개 / 최소 {sents['min']}개 / 최대 {sents['max']}개
+{img_line}
+분량 분포: 짧은 글({chars['min']}~{t1}자) {chars['short']}편 / 중간({t1}~{t2}자) {chars['mid']}편 / 긴 글({t2}자~) {chars['long']}편
+"""
+
+
+def render_visual(stats: dict) -> str:
+    style = stats.get("style")
+    if not style:
+        return ""
+    avg_center = style["avg_center"]
+    return f"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+【HTML 시각적 스타일 데이터 ({style['post_count']}개 글 분석)】
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+중앙정렬 비율: {avg_center*100:.0f}% ({"매우 자주 씀" if avg_center > 0.5 else "가끔 씀" if avg_center > 0.2 else "거의 안 씀"})
+강조 색상(텍스트): {', '.join(f'{c}(x{n})' for c, n in style['top_accents']) or '없음'}
+강조 색상(배경/하이라이트): {', '.join(f'{c}(x{n})' for c, n in style['top_highlights']) or '없음'}
+사용 폰트: {', '.join(f for f, _ in style['top_fonts']) or '기본 폰트'}
+폰트 크기: {', '.join(s for s, _ in style['top_sizes']) or '기본'}
+볼드 사용 횟수: {style['bold_total']}회
+이탤릭 사용 횟수: {style['italic_total']}회
+인용구 블록 사용: {"있음" if style['has_quote'] else "없음"}
+"""
@@ -0,0 +1,274 @@
+"""
+마이페이지 목록 인덱스 — catalog_index.py
+생성 글(BLOG_*), DNA 분석(DNA_*), 업무 성격(BIZ_*) JSON을 목록 조회 때마다 전부 읽지 않도록
+파일별 요약 필드만 SQLite에 저장해 두고, 커서 기반 페이지 단위로 돌려준다.
+
+app.py에서 import하여 사용:
+  catalog = get_catalog(db_path, sources)   # sources: {kind: (디렉토리, glob 패턴)}
+  catalog.record(kind, path, data)          # 저장/수정 직후 (data 미지정 시 파일에서 읽음)
+  catalog.remove(kind, name)                # 삭제 직후 (name = 파일명에서 .json 뺀 것)
+  catalog.list(kind, limit=50, cursor=None, sort="created_at", order="desc",
+               q="", owner="", latest=False) -> {"items", "next_cursor", "total"}
+  catalog.sync(kind=None, force=False)      # 디스크와 대조 (유지보수 작업에서 force=True)
+
+동기화: CLI/MCP 서버가 같은 폴더에 쓰거나 정리 작업이 파일을 지우면 폴더 mtime이 바뀌므로,
+조회 전에 폴더 mtime만 확인하고 바뀌었을 때만 파일 mtime을 비교해 바뀐 파일만 다시 읽는다.
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from blog_storage import blog_package_summary
+
+MAX_PAGE_SIZE = 200
+SORT_COLUMNS = ("created_at", "title")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    kind        TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    mtime_ns    INTEGER NOT NULL DEFAULT 0,
+    created_at  TEXT NOT NULL DEFAULT '',
+    title       TEXT NOT NULL DEFAULT '',
+    owner       TEXT NOT NULL DEFAULT '',
+    summary     TEXT NOT NULL,
+    PRIMARY KEY (kind, name)
+);
+CREATE INDEX IF NOT EXISTS idx_items_created ON items(kind, created_at, name);
+CREATE INDEX IF NOT EXISTS idx_items_title ON items(kind, title, name);
+CREATE INDEX IF NOT EXISTS idx_items_owner ON items(kind, owner, created_at, name);
+"""
+
+
+# ──────────────────────────────────────────
+# 종류별 요약 (기존 /api/mypage 목록 응답 필드)
+# ──────────────────────────────────────────
+
+def _blog_summary(data: dict, name: str) -> dict:
+    summary = blog_package_summary(data)
+    summary["id"] = data.get("output_id", name)
+    return summary
+
+
+def _dna_summary(data: dict, name: str) -> dict:
+    return {
+        "id": data.get("dna_id", name),
+        "blog_id": data.get("blog_id", ""),
+        "folder": data.get("folder", ""),
+        "post_count": data.get("post_count", 0),
+        "created_at": data.get("created_at", ""),
+        "has_c21": bool(data.get("c21_inline_formatting")),
+        "has_c22": bool(data.get("c22_content_patterns")),
+    }
+
+
+def _business_summary(data: dict, name: str) -> dict:
+    bp = data.get("business_personality", {})
+    return {
+        "id": data.get("biz_id", name),
+        "client_id": data.get("client_id", ""),
+        "blog_folder": data.get("blog_folder", ""),
+        "type": bp.get("type", ""),
+        "created_at": data.get("created_at", ""),
+    }
+
+
+# kind → (요약 함수, 제목 필드, owner 필드) — 제목은 q 검색/정렬, owner는 필터/latest 기준
+_KINDS = {
+    "blogs": (_blog_summary, "title", "client_id"),
+    "dna": (_dna_summary, "blog_id", "blog_id"),
+    "business": (_business_summary, "type", "client_id"),
+}
+
+
+def _encode_cursor(key: str, name: str) -> str:
+    raw = json.dumps([key, name], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key, name = json.loads(raw.decode("utf-8"))
+        return str(key), str(name)
+    except Exception:
+        raise ValueError("잘못된 cursor 값입니다.")
+
+
+class CatalogIndex:
+    """SQLite 파일 1개에 여러 종류(kind)의 목록을 담는 인덱스."""
+
+    def __init__(self, db_path: Path, sources: dict[str, tuple[Path, str]]):
+        self.db_path = Path(db_path)
+        self.sources = {kind: (Path(d), pattern) for kind, (d, pattern) in sources.items()}
+        unknown = set(self.sources) - set(_KINDS)
+        if unknown:
+            raise ValueError(f"지원하지 않는 목록 종류: {sorted(unknown)}")
+        self._dir_mtimes: dict[str, int | None] = {}
+        self._sync_lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ──────────────────────────────────────────
+    # 쓰기
+    # ──────────────────────────────────────────
+
+    def _row(self, kind: str, path: Path, data: dict, mtime_ns: int) -> tuple:
+        summarize, title_field, owner_field = _KINDS[kind]
+        summary = summarize(data, path.stem)
+        summary["filename"] = path.name
+        return (
+            kind, path.stem, mtime_ns, str(summary.get("created_at") or ""),
+            str(summary.get(title_field) or ""), str(summary.get(owner_field) or ""),
+            json.dumps(summary, ensure_ascii=False),
+        )
+
+    def record(self, kind: str, path: Path, data: dict | None = None):
+        """파일 1개의 요약을 반영 (data 미지정 시 파일에서 읽음)."""
+        path = Path(path)
+        mtime_ns = path.stat().st_mtime_ns
+        if data is None:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO items (kind, name, mtime_ns, created_at, title, owner, summary) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._row(kind, path, data, mtime_ns),
+            )
+
+    def remove(self, kind: str, name: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM items WHERE kind = ? AND name = ?", (kind, name))
+
+    def sync(self, kind: str | None = None, force: bool = False) -> dict:
+        """
+        폴더 mtime이 지난 확인 이후 바뀌었으면(또는 force) 파일 목록과 대조:
+        새/변경 파일만 다시 읽고, 사라진 파일은 제거한다.
+        """
+        result = {}
+        for k in ([kind] if kind else list(self.sources)):
+            with self._sync_lock:
+                result[k] = self._sync_kind(k, force)
+        return result
+
+    def _sync_kind(self, kind: str, force: bool) -> dict | None:
+        directory, pattern = self.sources[kind]
+        try:
+            dir_mtime = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = 0
+        if not force and self._dir_mtimes.get(kind) == dir_mtime:
+            return None
+
+        with self._connect() as conn:
+            indexed = dict(conn.execute("SELECT name, mtime_ns FROM items WHERE kind = ?", (kind,)).fetchall())
+
+        rows, failed, on_disk = [], 0, set()
+        for path in (directory.glob(pattern) if dir_mtime else []):
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            on_disk.add(path.stem)
+            if indexed.get(path.stem) == mtime_ns:
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    rows.append(self._row(kind, path, json.load(f), mtime_ns))
+            except (OSError, ValueError):
+                failed += 1  # 쓰는 중이거나 깨진 파일 — 다음 조회 때 다시 시도
+
+        removed = [name for name in indexed if name not in on_disk]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO items (kind, name, mtime_ns, created_at, title, owner, summary) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany("DELETE FROM items WHERE kind = ? AND name = ?", [(kind, n) for n in removed])
+        self._dir_mtimes[kind] = None if failed else dir_mtime
+        if rows or removed:
+            print(f"[OK] 목록 인덱스 동기화 ({kind}): +{len(rows)} / -{len(removed)}")
+        return {"indexed": len(rows), "removed": len(removed), "failed": failed}
+
+    # ──────────────────────────────────────────
+    # 조회
+    # ──────────────────────────────────────────
+
+    def list(self, kind: str, limit: int = 50, cursor: str | None = None, sort: str = "created_at",
+             order: str = "desc", q: str = "", owner: str = "", latest: bool = False) -> dict:
+        """
+        요약 목록 1페이지. 정렬 키 + 파일명으로 커서를 만들어 다음 페이지를 이어서 읽는다.
+        latest=True면 owner(블로그/클라이언트)별 가장 최근 항목만.
+        """
+        if kind not in self.sources:
+            raise ValueError(f"지원하지 않는 목록 종류: {kind}")
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"sort는 {', '.join(SORT_COLUMNS)} 중 하나여야 합니다.")
+        if order not in ("asc", "desc"):
+            raise ValueError("order는 asc 또는 desc여야 합니다.")
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        self.sync(kind)
+
+        where, args = ["i.kind = ?"], [kind]
+        if owner:
+            where.append("i.owner = ?")
+            args.append(owner)
+        if q:
+            pattern = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            where.append("(i.title LIKE ? ESCAPE '\\' OR i.name LIKE ? ESCAPE '\\')")
+            args += [pattern, pattern]
+        if latest:
+            where.append(
+                "NOT EXISTS (SELECT 1 FROM items j WHERE j.kind = i.kind AND j.owner = i.owner "
+                "AND (j.created_at > i.created_at OR (j.created_at = i.created_at AND j.name > i.name)))"
+            )
+
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM items i WHERE {' AND '.join(where)}", args).fetchone()[0]
+            if cursor:
+                key, name = _decode_cursor(cursor)
+                op = "<" if order == "desc" else ">"
+                where.append(f"(i.{sort} {op} ? OR (i.{sort} = ? AND i.name {op} ?))")
+                args += [key, key, name]
+            rows = conn.execute(
+                f"SELECT i.name, i.{sort} AS sort_key, i.summary FROM items i "
+                f"WHERE {' AND '.join(where)} ORDER BY i.{sort} {order}, i.name {order} LIMIT ?",
+                (*args, limit + 1),
+            ).fetchall()
+
+        page = rows[:limit]
+        next_cursor = _encode_cursor(page[-1]["sort_key"], page[-1]["name"]) if len(rows) > limit else None
+        return {
+            "items": [json.loads(r["summary"]) for r in page],
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+
+
+_catalogs: dict[str, CatalogIndex] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(db_path: Path | str, sources: dict[str, tuple[Path, str]]) -> CatalogIndex:
+    """db_path별 인덱스 싱글턴."""
+    key = os.path.abspath(str(db_path))
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = CatalogIndex(Path(db_path), sources)
+            _catalogs[key] = catalog
+        return catalog
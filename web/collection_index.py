@@ -0,0 +1,382 @@
+"""
+블로그 수집 데이터 인덱스 — collection_index.py
+수집 폴더마다 _data.json(본문 포함)을 전부 읽지 않고 blog_id로 바로 조회하기 위한 SQLite 인덱스.
+
+run_crawler.py / app.py에서 import하여 사용:
+  idx = get_index(collections_dir)
+  idx.record_collection(folder, data)     # save_results 직후
+  idx.remove_collection(folder_name)      # 오래된 폴더 정리 시
+  idx.list_blogs() -> list[dict]          # blog_id별 통합 요약 (JSON 읽기 없음)
+  idx.load_posts(blog_id) -> list[dict]   # 해당 blog_id 폴더의 _data.json만 읽음
+  idx.load_posts(blog_id, limit=15)       # 최신 15개만 (인덱스로 고른 뒤 해당 폴더만 읽음)
+  idx.known_log_nos(blog_id) -> set[str]  # 증분 수집용 (이미 받은 글)
+  idx.post_metrics(blog_id) -> list[dict] # 글 단위 통계 지표 (blog_stats 집계용, JSON 읽기 없음)
+
+인덱스 파일: {collections_dir}/_index.sqlite3
+디스크와 어긋나면(수동 삭제/복사 등) 첫 조회 시 폴더 mtime 비교로 자동 동기화한다.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+from blog_stats import ensure_metrics
+
+INDEX_FILENAME = "_index.sqlite3"
+DATA_FILENAME = "_data.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS collections (
+    folder        TEXT PRIMARY KEY,
+    blog_id       TEXT NOT NULL,
+    collected_at  TEXT NOT NULL DEFAULT '',
+    post_count    INTEGER NOT NULL DEFAULT 0,
+    total_chars   INTEGER NOT NULL DEFAULT 0,
+    data_mtime    REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_collections_blog ON collections(blog_id);
+
+CREATE TABLE IF NOT EXISTS posts (
+    folder      TEXT NOT NULL,
+    url         TEXT NOT NULL,
+    blog_id     TEXT NOT NULL,
+    log_no      TEXT NOT NULL DEFAULT '',
+    title       TEXT NOT NULL DEFAULT '',
+    add_date    TEXT NOT NULL DEFAULT '',
+    char_count  INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (folder, url)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_blog ON posts(blog_id, add_date);
+
+CREATE TABLE IF NOT EXISTS post_metrics (
+    folder      TEXT NOT NULL,
+    url         TEXT NOT NULL,
+    blog_id     TEXT NOT NULL,
+    position    INTEGER NOT NULL DEFAULT 0,
+    metrics     TEXT NOT NULL,
+    PRIMARY KEY (folder, url)
+);
+CREATE INDEX IF NOT EXISTS idx_post_metrics_blog ON post_metrics(blog_id);
+
+CREATE TABLE IF NOT EXISTS blog_stats (
+    blog_id     TEXT PRIMARY KEY,
+    signature   TEXT NOT NULL,
+    stats       TEXT NOT NULL
+);
+"""
+
+
+class CollectionIndex:
+    """collections_dir 하나에 대응하는 인덱스."""
+
+    def __init__(self, collections_dir: Path):
+        self.collections_dir = Path(collections_dir)
+        self.db_path = self.collections_dir / INDEX_FILENAME
+        self._synced = False
+        self._sync_lock = threading.Lock()
+        self.collections_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ──────────────────────────────────────────
+    # 쓰기
+    # ──────────────────────────────────────────
+
+    def record_collection(self, folder: Path, data: dict | None = None):
+        """수집 폴더 1개를 인덱스에 반영 (data 미지정 시 _data.json에서 읽음)."""
+        folder = Path(folder)
+        data_file = folder / DATA_FILENAME
+        if data is None:
+            with open(data_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        blog_id = data.get("blog_id", "")
+        if not blog_id:
+            return
+        try:
+            mtime = data_file.stat().st_mtime
+        except OSError:
+            mtime = 0.0
+
+        posts = data.get("posts", []) or []
+        rows, metric_rows = [], []
+        for position, post in enumerate(posts):
+            url = post.get("url") or ""
+            if not url:
+                continue
+            rows.append((
+                folder.name, url, blog_id,
+                str(post.get("logNo", "")),
+                post.get("title", "") or "",
+                post.get("addDate", "") or "",
+                len(post.get("content", "") or ""),
+            ))
+            # 수집 시 계산된 지표 사용 (이전 수집분은 여기서 한 번 계산)
+            metric_rows.append((
+                folder.name, url, blog_id, position,
+                json.dumps(ensure_metrics(post), ensure_ascii=False),
+            ))
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM posts WHERE folder = ?", (folder.name,))
+            conn.execute("DELETE FROM post_metrics WHERE folder = ?", (folder.name,))
+            conn.execute(
+                "INSERT OR REPLACE INTO collections "
+                "(folder, blog_id, collected_at, post_count, total_chars, data_mtime) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    folder.name, blog_id,
+                    data.get("collected_at", folder.name),
+                    len(posts),
+                    sum(len(p.get("content", "") or "") for p in posts),
+                    mtime,
+                ),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO posts "
+                "(folder, url, blog_id, log_no, title, add_date, char_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO post_metrics (folder, url, blog_id, position, metrics) "
+                "VALUES (?, ?, ?, ?, ?)",
+                metric_rows,
+            )
+
+    def remove_collection(self, folder_name: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM posts WHERE folder = ?", (folder_name,))
+            conn.execute("DELETE FROM post_metrics WHERE folder = ?", (folder_name,))
+            conn.execute("DELETE FROM collections WHERE folder = ?", (folder_name,))
+
+    def sync(self) -> dict:
+        """디스크 폴더와 인덱스 대조 — 새/변경 폴더는 색인, 사라진 폴더는 제거."""
+        with self._connect() as conn:
+            indexed = {row["folder"]: row["data_mtime"]
+                       for row in conn.execute("SELECT folder, data_mtime FROM collections")}
+
+        added = removed = 0
+        on_disk = set()
+        for item in self.collections_dir.iterdir():
+            if not item.is_dir() or item.name.startswith('.'):
+                continue
+            data_file = item / DATA_FILENAME
+            if not data_file.exists():
+                continue
+            on_disk.add(item.name)
+            try:
+                mtime = data_file.stat().st_mtime
+            except OSError:
+                continue
+            if indexed.get(item.name) == mtime:
+                continue
+            try:
+                self.record_collection(item)
+                added += 1
+            except Exception as e:
+                print(f"[WARN] 수집 폴더 색인 실패: {item.name} — {e}")
+
+        for folder_name in set(indexed) - on_disk:
+            self.remove_collection(folder_name)
+            removed += 1
+
+        if added or removed:
+            print(f"[OK] 수집 인덱스 동기화: +{added} / -{removed}")
+        return {"indexed": added, "removed": removed}
+
+    def _ensure_synced(self):
+        if self._synced:
+            return
+        with self._sync_lock:
+            if not self._synced:
+                self.sync()
+                self._synced = True
+
+    # ──────────────────────────────────────────
+    # 조회
+    # ──────────────────────────────────────────
+
+    def list_blogs(self) -> list[dict]:
+        """blog_id별 통합 요약 (최근 수집 순). /api/blog/collections 응답 형식."""
+        self._ensure_synced()
+        blog_map: dict[str, dict] = {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT folder, blog_id, collected_at, post_count, total_chars "
+                "FROM collections ORDER BY collected_at DESC, folder DESC"
+            ).fetchall()
+        for row in rows:
+            entry = blog_map.get(row["blog_id"])
+            if entry is None:
+                blog_map[row["blog_id"]] = {
+                    "blog_id": row["blog_id"],
+                    "folders": [row["folder"]],
+                    "post_count": row["post_count"],
+                    "total_chars": row["total_chars"],
+                    "last_collected_at": row["collected_at"],
+                }
+            else:
+                entry["folders"].append(row["folder"])
+                entry["post_count"] += row["post_count"]
+                entry["total_chars"] += row["total_chars"]
+        return list(blog_map.values())
+
+    def folders_for_blog(self, blog_id: str) -> list[str]:
+        """blog_id의 수집 폴더 목록 (최신 순)."""
+        self._ensure_synced()
+        with self._connect() as conn:
+            return [row["folder"] for row in conn.execute(
+                "SELECT folder FROM collections WHERE blog_id = ? "
+                "ORDER BY collected_at DESC, folder DESC",
+                (blog_id,),
+            )]
+
+    def signature(self, blog_id: str) -> str:
+        """blog_id 수집 데이터가 바뀌면 달라지는 값 (폴더 수 + 최신 _data.json mtime). 캐시 키용."""
+        self._ensure_synced()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n, COALESCE(MAX(data_mtime), 0) AS m FROM collections WHERE blog_id = ?",
+                (blog_id,),
+            ).fetchone()
+        return f"{row['n']}:{row['m']}"
+
+    def known_log_nos(self, blog_id: str) -> set[str]:
+        """이미 수집된 logNo 집합 (증분 수집 시 목록 페이징 중단 기준)."""
+        self._ensure_synced()
+        with self._connect() as conn:
+            return {row["log_no"] for row in conn.execute(
+                "SELECT DISTINCT log_no FROM posts WHERE blog_id = ? AND log_no != ''",
+                (blog_id,),
+            )}
+
+    def post_metrics(self, blog_id: str) -> list[dict]:
+        """
+        blog_id 글 지표 목록 — load_posts와 같은 url 중복 제거/정렬 (최근 수집본 우선, 최신 글 순).
+        지표 행이 없는 폴더(지표 도입 전 색인)는 먼저 한 번 다시 색인한다.
+        """
+        self._ensure_synced()
+        with self._connect() as conn:
+            stale = [row["folder"] for row in conn.execute(
+                "SELECT c.folder FROM collections c WHERE c.blog_id = ? AND c.post_count > 0 "
+                "AND NOT EXISTS (SELECT 1 FROM post_metrics m WHERE m.folder = c.folder)",
+                (blog_id,),
+            )]
+        for folder_name in stale:
+            try:
+                self.record_collection(self.collections_dir / folder_name)
+            except Exception as e:
+                print(f"[WARN] 글 지표 색인 실패: {folder_name} — {e}")
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT metrics FROM ("
+                "  SELECT m.metrics, p.add_date, c.collected_at, c.folder, m.position,"
+                "         ROW_NUMBER() OVER (PARTITION BY m.url"
+                "                            ORDER BY c.collected_at DESC, c.folder DESC) AS rn"
+                "  FROM post_metrics m"
+                "  JOIN posts p ON p.folder = m.folder AND p.url = m.url"
+                "  JOIN collections c ON c.folder = m.folder"
+                "  WHERE m.blog_id = ?"
+                ") WHERE rn = 1 "
+                "ORDER BY add_date DESC, collected_at DESC, folder DESC, position",
+                (blog_id,),
+            ).fetchall()
+        return [json.loads(row["metrics"]) for row in rows]
+
+    def load_blog_stats(self, blog_id: str, signature: str) -> dict | None:
+        """저장된 블로그 집계 (signature가 다르면 None)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT stats FROM blog_stats WHERE blog_id = ? AND signature = ?",
+                (blog_id, signature),
+            ).fetchone()
+        return json.loads(row["stats"]) if row else None
+
+    def save_blog_stats(self, blog_id: str, signature: str, stats: dict):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO blog_stats (blog_id, signature, stats) VALUES (?, ?, ?)",
+                (blog_id, signature, json.dumps(stats, ensure_ascii=False)),
+            )
+
+    def _read_posts(self, folder_name: str) -> list[dict]:
+        data_file = self.collections_dir / folder_name / DATA_FILENAME
+        try:
+            with open(data_file, "r", encoding="utf-8") as f:
+                return json.load(f).get("posts", []) or []
+        except Exception as e:
+            print(f"[WARN] _data.json 읽기 실패: {data_file} — {e}")
+            return []
+
+    def load_posts(self, blog_id: str, limit: int | None = None) -> list[dict]:
+        """
+        blog_id에 해당하는 폴더의 글만 읽어 url 기준 중복 제거 후 최신 순 반환.
+        같은 url이 여러 폴더에 있으면 최근 수집본을 사용한다.
+        limit 지정 시 최신 limit개 글을 인덱스에서 먼저 고르고 그 글이 든 폴더만 읽는다 (전체 정렬 없음).
+        """
+        if limit is not None:
+            return self._load_latest_posts(blog_id, limit)
+        seen_urls = set()
+        unique_posts = []
+        for folder_name in self.folders_for_blog(blog_id):
+            for post in self._read_posts(folder_name):
+                url = post.get("url")
+                if url and url not in seen_urls:
+                    seen_urls.add(url)
+                    unique_posts.append(post)
+        unique_posts.sort(key=lambda x: x.get('addDate', ''), reverse=True)
+        return unique_posts
+
+    def _load_latest_posts(self, blog_id: str, limit: int) -> list[dict]:
+        """load_posts(limit=...) — 중복 제거/정렬은 post_metrics와 같은 기준으로 SQL에서."""
+        self._ensure_synced()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT folder, url FROM ("
+                "  SELECT p.folder, p.url, p.add_date, c.collected_at, COALESCE(m.position, 0) AS position,"
+                "         ROW_NUMBER() OVER (PARTITION BY p.url"
+                "                            ORDER BY c.collected_at DESC, c.folder DESC) AS rn"
+                "  FROM posts p"
+                "  JOIN collections c ON c.folder = p.folder"
+                "  LEFT JOIN post_metrics m ON m.folder = p.folder AND m.url = p.url"
+                "  WHERE p.blog_id = ?"
+                ") WHERE rn = 1 "
+                "ORDER BY add_date DESC, collected_at DESC, folder DESC, position "
+                "LIMIT ?",
+                (blog_id, max(0, int(limit))),
+            ).fetchall()
+
+        wanted: dict[str, set[str]] = {}
+        for row in rows:
+            wanted.setdefault(row["folder"], set()).add(row["url"])
+        found: dict[tuple[str, str], dict] = {}
+        for folder_name, urls in wanted.items():
+            for post in self._read_posts(folder_name):
+                url = post.get("url")
+                if url in urls:
+                    found.setdefault((folder_name, url), post)
+        return [found[key] for key in ((row["folder"], row["url"]) for row in rows) if key in found]
+
+
+_indexes: dict[str, CollectionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(collections_dir: Path | str) -> CollectionIndex:
+    """collections_dir별 인덱스 싱글턴."""
+    key = str(Path(collections_dir).resolve())
+    with _indexes_lock:
+        idx = _indexes.get(key)
+        if idx is None:
+            idx = CollectionIndex(Path(collections_dir))
+            _indexes[key] = idx
+        return idx
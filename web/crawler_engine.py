@@ -0,0 +1,198 @@
+"""
+네이버 블로그 병렬 수집 엔진 — crawler_engine.py
+블로그 1개당 커넥션 풀 세션 1개를 재사용하고, 토큰 버킷 속도 제한 아래에서 본문을 병렬 수집한다.
+
+app.py에서 import하여 사용:
+  engine = CrawlerEngine(blog_id)
+  posts = run_crawler.get_post_list(blog_id, count, session=engine)
+  engine.fetch_post_contents(posts)      # 각 post에 content/style_meta 채움 (순서 유지)
+
+- engine.get(url, **kwargs)는 requests.Session.get과 같은 형태 → run_crawler 함수에 session으로 전달 가능
+- 429/5xx/연결 오류는 지수 백오프로 재시도 (Retry-After 헤더 우선)
+- 호스트별 동시 요청 수 상한 (m.blog.naver.com / blog.naver.com 각각)
+- mobile_base/pc_base를 바꾸면 로컬 스텁 HTTP 서버로 테스트 가능
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import run_crawler
+
+DEFAULT_RATE = float(os.getenv("CRAWL_RATE", "4"))            # 초당 요청 수
+DEFAULT_BURST = int(os.getenv("CRAWL_BURST", "4"))            # 버킷 용량
+DEFAULT_WORKERS = int(os.getenv("CRAWL_CONCURRENCY", "4"))    # 본문 병렬 수집 스레드
+DEFAULT_PER_HOST = int(os.getenv("CRAWL_PER_HOST", "3"))      # 호스트별 동시 요청 상한
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """초당 rate개 토큰을 채우는 버킷. acquire()는 토큰이 생길 때까지 대기."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = max(rate, 0.01)
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class CrawlerEngine:
+    """블로그 1개 수집용 엔진 (세션/속도 제한/재시도 공유)."""
+
+    def __init__(
+        self,
+        blog_id: str,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_workers: int = DEFAULT_WORKERS,
+        per_host_limit: int = DEFAULT_PER_HOST,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 12,
+        mobile_base: str | None = None,
+        pc_base: str | None = None,
+        warm_up: bool = True,
+    ):
+        self.blog_id = blog_id
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.timeout = timeout
+        self.mobile_base = (mobile_base or run_crawler.MOBILE_BASE).rstrip("/")
+        self.pc_base = (pc_base or run_crawler.PC_BASE).rstrip("/")
+        self._bucket = TokenBucket(rate, burst)
+        self._host_locks: dict[str, threading.BoundedSemaphore] = {}
+        self._host_lock_guard = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0, "failures": 0}
+        self._stats_lock = threading.Lock()
+
+        self.session = requests.Session()
+        pool = self.max_workers + 2
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(run_crawler.BASE_HEADERS)
+        self.session.headers["Referer"] = f"{self.mobile_base}/{blog_id}"
+        if warm_up:
+            # 쿠키 획득 — 세션당 1회만
+            try:
+                self.get(f"{self.mobile_base}/{blog_id}", timeout=10, retries=0)
+            except Exception:
+                pass
+
+    # ──────────────────────────────────────────
+    # HTTP
+    # ──────────────────────────────────────────
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._host_lock_guard:
+            sem = self._host_locks.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_locks[host] = sem
+            return sem
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _retry_delay(self, attempt: int, resp: requests.Response | None) -> float:
+        if resp is not None:
+            retry_after = resp.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), 30.0)
+        return self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+
+    def get(self, url: str, retries: int | None = None, **kwargs) -> requests.Response:
+        """속도 제한 + 호스트 동시성 제한 + 재시도가 적용된 GET."""
+        kwargs.setdefault("timeout", self.timeout)
+        retries = self.max_retries if retries is None else retries
+        sem = self._host_semaphore(url)
+        attempt = 0
+        while True:
+            self._bucket.acquire()
+            resp = None
+            error = None
+            with sem:
+                self._count("requests")
+                try:
+                    resp = self.session.get(url, **kwargs)
+                except requests.RequestException as e:
+                    error = e
+            if error is None and resp.status_code not in RETRY_STATUSES:
+                return resp
+            if attempt >= retries:
+                self._count("failures")
+                if error is not None:
+                    raise error
+                return resp
+            self._count("retries")
+            time.sleep(self._retry_delay(attempt, resp))
+            attempt += 1
+
+    # ──────────────────────────────────────────
+    # 본문 수집
+    # ──────────────────────────────────────────
+
+    def fetch_post(self, log_no: str) -> dict:
+        """본문 + 스타일 메타 ({"text", "style_meta"})."""
+        return run_crawler.get_post_content_with_style(
+            self.blog_id, log_no, session=self,
+            mobile_base=self.mobile_base, pc_base=self.pc_base,
+        )
+
+    def fetch_post_contents(self, posts: list[dict], on_progress=None) -> list[dict]:
+        """
+        posts 각각에 content/style_meta를 채워 같은 리스트를 반환 (입력 순서 유지).
+        save_results가 기대하는 형식 그대로.
+        """
+        done = 0
+        done_lock = threading.Lock()
+
+        def _work(post: dict):
+            nonlocal done
+            try:
+                result = self.fetch_post(post["logNo"])
+            except Exception as e:
+                print(f"[WARN] 본문 수집 실패 ({post.get('logNo')}): {e}")
+                result = {}
+            post["content"] = result.get("text") or run_crawler.FETCH_FAILED_TEXT
+            post["style_meta"] = result.get("style_meta", {})
+            if on_progress:
+                with done_lock:
+                    done += 1
+                    on_progress(done, len(posts))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crawl") as pool:
+            list(pool.map(_work, posts))
+        return posts
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,791 @@
+"""
+DNA 프롬프트 아티팩트 캐시 — dna_prompt.py
+블로그 DNA JSON으로부터 만드는 스타일 가이드/분량·구조 가이드/HTML 스타일/샘플 글/미리보기를
+한 번만 조립해 두고 /api/blog/dna-preview와 /api/blog/generate가 함께 재사용한다.
+
+app.py에서 import하여 사용:
+  get_artifact(dna_dir, dna_id, collection_index, active_tags) -> dict
+  empty_artifact() -> dict                     # DNA 미선택 시 기본 가이드
+  cache_info() -> dict
+
+캐시 키: dna_id + DNA 파일 경로/mtime + 수집 데이터 시그니처 (+ active_tags)
+DNA 파일이 다시 저장되거나 새 글이 수집되면 키가 바뀌어 자동으로 다시 조립된다.
+반환 dict는 여러 요청이 공유하므로 호출 측에서 수정하지 않는다.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+MAX_ARTIFACTS = 32
+# 스타일 가이드에 쓰는 샘플: 전문 3개 + 제목 목록 9개
+SAMPLE_POST_LIMIT = 12
+SAMPLE_CONTENT_CHARS = 1800
+
+_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def resolve_dna_file(dna_dir: Path, dna_id: str) -> Path | None:
+    """전체 파일 ID("DNA_blogid_날짜")면 그대로, blog_id만 오면 가장 최근 DNA 파일."""
+    if not dna_id or not dna_dir.exists():
+        return None
+    direct = dna_dir / f"{dna_id}.json"
+    if direct.exists():
+        return direct
+    candidates = sorted(
+        dna_dir.glob(f"DNA_{dna_id}_*.json"),
+        key=lambda f: f.stat().st_mtime, reverse=True
+    )
+    return candidates[0] if candidates else None
+
+
+# ──────────────────────────────────────────
+# 조립 (캐시 miss 시에만 실행)
+# ──────────────────────────────────────────
+
+def _render_style_guide(dna_analysis: dict | None, unique_posts: list[dict]) -> str:
+    """생성 프롬프트용 【블로그 글쓰기 DNA 스타일 가이드】 + 실제 글 샘플."""
+    dna_parts = []
+
+    if dna_analysis:
+        c1  = dna_analysis.get("c1_template_structure", {})
+        c2  = dna_analysis.get("c2_tone_mood", {})
+        # c3: 새 이름 우선, 구버전 하위호환
+        c3  = dna_analysis.get("c3_speech_endings", dna_analysis.get("c3_speech_style", {}))
+        # c4: 문장 구조
+        c4  = dna_analysis.get("c4_sentence_structure", dna_analysis.get("c6_sentence_patterns", {}))
+        # c5: 시그니처 표현
+        c5  = dna_analysis.get("c6_signature_expressions", dna_analysis.get("c5_frequent_expressions", {}))
+        # c6: 단락
+        c6p = dna_analysis.get("c5_paragraph_composition", dna_analysis.get("c8_paragraph_composition", {}))
+        # c8: 화법
+        c8  = dna_analysis.get("c8_rhetoric", dna_analysis.get("c4_rhetoric", {}))
+        # c9: 도입
+        c9  = dna_analysis.get("c9_opening_patterns", dna_analysis.get("c9_opening_closing", {}))
+        # c10: 마무리
+        c10c = dna_analysis.get("c10_closing_patterns", dna_analysis.get("c9_opening_closing", {}))
+        # c11: 시각
+        c11v = dna_analysis.get("c11_visual_symbols", dna_analysis.get("c10_visual_formatting", {}))
+        c12 = dna_analysis.get("c12_typography", {})
+        c13 = dna_analysis.get("c13_brackets_quotes", {})
+        c14 = dna_analysis.get("c14_length_stats", dna_analysis.get("c11_length_stats", {}))
+        c15 = dna_analysis.get("c15_title_patterns", dna_analysis.get("c14_title_patterns", {}))
+        c7  = dna_analysis.get("c7_vocabulary", {})
+
+        dna_parts.append("【블로그 글쓰기 DNA 스타일 가이드 — 모든 항목 100% 재현할 것】")
+        # 구조 & 톤
+        dna_parts.append(f"구조 패턴: {c1.get('overall_pattern', '')} / 섹션 수: {c1.get('section_count', '')}")
+        dna_parts.append(f"섹션 흐름: {' → '.join(c1.get('section_flow', []))}")
+        dna_parts.append(f"소제목 포맷: {c1.get('subheading_format', c1.get('heading_style', ''))}")
+        dna_parts.append(f"톤: {c2.get('primary_tone', '')} / 격식도: {c2.get('formality_level', '')}/10 / 활발함: {c2.get('energy_level', '')}/10")
+        dna_parts.append(f"톤 변화 패턴: {c2.get('tone_shift_pattern', '')}")
+        # 어투/종결어미
+        primary_endings = c3.get('primary_endings', c3.get('ending_patterns', []))
+        dna_parts.append(f"종결어미 TOP5: {', '.join(primary_endings[:5])}")
+        dna_parts.append(f"격식:비격식 비율: {c3.get('formality_mix', '')} / 연속 같은 어미: {c3.get('consecutive_same_ending', '')}")
+        dna_parts.append(f"독자 호칭: {c3.get('reader_address', '')} / 의문형 패턴: {c3.get('question_ending_style', '')}")
+        # 문장 구조
+        dna_parts.append(f"문장 길이: 평균 {c4.get('avg_chars_per_sentence', c4.get('avg_length', ''))}자 / 짧은:{c4.get('short_sentence_ratio', '')} 중간:{c4.get('medium_sentence_ratio', '')} 긴:{c4.get('long_sentence_ratio', '')}")
+        dna_parts.append(f"리듬 패턴: {c4.get('rhythm_pattern', c4.get('rhythm', ''))}")
+        dna_parts.append(f"문장 시작 패턴: {', '.join(c4.get('leading_phrase_patterns', [])[:5])}")
+        # 단락
+        dna_parts.append(f"단락당 문장: {c6p.get('avg_sentences_per_paragraph', '')} / 여백: {c6p.get('whitespace_style', c6p.get('whitespace_usage', ''))}")
+        dna_parts.append(f"단락 시작 패턴: {c6p.get('paragraph_opening_pattern', '')}")
+        # 시그니처 표현
+        sig = c5.get('signature_phrases', [])
+        trans = c5.get('transition_words', [])
+        dna_parts.append(f"시그니처 표현: {', '.join(sig[:7])}")
+        dna_parts.append(f"전환 표현: {', '.join(trans[:6])}")
+        dna_parts.append(f"강조 표현: {', '.join(c5.get('emphasis_expressions', [])[:5])}")
+        dna_parts.append(f"긍정 추임새: {', '.join(c5.get('affirmation_expressions', [])[:5])}")
+        # 어휘
+        dna_parts.append(f"어휘 수준: {c7.get('level', '')} / 순우리말:{c7.get('korean_ratio', '')} 한자어:{c7.get('sino_korean_ratio', '')} 외래어:{c7.get('foreign_word_ratio', '')}")
+        dna_parts.append(f"특징 어휘: {', '.join(c7.get('characteristic_words', [])[:8])}")
+        # 도입/마무리
+        dna_parts.append(f"도입 방식: {', '.join(c9.get('opening_types', []))}")
+        dna_parts.append(f"첫 문장 패턴: {c9.get('first_sentence_pattern', '')}")
+        dna_parts.append(f"마무리 방식: {', '.join(c10c.get('closing_types', []))}")
+        dna_parts.append(f"CTA 방식: {c10c.get('cta_style', '')} / 표현: {', '.join(c10c.get('cta_keywords', [])[:4])}")
+        # 시각 요소
+        emoji_list = c11v.get('emoji_list', c11v.get('emoji_types', []))
+        dna_parts.append(f"이모지 빈도(1-10): {c11v.get('emoji_frequency', c11v.get('emoji_usage', ''))} / 글당 이모지 수: {c11v.get('emoji_per_post', '')}")
+        dna_parts.append(f"자주 쓰는 이모지: {', '.join(emoji_list[:15])}")
+        dna_parts.append(f"이모지 위치: {c11v.get('emoji_position', '')}")
+        dna_parts.append(f"특수기호: {', '.join(c11v.get('special_symbols', [])[:15])}")
+        sep = c11v.get('separator_patterns', [c11v.get('separator_style', '')])
+        dna_parts.append(f"구분선: {', '.join(sep[:3]) if isinstance(sep, list) else sep}")
+        # 글자수/분량 (c14)
+        if c14:
+            dna_parts.append(f"\n【분량 기준】")
+            dna_parts.append(f"글당 평균 글자수: {c14.get('avg_chars_per_post', '')}")
+            dna_parts.append(f"평균 문장 수: {c14.get('avg_sentences_per_post', '')}")
+            dna_parts.append(f"문장당 평균 글자수: {c14.get('avg_chars_per_sentence', '')}")
+            dna_parts.append(f"서론:본론:결론 비율: {c14.get('content_ratio', '')}")
+            if c14.get('writing_density_guide'):
+                dna_parts.append(f"분량 지침: {c14.get('writing_density_guide', '')}")
+        # 폰트/글꼴 (c12)
+        if c12:
+            dna_parts.append(f"\n【폰트/글꼴 스타일】")
+            if c12.get('font_families'):
+                dna_parts.append(f"사용 폰트: {', '.join(c12.get('font_families', []))}")
+            dna_parts.append(f"본문 크기: {c12.get('base_font_size', '')} / 소제목 크기: {c12.get('heading_font_size', '')}")
+            dna_parts.append(f"볼드 빈도(1-10): {c12.get('bold_frequency', '')} / 목적: {c12.get('bold_purpose', '')}")
+            if c12.get('bold_examples'):
+                dna_parts.append(f"볼드 예시: {', '.join(c12.get('bold_examples', [])[:3])}")
+            dna_parts.append(f"기울임꼴: {c12.get('italic_usage', '')} / 밑줄: {c12.get('underline_usage', '')}")
+            if c12.get('font_guide'):
+                dna_parts.append(f"글꼴 지침: {c12.get('font_guide', '')}")
+        # 꺽쇠/괄호 (c13)
+        if c13:
+            dna_parts.append(f"\n【꺽쇠/괄호/인용부호】")
+            if c13.get('angle_bracket_types'):
+                dna_parts.append(f"꺽쇠 종류: {', '.join(c13.get('angle_bracket_types', []))} / 목적: {c13.get('angle_bracket_purpose', '')} / 빈도: {c13.get('angle_bracket_frequency', '')}")
+            if c13.get('square_bracket_types'):
+                dna_parts.append(f"대괄호 종류: {', '.join(c13.get('square_bracket_types', []))} / 목적: {c13.get('square_bracket_purpose', '')}")
+            dna_parts.append(f"소괄호 패턴: {c13.get('round_bracket_usage', '')}")
+            dna_parts.append(f"따옴표 방식: {c13.get('quotation_mark_style', '')}")
+            if c13.get('examples'):
+                dna_parts.append(f"꺽쇠/괄호 예시: {' | '.join(c13.get('examples', [])[:3])}")
+        # 제목 패턴 (c14)
+        if c14:
+            dna_parts.append(f"\n【제목 패턴】")
+            dna_parts.append(f"평균 제목 길이: {c14.get('avg_title_length', '')} / 구조: {c14.get('title_structure', '')}")
+            dna_parts.append(f"숫자 활용: {c14.get('number_usage', '')} / 감정 후크: {c14.get('emotion_hook', '')}")
+            if c14.get('examples'):
+                dna_parts.append(f"제목 예시: {' | '.join(c14.get('examples', [])[:3])}")
+        # 이미지 (c16 또는 c15 하위호환)
+        c16 = dna_analysis.get("c16_image_media", dna_analysis.get("c15_image_media", {}))
+        if c16:
+            dna_parts.append(f"\n【이미지/미디어 패턴】")
+            dna_parts.append(f"글당 이미지 수: {c16.get('avg_images_per_post', c16.get('avg_images', ''))} / 배치: {c16.get('image_placement', c16.get('image_position', ''))}")
+            dna_parts.append(f"캡션 방식: {c16.get('caption_style', c16.get('image_caption_style', ''))} / 밀도: {c16.get('media_density', '')}")
+
+        # c17 — 문장부호
+        c17 = dna_analysis.get("c17_punctuation", {})
+        if c17:
+            dna_parts.append(f"\n【문장부호/구두점 패턴 — 반드시 재현할 것】")
+            dna_parts.append(f"마침표 방식: {c17.get('period_style', '')} / 생략 비율: {c17.get('period_omission_ratio', '')}")
+            dna_parts.append(f"쉼표 빈도(1-10): {c17.get('comma_frequency', '')} / 방식: {c17.get('comma_style', '')}")
+            dna_parts.append(f"느낌표 빈도(1-10): {c17.get('exclamation_frequency', '')} / 방식: {c17.get('exclamation_style', '')}")
+            dna_parts.append(f"물음표 맥락: {c17.get('question_mark_usage', '')}")
+            dna_parts.append(f"말줄임표: {c17.get('ellipsis_usage', '')} / 물결표: {c17.get('tilde_usage', '')} / 대시: {c17.get('dash_usage', '')}")
+            if c17.get('multiple_punct_usage'):
+                dna_parts.append(f"복수 부호(!! ~~): {c17.get('multiple_punct_usage', '')}")
+            if c17.get('examples'):
+                dna_parts.append(f"구두점 예시:\n" + "\n".join(c17['examples'][:2]))
+
+        # c18 — 숫자/데이터
+        c18 = dna_analysis.get("c18_numbers_data", {})
+        if c18:
+            dna_parts.append(f"\n【숫자/단위/데이터 표현 — 반드시 재현할 것】")
+            dna_parts.append(f"숫자 선호: {c18.get('numeral_preference', '')}")
+            dna_parts.append(f"가격 형식: {c18.get('price_format', '')} / 날짜 형식: {c18.get('date_format', '')}")
+            dna_parts.append(f"단위 스타일: {c18.get('unit_style', '')} / 순위 형식: {c18.get('ranking_format', '')}")
+            dna_parts.append(f"어림수 표현: {c18.get('approximation_style', '')}")
+            if c18.get('examples'):
+                dna_parts.append(f"수치 예시: {' | '.join(c18['examples'][:3])}")
+
+        # c19 — 독자 상호작용
+        c19 = dna_analysis.get("c19_reader_engagement", {})
+        if c19:
+            dna_parts.append(f"\n【독자 참여 유도 방식 — 반드시 재현할 것】")
+            dna_parts.append(f"독자 질문 빈도(1-10): {c19.get('direct_question_frequency', '')}")
+            if c19.get('empathy_phrases'):
+                dna_parts.append(f"공감 표현: {', '.join(c19['empathy_phrases'][:4])}")
+            if c19.get('inclusive_expressions'):
+                dna_parts.append(f"포용 표현: {', '.join(c19['inclusive_expressions'][:4])}")
+            dna_parts.append(f"추천 강도: {c19.get('recommendation_strength', '')}")
+            if c19.get('recommendation_expressions'):
+                dna_parts.append(f"추천 표현: {', '.join(c19['recommendation_expressions'][:4])}")
+            if c19.get('urgency_patterns'):
+                dna_parts.append(f"긴박감 표현: {', '.join(c19['urgency_patterns'][:3])}")
+            if c19.get('examples'):
+                dna_parts.append(f"참여 유도 예시:\n" + "\n".join(c19['examples'][:2]))
+
+        # c20 — 감탄사/추임새
+        c20 = dna_analysis.get("c20_interjections_fillers", {})
+        if c20:
+            dna_parts.append(f"\n【감탄사/추임새/습관어 — 반드시 재현할 것】")
+            if c20.get('interjections'):
+                dna_parts.append(f"감탄사: {', '.join(c20['interjections'][:8])}")
+            if c20.get('filler_starters'):
+                dna_parts.append(f"시작 습관어: {', '.join(c20['filler_starters'][:6])}")
+            if c20.get('affirmations'):
+                dna_parts.append(f"긍정 추임새: {', '.join(c20['affirmations'][:5])}")
+            if c20.get('excitement_expressions'):
+                dna_parts.append(f"흥분 표현: {', '.join(c20['excitement_expressions'][:5])}")
+            dna_parts.append(f"사용 빈도(1-10): {c20.get('frequency', '')} / 위치: {c20.get('position_pattern', '')}")
+            if c20.get('examples'):
+                dna_parts.append(f"추임새 예시:\n" + "\n".join(c20['examples'][:2]))
+
+        # c21 — 인라인 서식 상세 (확장 버전)
+        c21 = dna_analysis.get("c21_inline_formatting", {})
+        if c21:
+            dna_parts.append(f"\n【인라인 서식 상세 (Naver SE3) — 반드시 재현할 것】")
+            dna_parts.append(f"폰트 전환 빈도: {c21.get('font_switch_frequency', '')} / 트리거: {c21.get('font_switch_trigger', '')}")
+            if c21.get('font_families_used'):
+                dna_parts.append(f"사용 폰트: {', '.join(c21['font_families_used'])}")
+            if c21.get('size_switch_pattern'):
+                dna_parts.append(f"크기 전환 패턴: {c21.get('size_switch_pattern', '')}")
+            if c21.get('size_examples_by_level'):
+                _sz = c21['size_examples_by_level']
+                if isinstance(_sz, dict):
+                    dna_parts.append(f"크기별 사용: " + " | ".join(f"{k}={v}" for k, v in _sz.items() if v and v != "어떤 텍스트에 사용?"))
+            if c21.get('color_switch_pattern'):
+                dna_parts.append(f"색상 전환 패턴: {c21.get('color_switch_pattern', '')}")
+            if c21.get('color_switch_examples'):
+                dna_parts.append(f"색상 전환 예시: {' | '.join(c21['color_switch_examples'][:4])}")
+            if c21.get('italic_usage') and c21['italic_usage'] != '없음':
+                dna_parts.append(f"기울임체: {c21.get('italic_usage', '')}")
+            if c21.get('underline_usage') and c21['underline_usage'] != '없음':
+                dna_parts.append(f"밑줄: {c21.get('underline_usage', '')}")
+            if c21.get('strikethrough_usage') and c21['strikethrough_usage'] != '없음':
+                dna_parts.append(f"취소선: {c21.get('strikethrough_usage', '')}")
+            if c21.get('background_color_pattern') and c21['background_color_pattern'] != '없음':
+                dna_parts.append(f"배경색 강조: {c21.get('background_color_pattern', '')}")
+            if c21.get('background_color_examples'):
+                dna_parts.append(f"배경색 예시: {' | '.join(c21['background_color_examples'][:3])}")
+            if c21.get('center_align_pattern'):
+                dna_parts.append(f"가운데 정렬: {c21.get('center_align_pattern', '')}")
+            if c21.get('box_quote_pattern') and c21['box_quote_pattern'] != '없음':
+                dna_parts.append(f"박스/인용구: {c21.get('box_quote_pattern', '')}")
+            if c21.get('combined_format_examples'):
+                dna_parts.append(f"복합 서식 예시: {' | '.join(c21['combined_format_examples'][:3])}")
+            if c21.get('naver_se3_pattern_guide'):
+                dna_parts.append(f"SE3 서식 가이드: {c21.get('naver_se3_pattern_guide', '')}")
+
+        # c22 — 콘텐츠 패턴
+        c22 = dna_analysis.get("c22_content_patterns", {})
+        if c22:
+            dna_parts.append(f"\n【콘텐츠 주제/정보 패턴 — 반드시 따를 것】")
+            if c22.get('main_topics'):
+                dna_parts.append(f"주요 주제: {', '.join(c22['main_topics'][:5])}")
+            if c22.get('content_angle'):
+                dna_parts.append(f"콘텐츠 각도: {c22.get('content_angle', '')}")
+            if c22.get('must_include_elements'):
+                dna_parts.append(f"반드시 포함: {', '.join(c22['must_include_elements'][:6])}")
+            if c22.get('never_include_elements'):
+                dna_parts.append(f"절대 포함 금지: {', '.join(c22['never_include_elements'][:4])}")
+            if c22.get('info_ordering'):
+                dna_parts.append(f"정보 제시 순서: {c22.get('info_ordering', '')}")
+            if c22.get('local_terminology'):
+                dna_parts.append(f"지역/기관 용어: {', '.join(c22['local_terminology'][:6])}")
+            if c22.get('typical_post_template'):
+                dna_parts.append(f"전형적 글 구성: {c22.get('typical_post_template', '')}")
+
+        # 도입/마무리 실제 예시
+        c9_open = dna_analysis.get("c9_opening_patterns", dna_analysis.get("c9_opening_closing", {}))
+        c10_close = dna_analysis.get("c10_closing_patterns", dna_analysis.get("c9_opening_closing", {}))
+        if c9_open.get("opening_examples"):
+            dna_parts.append(f"\n실제 도입부 예시 (이대로 따라 쓸 것):\n" + "\n".join(c9_open["opening_examples"][:3]))
+        if c10_close.get("closing_examples"):
+            dna_parts.append(f"\n실제 마무리 예시 (이대로 따라 쓸 것):\n" + "\n".join(c10_close["closing_examples"][:3]))
+
+    # 원본 글 전문 최대 3개 (스타일 레퍼런스)
+    if unique_posts:
+        dna_parts.append(f"\n【실제 글 샘플 (이 스타일을 최대한 그대로 따라 쓸 것 — 어투·구조·길이·표현 모두)】")
+        for si, sample in enumerate(unique_posts[:3], 1):
+            dna_parts.append(f"\n[샘플 {si}] 제목: {sample.get('title', '')}")
+            dna_parts.append(sample.get('content', '')[:1800])
+
+        # 제목 목록 (참고용)
+        title_list = [f"- {p.get('title', '')}" for p in unique_posts[3:12]]
+        if title_list:
+            dna_parts.append(f"\n【최근 글 제목 목록 (주제 참고용)】\n" + "\n".join(title_list))
+
+    return "\n".join(dna_parts)
+
+
+def _render_tag_section(active_tags: list[dict]) -> str:
+    """활성 페르소나 태그 섹션 (요청마다 달라지므로 기본 아티팩트와 분리)."""
+    dna_parts = []
+    if active_tags:
+        tag_labels = [t.get("label", "") for t in active_tags if t.get("label")]
+        if tag_labels:
+            dna_parts.append(f"\n[활성화된 스타일 태그 — 이 특징들을 반드시 반영]\n" + "\n".join(f"- {l}" for l in tag_labels))
+
+    return "\n".join(dna_parts)
+
+
+def _render_guides(dna_analysis: dict | None) -> tuple[str, str]:
+    """DNA에서 분량 가이드 / 구조 가이드 텍스트 추출."""
+    # 분량 가이드: c14_length_stats 또는 c11_length_stats
+    _c14 = (dna_analysis or {}).get("c14_length_stats",
+             (dna_analysis or {}).get("c11_length_stats", {}))
+    if _c14:
+        _avg    = _c14.get('avg_chars_per_post', '')
+        _guide  = _c14.get('density_guide', _c14.get('writing_density_guide', ''))
+        _ratio  = _c14.get('content_ratio', '')
+        length_guide_text = "▸ 이 블로그의 평균 글 길이: " + str(_avg)
+        if _guide: length_guide_text += f"\n▸ 분량 지침: {_guide}"
+        if _ratio: length_guide_text += f"\n▸ 서론:본론:결론 = {_ratio}"
+    else:
+        length_guide_text = "▸ 최소 1,500자 이상, 권장 2,000~2,500자\n▸ 서론(10%) → 본론(75%) → 결론(15%)"
+
+    # 구조 가이드: c1_template_structure
+    _c1 = (dna_analysis or {}).get("c1_template_structure", {})
+    if _c1:
+        _pattern  = _c1.get('overall_pattern', '')
+        _flow     = _c1.get('section_flow', [])
+        _subfmt   = _c1.get('subheading_format', _c1.get('heading_style', ''))
+        struct_guide_text = f"▸ 구조 패턴: {_pattern}"
+        if _flow: struct_guide_text += "\n▸ 섹션 흐름: " + " → ".join(_flow)
+        if _subfmt: struct_guide_text += f"\n▸ 소제목 포맷: {_subfmt}"
+    else:
+        struct_guide_text = "▸ 서론 → 본론(3~5단락) → 결론 구조"
+
+    # 꺽쇠/인용/폰트크기 마커 가이드 (c13 기반)
+    _c13 = (dna_analysis or {}).get("c13_brackets_quotes", {})
+    _bracket_guide = ""
+    if _c13:
+        _ab  = _c13.get("angle_bracket_examples", [])
+        _sq  = _c13.get("square_bracket_purpose", "")
+        _qt  = _c13.get("quotation_style", "")
+        _cbo = _c13.get("bracket_combo_pattern", "")
+        _abf = _c13.get("angle_bracket_frequency", "")
+        if _ab or _qt:
+            _bracket_guide = "\n▸ 이 블로그의 꺽쇠/인용 패턴 (반드시 재현):"
+            if _ab:   _bracket_guide += f"\n  - 꺽쇠 예시 ({_abf}): {' / '.join(_ab[:3])}"
+            if _sq:   _bracket_guide += f"\n  - 대괄호 용도: {_sq[:80]}"
+            if _qt:   _bracket_guide += f"\n  - 인용부호: {_qt}"
+            if _cbo:  _bracket_guide += f"\n  - 조합 패턴: {_cbo}"
+
+    # 폰트 크기 마커 가이드
+    _fs_levels = (dna_analysis or {}).get("c12_typography", {}).get("font_size_levels", [])
+    _size_guide = ""
+    if len(_fs_levels) >= 2:
+        _size_guide = "\n▸ 인라인 크기 마커 (필요시 사용):\n  - [작게]텍스트[/작게] → 작은 글씨 (부가설명, 주석)\n  - [크게]텍스트[/크게] → 강조 큰 글씨"
+
+    struct_guide_text += _bracket_guide + _size_guide
+
+    return length_guide_text, struct_guide_text
+
+
+def _render_html_style(dna_analysis: dict | None) -> dict:
+    """DNA → 결과 HTML 변환용 스타일 파라미터."""
+    # ── DNA → HTML 스타일 완전 추출 ────────────────────────────
+    try:
+      _dna_style_ok = True
+      _c12 = (dna_analysis or {}).get("c12_typography", {})
+      _c11 = (dna_analysis or {}).get("c11_visual_symbols",
+              (dna_analysis or {}).get("c10_visual_formatting", {}))
+    except Exception:
+      _dna_style_ok = False
+      _c12, _c11 = {}, {}
+
+    # 1) 폰트 패밀리: Naver SE 클래스명 → CSS font-family
+    _font_map = {
+        # Naver SE3 내부 클래스명 (소문자, 공백 제거)
+        "system":               "'Malgun Gothic', '맑은 고딕', 'Apple SD Gothic Neo', sans-serif",
+        "nanumgothic":          "'NanumGothic', '나눔고딕', 'Malgun Gothic', sans-serif",
+        "nanumsquare":          "'NanumSquare', '나눔스퀘어', 'NanumGothic', sans-serif",
+        "nanumsquareround":     "'NanumSquareRound', 'NanumSquare', 'NanumGothic', sans-serif",
+        "nanumbareunhipi":      "'nanumbareunhipi', '나눔바른히피', 'NanumGothic', sans-serif",
+        "nanumbarungothic":     "'NanumBarunGothic', '나눔바른고딕', 'NanumGothic', sans-serif",
+        "nanummyeongjo":        "'NanumMyeongjo', '나눔명조', serif",
+        "nanumdasisijaghae":    "'nanumdasisijaghae', '나눔다시시작해', cursive",
+        "nanumbrush":           "'NanumBrushScript', '나눔손글씨 붓', cursive",
+        "nanumpen":             "'NanumPen', '나눔손글씨 펜', cursive",
+        "dotum":                "Dotum, '돋움', sans-serif",
+        "gulim":                "Gulim, '굴림', sans-serif",
+        "batang":               "Batang, '바탕', serif",
+        "gungsuh":              "GungsuhChe, '궁서체', serif",
+        "malgun":               "'Malgun Gothic', '맑은 고딕', sans-serif",
+        "malgunbold":           "'Malgun Gothic Bold', '맑은 고딕', sans-serif",
+        "arial":                "Arial, Helvetica, sans-serif",
+        "timesnewroman":        "'Times New Roman', Times, serif",
+        "couriernew":           "'Courier New', Courier, monospace",
+        # 한글 표기
+        "나눔고딕":             "'NanumGothic', '나눔고딕', 'Malgun Gothic', sans-serif",
+        "나눔명조":             "'NanumMyeongjo', '나눔명조', serif",
+        "나눔스퀘어":           "'NanumSquare', 'NanumGothic', sans-serif",
+        "나눔스퀘어라운드":     "'NanumSquareRound', 'NanumSquare', sans-serif",
+        "나눔바른히피":         "'nanumbareunhipi', 'NanumGothic', sans-serif",
+        "나눔바른고딕":         "'NanumBarunGothic', 'NanumGothic', sans-serif",
+        "나눔다시시작해":       "'nanumdasisijaghae', cursive",
+        "나눔손글씨붓":         "'NanumBrushScript', cursive",
+        "나눔손글씨펜":         "'NanumPen', cursive",
+        "맑은고딕":             "'Malgun Gothic', '맑은 고딕', sans-serif",
+        "맑은 고딕":            "'Malgun Gothic', '맑은 고딕', sans-serif",
+        "돋움":                 "Dotum, '돋움', sans-serif",
+        "굴림":                 "Gulim, '굴림', sans-serif",
+        "바탕":                 "Batang, '바탕', serif",
+        "기본폰트":             "'NanumGothic', 'Malgun Gothic', '맑은 고딕', sans-serif",
+        "기본 폰트":            "'NanumGothic', 'Malgun Gothic', '맑은 고딕', sans-serif",
+    }
+    _font_names = _c12.get("font_families", [])
+    _raw_font = _font_names[0] if _font_names else "기본 폰트"
+    html_font = _font_map.get(_raw_font.lower().replace(" ", ""),
+                _font_map.get(_raw_font,
+                f"'{_raw_font}', 'NanumGothic', 'Malgun Gothic', sans-serif"))
+
+    # 2) 폰트 크기: Naver SE 클래스명(fs9~fs30) 및 텍스트 → px
+    def _to_px(val, default):
+        if not val: return default
+        val = str(val).strip()
+        if val.endswith("px"): return val
+        # fsNN 형식 (Naver SE3)
+        import re as _r
+        m = _r.match(r'fs(\d+)', val.lower().split()[0])
+        if m: return f"{m.group(1)}px"
+        _tmap = {"기본": "15px", "작게": "13px", "보통": "15px",
+                 "크게": "17px", "매우크게": "19px"}
+        return _tmap.get(val, default)
+
+    _base_raw = _c12.get("base_font_size", "기본")
+    _head_raw = _c12.get("heading_font_size", "기본")
+    html_base_size = _to_px(_base_raw, "15px")
+    # heading_font_size는 종종 "fs16 (폰트 종류나 굵기로 구분)" 같이 설명 포함
+    html_head_size = _to_px(_head_raw.split()[0] if _head_raw else "기본", "17px")
+    # 소제목은 base보다 2px 크게 (명시 없을 때)
+    if html_head_size == html_base_size:
+        html_head_size = f"{int(html_base_size.replace('px','')) + 2}px"
+
+    # 3) 색상: c11_visual_symbols.text_colors 에서 실제 hex 추출
+    #    (c12.color_examples 는 hex가 아닌 텍스트 설명이므로 사용 금지)
+    _raw_text_colors = _c11.get("text_colors", [])
+    _hex_colors = [c for c in _raw_text_colors
+                   if c and c.startswith("#") and len(c) in (4, 7, 9)]
+    # 기본 글자색(#141414 #333333 등) 및 무채색(gray) 제외하고 강조색 우선
+    _body_defaults = {"#141414", "#333333", "#1a1a1a", "#000000", "#222222"}
+    def _is_gray(hex_c):
+        """R≈G≈B 인 무채색 여부 (threshold 15)"""
+        try:
+            h = hex_c.lstrip('#')
+            if len(h) == 3: h = h[0]*2 + h[1]*2 + h[2]*2
+            r,g,b = int(h[0:2],16), int(h[2:4],16), int(h[4:6],16)
+            return max(r,g,b) - min(r,g,b) < 15
+        except Exception: return False
+    _accent_hex = [c for c in _hex_colors
+                   if c.lower() not in _body_defaults and not _is_gray(c)]
+    html_accent_color  = _accent_hex[0] if _accent_hex else ""
+    html_text_colors   = _hex_colors[:5]  # 전체 색상 목록
+
+    # 4) 하이라이트 색상
+    _raw_highlights = _c11.get("highlight_colors", [])
+    _hl_hex = [c for c in _raw_highlights if c and c.startswith("#")]
+    html_highlight_color = _hl_hex[0] if _hl_hex else ""
+
+    # 5) 중앙정렬
+    _center_txt = str(_c11.get("center_align_usage", "")).lower()
+    html_center_headings = any(w in _center_txt for w in
+                               ["매우", "빈번", "자주", "항상", "많이", "중앙 정렬 사용"])
+
+    # 6) 볼드 허용 (빈도 3 이상, 또는 텍스트값 "빈번/자주/많이" 등)
+    _bold_raw = _c12.get("bold_frequency", 1)
+    try:
+        html_bold_allowed = int(_bold_raw or 1) >= 3
+    except (ValueError, TypeError):
+        _bold_txt = str(_bold_raw).lower()
+        html_bold_allowed = any(w in _bold_txt for w in ["빈번", "자주", "많이", "high", "freq"])
+
+    # 7) 줄간격: Naver 기본 line-height=2.2, 빈번한 줄바꿈 스타일이면 1.8
+    _lbreak = str(_c11.get("line_break_style", "")).lower()
+    html_line_height = "1.8" if any(w in _lbreak for w in ["과감", "잦은", "짧은"]) else "2.2"
+
+    # 8) 소제목용 두 번째 폰트 (font_families[1])
+    _heading_raw_font = _font_names[1] if len(_font_names) > 1 else _raw_font
+    html_heading_font = _font_map.get(_heading_raw_font.lower().replace(" ", ""),
+                        _font_map.get(_heading_raw_font, html_font))
+
+    # 9) 작은 폰트 크기 (font_size_levels 에서 가장 작은 값)
+    _fs_levels = _c12.get("font_size_levels", [])
+    _fs_px = sorted([_to_px(s, "13px") for s in _fs_levels],
+                    key=lambda x: int(x.replace("px", "")))
+    html_small_font_size = _fs_px[0] if _fs_px else "13px"
+
+    # 10) c21 인라인 서식 — 색상 전환 패턴 추출
+    _c21 = (dna_analysis or {}).get("c21_inline_formatting", {})
+    _c21_color_ex = _c21.get("color_switch_examples", [])
+    # c21 색상 예시에서 hex 추출 (없으면 c11 accent 사용)
+    _c21_hex = [c for c in _c21_color_ex if isinstance(c, str) and c.startswith("#")]
+    html_inline_accent = _c21_hex[0] if _c21_hex else html_accent_color
+    # 인라인 폰트 전환 빈도
+    _font_sw = str(_c21.get("font_switch_frequency", "")).lower()
+    html_inline_font_switch = any(w in _font_sw for w in ["자주", "매우", "빈번", "항상"])
+
+    # 11) c22 콘텐츠 패턴 — 반드시 포함 요소 (프롬프트용)
+    _c22 = (dna_analysis or {}).get("c22_content_patterns", {})
+    html_must_include = _c22.get("must_include_elements", [])
+
+    try:
+        html_style = {
+            "font_family":          html_font,
+            "heading_font_family":  html_heading_font,
+            "base_font_size":       html_base_size,
+            "heading_font_size":    html_head_size,
+            "small_font_size":      html_small_font_size,
+            "accent_color":         html_accent_color,
+            "inline_accent_color":  html_inline_accent,
+            "text_colors":          html_text_colors,
+            "highlight_color":      html_highlight_color,
+            "bold_allowed":         html_bold_allowed,
+            "line_height":          html_line_height,
+            "center_headings":      html_center_headings,
+            "inline_font_switch":   html_inline_font_switch,
+            "must_include":         html_must_include,
+        }
+    except Exception:
+        html_style = {}
+
+    return html_style
+
+
+def _render_preview(dna_analysis: dict | None, sample_post: dict | None) -> tuple[str, dict]:
+    """DNA 미리보기 텍스트 + JS 미리보기용 시각 스타일."""
+    # 미리보기 텍스트 구성
+    lines = []
+    if dna_analysis:
+        c1 = dna_analysis.get("c1_template_structure", {})
+        c2 = dna_analysis.get("c2_tone_mood", {})
+        c3 = dna_analysis.get("c3_speech_style", {})
+        c5 = dna_analysis.get("c5_frequent_expressions", {})
+        c6 = dna_analysis.get("c6_sentence_patterns", {})
+        c9 = dna_analysis.get("c9_opening_closing", {})
+        c10 = dna_analysis.get("c10_visual_formatting", {})
+
+        lines.append("▌ 글 구조 패턴")
+        lines.append(f"  {c1.get('overall_pattern', '-')}")
+        if c1.get('section_flow'):
+            lines.append("  흐름: " + " → ".join(c1['section_flow'])[:120])
+
+        lines.append("")
+        lines.append("▌ 톤 & 어투")
+        lines.append(f"  톤: {c2.get('primary_tone', '-')}  /  격식도: {c2.get('formality_level', '-')}/10")
+        lines.append(f"  종결어미: {', '.join(c3.get('ending_patterns', []))}")
+        lines.append(f"  독자 호칭: {c3.get('reader_address', '-')}")
+
+        lines.append("")
+        lines.append("▌ 이모지 & 특수기호")
+        emoji_list = ', '.join(c10.get('emoji_types', []))
+        lines.append(f"  이모지({c10.get('emoji_usage', '-')}/10): {emoji_list}")
+        special = c10.get('special_symbols', c10.get('special_formatting', []))
+        if special:
+            lines.append(f"  특수기호: {', '.join(special)}")
+
+        c11 = dna_analysis.get("c11_length_stats", {})
+        c12 = dna_analysis.get("c12_typography", {})
+        c13 = dna_analysis.get("c13_brackets_quotes", {})
+        c14 = dna_analysis.get("c14_title_patterns", {})
+
+        lines.append("")
+        lines.append("▌ 시각적 포맷팅 (HTML 분석)")
+        lines.append(f"  중앙정렬: {c10.get('center_align', '-')}")
+        lines.append(f"  볼드 패턴: {c10.get('bold_pattern', '-')}")
+        lines.append(f"  이탤릭: {c10.get('italic_usage', '-')}")
+        lines.append(f"  줄바꿈: {c10.get('line_break_style', '-')}")
+        if c10.get('text_colors'):
+            lines.append(f"  강조 색상: {', '.join(c10['text_colors'][:4])}")
+        if c10.get('highlight_colors'):
+            lines.append(f"  하이라이트: {', '.join(c10['highlight_colors'][:3])}")
+        if c10.get('writing_guide'):
+            lines.append(f"\n  작성 가이드: {c10['writing_guide']}")
+
+        if c11:
+            lines.append("")
+            lines.append("▌ 글자수/분량")
+            lines.append(f"  글당 평균 글자수: {c11.get('avg_chars_per_post', '-')}")
+            lines.append(f"  평균 문장 수: {c11.get('avg_sentences_per_post', '-')} / 문장당: {c11.get('avg_chars_per_sentence', '-')}")
+            lines.append(f"  서론:본론:결론 = {c11.get('content_ratio', '-')}")
+            if c11.get('writing_density_guide'):
+                lines.append(f"  분량 지침: {c11['writing_density_guide']}")
+
+        if c12:
+            lines.append("")
+            lines.append("▌ 폰트/글꼴 스타일")
+            if c12.get('font_families'):
+                lines.append(f"  폰트: {', '.join(c12['font_families'])}")
+            lines.append(f"  본문 크기: {c12.get('base_font_size', '-')} / 소제목: {c12.get('heading_font_size', '-')}")
+            lines.append(f"  볼드 빈도: {c12.get('bold_frequency', '-')}/10  목적: {c12.get('bold_purpose', '-')}")
+            lines.append(f"  기울임: {c12.get('italic_usage', '-')} / 밑줄: {c12.get('underline_usage', '-')}")
+            if c12.get('font_guide'):
+                lines.append(f"  글꼴 지침: {c12['font_guide']}")
+
+        if c13:
+            lines.append("")
+            lines.append("▌ 꺽쇠/괄호/인용부호")
+            if c13.get('angle_bracket_types'):
+                lines.append(f"  꺽쇠 종류: {', '.join(c13['angle_bracket_types'])}  빈도: {c13.get('angle_bracket_frequency', '-')}")
+                lines.append(f"  꺽쇠 목적: {c13.get('angle_bracket_purpose', '-')}")
+            if c13.get('square_bracket_types'):
+                lines.append(f"  대괄호: {', '.join(c13['square_bracket_types'])}  목적: {c13.get('square_bracket_purpose', '-')}")
+            lines.append(f"  소괄호 패턴: {c13.get('round_bracket_usage', '-')}")
+            lines.append(f"  따옴표 방식: {c13.get('quotation_mark_style', '-')}")
+            if c13.get('examples'):
+                for ex in c13['examples'][:2]:
+                    lines.append(f"    예: {ex}")
+
+        if c14:
+            lines.append("")
+            lines.append("▌ 제목 패턴")
+            lines.append(f"  평균 길이: {c14.get('avg_title_length', '-')}  구조: {c14.get('title_structure', '-')}")
+            lines.append(f"  숫자 활용: {c14.get('number_usage', '-')} / 감정 후크: {c14.get('emotion_hook', '-')}")
+            if c14.get('examples'):
+                for ex in c14['examples'][:3]:
+                    lines.append(f"    {ex}")
+
+        lines.append("")
+        lines.append("▌ 시그니처 표현")
+        for phrase in c5.get('signature_phrases', [])[:6]:
+            lines.append(f"  • {phrase}")
+
+        lines.append("")
+        lines.append("▌ 도입부 예시")
+        for ex in c9.get('opening_examples', [])[:2]:
+            lines.append(f"  {ex}")
+
+        lines.append("")
+        lines.append("▌ 마무리 예시")
+        for ex in c9.get('closing_examples', [])[:2]:
+            lines.append(f"  {ex}")
+
+    if sample_post:
+        lines.append("")
+        lines.append("━" * 36)
+        lines.append(f"▌ 실제 글 샘플 (AI가 모방하는 글)")
+        lines.append(f"  제목: {sample_post.get('title', '')}")
+        lines.append(f"  날짜: {sample_post.get('addDate', '')}")
+        lines.append("")
+        lines.append(sample_post.get('content', '')[:1800])
+
+    # c10 시각 스타일 → JS가 HTML 변환에 쓸 구조화 데이터
+    dna_styles = {}
+    if dna_analysis:
+        c10 = dna_analysis.get("c10_visual_formatting", {})
+        # 폰트 패밀리 (Naver CSS font-family 값)
+        raw_font = c10.get("font_family", "")
+        font_map = {
+            "나눔마루부리": "NanumMyeongjo, '나눔마루부리', serif",
+            "나눔고딕": "'나눔고딕', NanumGothic, sans-serif",
+            "나눔명조": "NanumMyeongjo, '나눔명조', serif",
+            "맑은 고딕": "'맑은 고딕', MalgunGothic, sans-serif",
+            "돋움": "Dotum, '돋움', sans-serif",
+            "굴림": "Gulim, '굴림', sans-serif",
+        }
+        css_font = font_map.get(raw_font, font_map.get(raw_font.split()[0], "'맑은 고딕', sans-serif"))
+
+        # 중앙정렬 비율 파싱 (숫자 or "57%" 형태 모두 처리)
+        center_raw = c10.get("center_align", "0")
+        try:
+            center_val = float(str(center_raw).replace("%", "").strip())
+            if center_val > 1:
+                center_val = center_val / 100
+        except Exception:
+            center_val = 0.0
+
+        # 강조 색상 (첫번째 유효색)
+        text_colors = c10.get("text_colors", [])
+        accent_color = text_colors[0] if text_colors else ""
+        highlight_colors = c10.get("highlight_colors", [])
+        highlight_color = highlight_colors[0] if highlight_colors else ""
+
+        dna_styles = {
+            "font_family": css_font,
+            "center_align_ratio": center_val,
+            "accent_color": accent_color,
+            "highlight_color": highlight_color,
+            "has_italic": bool(c10.get("italic_usage", "")),
+            "has_quote": bool(c10.get("quote_style", "")),
+            "font_size_body": "11pt",
+            "font_size_heading": "14pt",
+        }
+
+    return "\n".join(lines), dna_styles
+
+
+def _slim_post(post: dict) -> dict:
+    return {
+        "title": post.get("title", ""),
+        "addDate": post.get("addDate", ""),
+        "url": post.get("url", ""),
+        "content": post.get("content", "")[:SAMPLE_CONTENT_CHARS],
+    }
+
+
+def _build_base(dna_id: str, dna_file: Path | None, collection_index) -> dict:
+    dna_analysis = None
+    if dna_file:
+        with open(dna_file, 'r', encoding='utf-8') as f:
+            dna_analysis = json.load(f)
+
+    unique_posts = collection_index.load_posts(dna_id) if (dna_id and collection_index) else []
+    sample_post = next((p for p in unique_posts if p.get("content", "").strip()), None)
+    samples = [_slim_post(p) for p in unique_posts[:SAMPLE_POST_LIMIT]]
+
+    length_guide, struct_guide = _render_guides(dna_analysis)
+    preview_text, preview_styles = _render_preview(dna_analysis, sample_post)
+    return {
+        "dna_id": dna_id,
+        "dna_file": str(dna_file) if dna_file else "",
+        "dna_analysis": dna_analysis,
+        "sample_posts": samples,
+        "sample_post": _slim_post(sample_post) if sample_post else None,
+        "style_guide": _render_style_guide(dna_analysis, samples),
+        "length_guide": length_guide,
+        "struct_guide": struct_guide,
+        "html_style": _render_html_style(dna_analysis),
+        "preview_text": preview_text,
+        "preview_styles": preview_styles,
+    }
+
+
+# ──────────────────────────────────────────
+# 캐시
+# ──────────────────────────────────────────
+
+def _cached(key: tuple, build) -> dict:
+    with _lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return hit
+        _stats["misses"] += 1
+    value = build()
+    with _lock:
+        _cache[key] = value
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_ARTIFACTS:
+            _cache.popitem(last=False)
+    return value
+
+
+def get_artifact(dna_dir: Path, dna_id: str, collection_index=None, active_tags: list[dict] | None = None) -> dict:
+    """
+    DNA 프롬프트 아티팩트 반환 (캐시).
+    active_tags가 있으면 태그 섹션만 덧붙인 변형을 따로 캐시한다 (태그 없는 기본본은 미리보기와 공유).
+    """
+    dna_file = resolve_dna_file(Path(dna_dir), dna_id)
+    mtime = dna_file.stat().st_mtime if dna_file else 0.0
+    posts_sig = collection_index.signature(dna_id) if (dna_id and collection_index) else ""
+    base_key = (dna_id, str(dna_file or ""), mtime, posts_sig)
+    base = _cached(base_key, lambda: _build_base(dna_id, dna_file, collection_index))
+
+    tag_labels = tuple(t.get("label", "") for t in (active_tags or []) if t.get("label"))
+    if not tag_labels:
+        return base
+
+    def _with_tags():
+        tag_section = _render_tag_section(active_tags)
+        style_guide = "\n".join(p for p in (base["style_guide"], tag_section) if p)
+        return dict(base, style_guide=style_guide, active_tags=list(tag_labels))
+
+    return _cached(base_key + (tag_labels,), _with_tags)
+
+
+def empty_artifact() -> dict:
+    """DNA 없이 생성할 때의 기본 가이드."""
+    return _cached(("",), lambda: _build_base("", None, None))
+
+
+def cache_info() -> dict:
+    with _lock:
+        return {"entries": len(_cache), "max_entries": MAX_ARTIFACTS, **_stats}
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
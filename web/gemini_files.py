@@ -0,0 +1,177 @@
+"""
+Gemini File API 업로드 관리 — gemini_files.py
+같은 첨부 파일을 다시 올리지 않도록 내용 해시로 업로드 핸들을 캐시하고,
+처리 대기(PROCESSING → ACTIVE)는 여러 파일을 한 번에 백오프 폴링한다.
+
+app.py에서 import하여 사용:
+  upload(client, path) -> File | None              # 캐시 hit 시 재업로드 없음
+  wait_active(client, files, timeout, check) -> list[File]
+  cleanup_expired(client) -> int                   # 생성 직후 삭제 대신 TTL 기반 정리
+
+- Gemini 업로드 파일은 48시간 후 자동 만료 → 캐시는 GEMINI_FILE_TTL_HOURS(기본 46시간)까지만 사용
+- TTL이 지난 파일은 cleanup_expired가 원격 삭제 + 캐시 제거 (호출 간격 제한 포함)
+"""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+from cache_store import get_cache
+
+GEMINI_FILE_TTL_HOURS = float(os.getenv("GEMINI_FILE_TTL_HOURS", "46"))
+CLEANUP_INTERVAL_SEC = 3600
+POLL_INITIAL_DELAY = 0.5
+POLL_MAX_DELAY = 4.0
+
+MIME_MAP = {
+    '.pdf':  'application/pdf',
+    '.jpg':  'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png':  'image/png',
+    '.gif':  'image/gif',
+    '.webp': 'image/webp',
+}
+
+_last_cleanup = 0.0
+_cleanup_lock = threading.Lock()
+
+
+def _handles():
+    return get_cache("gemini_files", max_bytes=8 * 1024 * 1024)
+
+
+def _scope() -> str:
+    """업로드 파일은 API 키(프로젝트) 단위로만 보이므로 캐시 키에 키 지문을 포함."""
+    api_key = os.getenv("GEMINI_API_KEY", "")
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+def _content_key(path: Path, mime_type: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return f"{_scope()}:{mime_type}:{digest.hexdigest()}"
+
+
+def _state(gfile) -> str:
+    state = getattr(gfile, "state", None)
+    return getattr(state, "name", str(state or ""))
+
+
+def upload(client, path: Path):
+    """
+    Gemini File API 업로드 (PDF / 이미지). 지원하지 않는 형식이나 실패 시 None.
+    같은 내용의 파일이 TTL 안에 이미 올라가 있으면 그 핸들을 재사용한다.
+    """
+    path = Path(path)
+    mime_type = MIME_MAP.get(path.suffix.lower())
+    if not mime_type:
+        print(f"[INFO] {path.suffix.lower()} → 텍스트 추출 방식 사용")
+        return None
+
+    cache = _handles()
+    key = _content_key(path, mime_type)
+    entry = cache.get(key)
+    if entry and entry.get("expires_at", 0) > time.time():
+        try:
+            gfile = client.files.get(name=entry["name"])
+            if _state(gfile) in ("ACTIVE", "PROCESSING"):
+                print(f"[OK] Gemini 업로드 재사용: {path.name} → {gfile.name}")
+                return gfile
+        except Exception:
+            pass
+        cache.delete(key)
+
+    try:
+        from google.genai import types as _gtypes
+        gfile = client.files.upload(
+            file=str(path),
+            config=_gtypes.UploadFileConfig(mime_type=mime_type),
+        )
+    except Exception as e:
+        print(f"[WARN] Gemini 파일 업로드 실패 ({path.name}): {e}")
+        return None
+
+    print(f"[OK] Gemini 파일 업로드: {path.name} → {gfile.name}")
+    now = time.time()
+    cache.set(key, {
+        "name": gfile.name,
+        "display_name": path.name,
+        "uploaded_at": now,
+        "expires_at": now + GEMINI_FILE_TTL_HOURS * 3600,
+    })
+    return gfile
+
+
+def wait_active(client, files: list, timeout: float = 90, check=None) -> list:
+    """
+    업로드 파일 전체가 ACTIVE가 될 때까지 함께 폴링 (지수 백오프).
+    모든 파일이 준비되는 즉시 반환하며, 입력 순서대로 ACTIVE 파일만 돌려준다.
+    check: 매 라운드 호출되는 콜백 (작업 취소 확인 등, 예외로 중단)
+    """
+    ready: dict[int, object] = {}
+    pending: dict[int, object] = {}
+    for i, gf in enumerate(files):
+        if _state(gf) == "ACTIVE":
+            ready[i] = gf
+        else:
+            pending[i] = gf
+
+    deadline = time.monotonic() + timeout
+    delay = POLL_INITIAL_DELAY
+    while pending:
+        if check:
+            check()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            for gf in pending.values():
+                print(f"[WARN] Gemini 파일 처리 타임아웃: {gf.name}")
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, POLL_MAX_DELAY)
+
+        for i, gf in list(pending.items()):
+            try:
+                gf = client.files.get(name=gf.name)
+            except Exception as e:
+                print(f"[WARN] Gemini 파일 상태 조회 실패 ({gf.name}): {e}")
+                continue
+            state = _state(gf)
+            if state == "ACTIVE":
+                ready[i] = gf
+                del pending[i]
+            elif state == "FAILED":
+                print(f"[WARN] Gemini 파일 처리 실패: {gf.name}")
+                del pending[i]
+            else:
+                pending[i] = gf
+
+    return [ready[i] for i in sorted(ready)]
+
+
+def cleanup_expired(client, force: bool = False) -> int:
+    """TTL이 지난 업로드 파일 원격 삭제 + 캐시 제거. CLEANUP_INTERVAL_SEC마다 최대 1회."""
+    global _last_cleanup
+    with _cleanup_lock:
+        now = time.time()
+        if not force and now - _last_cleanup < CLEANUP_INTERVAL_SEC:
+            return 0
+        _last_cleanup = now
+
+    cache = _handles()
+    removed = 0
+    for key, entry in cache.items(f"{_scope()}:"):
+        if entry.get("expires_at", 0) > now:
+            continue
+        try:
+            client.files.delete(name=entry["name"])
+        except Exception:
+            pass  # 이미 자동 만료된 경우
+        cache.delete(key)
+        removed += 1
+    if removed:
+        print(f"[OK] 만료된 Gemini 업로드 정리: {removed}개")
+    return removed
@@ -0,0 +1,169 @@
+"""
+HTML → 본문 텍스트 추출 — html_text.py
+응답 본문을 조각(chunk) 단위로 HTMLParser에 흘려 넣으며 보이는 텍스트만 모으고,
+필요한 만큼 모이면 나머지는 읽지 않는다 (문서 전체에 정규식을 돌리지 않음).
+
+- script/style/noscript/nav/header/footer/aside 등 하위 트리는 건너뜀
+- 본문 컨테이너(네이버 PostView의 .se-main-container, #postViewArea 등)가 있으면 그 안의 텍스트만 사용하고,
+  컨테이너가 닫히면 읽기를 멈춤
+- max_chars 글자를 모으거나 max_bytes 바이트(str이면 글자)를 읽으면 중단
+
+app.py에서 import하여 사용:
+  html_to_text(chunks, encoding="utf-8", max_chars=10000, max_bytes=HTML_MAX_BYTES) -> str
+      # chunks: bytes 조각 iterable (resp.iter_content) 또는 str/bytes 전체
+"""
+
+import codecs
+import os
+import re
+from html.parser import HTMLParser
+from typing import Iterable
+
+HTML_MAX_BYTES = int(float(os.getenv("HTML_TEXT_MAX_MB", "2")) * 1024 * 1024)
+
+# 내용을 통째로 건너뛸 태그
+SKIP_TAGS = {
+    "script", "style", "noscript", "template", "svg", "iframe", "object",
+    "nav", "header", "footer", "aside", "form", "button", "select",
+}
+# 앞뒤로 줄바꿈을 넣을 블록 태그
+BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "dl", "dt", "dd", "tr", "table", "section", "article", "main",
+    "blockquote", "pre", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "figure", "figcaption",
+}
+# 닫는 태그가 없는 요소 (중첩 깊이 계산에서 제외)
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+}
+# 본문 컨테이너: (속성, 값) — 네이버 Smart Editor 3 / 2 / 구버전 / 모바일 (run_crawler와 같은 후보)
+MAIN_CONTAINERS = (
+    ("class", "se-main-container"),
+    ("id", "postViewArea"),
+    ("class", "post-view"),
+    ("class", "se_doc_viewer"),
+)
+
+_SPACES = re.compile(r"[ \t\r\f\v\u00a0]+")
+
+
+class _Stop(Exception):
+    pass
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.page_parts: list[str] = []
+        self.page_chars = 0
+        self.main_parts: list[str] = []
+        self.main_chars = 0
+        self._skip_tag: str | None = None
+        self._skip_depth = 0
+        self._main_tag: str | None = None
+        self._main_depth = 0
+        self.main_found = False
+
+    @staticmethod
+    def _is_main(attrs) -> bool:
+        for name, value in attrs:
+            if not value:
+                continue
+            for attr, wanted in MAIN_CONTAINERS:
+                if name == attr and (value == wanted if attr == "id" else wanted in value.split()):
+                    return True
+        return False
+
+    def _append(self, text: str):
+        # 줄바꿈만 있는 조각은 글자 수에 세지 않음 (빈 본문 컨테이너 판별용)
+        size = 0 if text == "\n" else len(text)
+        if self._main_tag:
+            self.main_parts.append(text)
+            self.main_chars += size
+            if self.main_chars >= self.max_chars:
+                raise _Stop
+        elif not self.main_found:
+            self.page_parts.append(text)
+            self.page_chars += size
+            # 본문 컨테이너가 뒤에 나올 수 있으므로 페이지 텍스트는 여유 있게 모아 둔다
+            if self.page_chars >= self.max_chars * 4:
+                raise _Stop
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip_tag:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+        if tag in SKIP_TAGS:
+            self._skip_tag, self._skip_depth = tag, 1
+            return
+        if self._main_tag:
+            if tag == self._main_tag:
+                self._main_depth += 1
+        elif not self.main_found and tag not in VOID_TAGS and self._is_main(attrs):
+            self._main_tag, self._main_depth = tag, 1
+            self.main_found = True
+        if tag in BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        if not self._skip_tag and tag in BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_endtag(self, tag):
+        if self._skip_tag:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if self._skip_depth == 0:
+                    self._skip_tag = None
+            return
+        if tag in BLOCK_TAGS:
+            self._append("\n")
+        if self._main_tag and tag == self._main_tag:
+            self._main_depth -= 1
+            if self._main_depth == 0:
+                self._main_tag = None
+                if self.main_chars:
+                    raise _Stop  # 본문 컨테이너를 다 읽었으면 나머지 문서는 필요 없음
+                self.main_found = False  # 빈 컨테이너 (JS 렌더링 등) — 페이지 텍스트로 계속
+
+    def handle_data(self, data):
+        if self._skip_tag or not data:
+            return
+        text = _SPACES.sub(" ", data)
+        if text.strip():
+            self._append(text)
+        elif "\n" in text:
+            self._append("\n")
+
+    def text(self) -> str:
+        parts = self.main_parts if self.main_found and self.main_chars else self.page_parts
+        lines = (line.strip() for line in "".join(parts).split("\n"))
+        result = re.sub(r"\n{3,}", "\n\n", "\n".join(lines))
+        return result.strip()[:self.max_chars]
+
+
+def html_to_text(chunks: Iterable[bytes] | bytes | str, encoding: str | None = "utf-8", max_chars: int = 10000,
+                 max_bytes: int = HTML_MAX_BYTES) -> str:
+    """HTML 조각들을 순서대로 파싱해 보이는 텍스트 반환 (본문 컨테이너가 있으면 그 안만)."""
+    if isinstance(chunks, (str, bytes)):
+        chunks = [chunks]
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    parser = _TextExtractor(max_chars)
+    read = 0
+    try:
+        for chunk in chunks:
+            chunk = chunk[:max(0, max_bytes - read)]
+            read += len(chunk)
+            piece = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+            parser.feed(piece)
+            if read >= max_bytes:
+                break
+        parser.close()
+    except _Stop:
+        pass
+    return parser.text()
@@ -7,14 +7,26 @@ Gemini Imagen 이미지 생성 서비스
 - Gemini API Key가 없으면 자동 비활성화
 - 모든 함수는 실패 시 빈 리스트/False 반환 (에러 전파 없음)
 - 별도 API Key 불필요 (기존 Gemini API Key 사용)
+- 프롬프트별 이미지는 동시에 생성 (IMAGE_GEN_WORKERS), 1장당 제한 시간 IMAGE_GEN_TIMEOUT_SEC
 """
 
 import os
 import json
+import time
 import base64
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime
 
+from llm_gateway import generate as llm_generate, get_client
+
+
+IMAGEN_MODEL = 'imagen-4.0-fast-generate-001'
+MAX_IMAGES = 3
+IMAGE_GEN_WORKERS = int(os.getenv("IMAGE_GEN_WORKERS", "3"))
+IMAGE_GEN_TIMEOUT_SEC = float(os.getenv("IMAGE_GEN_TIMEOUT_SEC", "60"))
+
 
 def is_available() -> bool:
     """Gemini API Key가 설정되어 있는지 확인"""
@@ -28,14 +40,15 @@ def extract_image_prompts(blog_content: str, gemini_client) -> list:
     
     Args:
         blog_content: 블로그 본문 텍스트
-        gemini_client: google.genai.Client 인스턴스
+        gemini_client: google.genai.Client 인스턴스 (생략 시 공유 클라이언트)
         target_audience: 타겟 독자
         content_angle: 콘텐츠 앵글
     
     Returns:
         영문 이미지 생성 프롬프트 리스트
     """
-def extract_image_prompts(blog_content: str, gemini_client, target_audience: str = "일반 시민", content_angle: str = "정보전달형") -> list:
+def extract_image_prompts(blog_content: str, gemini_client=None, target_audience: str = "일반 시민", content_angle: str = "정보전달형") -> list:
+    gemini_client = gemini_client or get_client()
     try:
         # 타겟 및 앵글에 따른 비주얼 스타일 가이드라인 정의
         style_guide = f"""
@@ -62,9 +75,11 @@ Blog Content (First 1500 chars):
 Output Format (JSON array only, no other text):
 ["prompt1", "prompt2", "prompt3"]"""
 
-        response = gemini_client.models.generate_content(
+        response = llm_generate(
+            gemini_client,
             model='gemini-2.0-flash',
-            contents=prompt
+            contents=prompt,
+            endpoint="extract_image_prompts",
         )
         
         response_text = response.text.strip()
@@ -87,86 +102,146 @@ Output Format (JSON array only, no other text):
         return []
 
 
-def generate_images(prompts: list, gemini_client, output_dir: Path = None) -> list:
+def _generate_one(gemini_client, img_prompt: str, started: dict, i: int) -> bytes | None:
+    """Imagen 1장 생성 → PNG 바이트 (빈 결과면 None). started[i]에 시작 시각 기록 (타임아웃 판정용)."""
+    from google.genai import types
+
+    started[i] = time.monotonic()
+    response = gemini_client.models.generate_images(
+        model=IMAGEN_MODEL,
+        prompt=img_prompt,
+        config=types.GenerateImagesConfig(
+            number_of_images=1,
+        )
+    )
+    if not response.generated_images:
+        return None
+    return response.generated_images[0].image.image_bytes
+
+
+def _build_image_info(img_bytes: bytes, img_prompt: str, index: int,
+                      output_dir: Path | None, inline: bool, store) -> dict:
+    image_info = {
+        "prompt": img_prompt,
+        "index": index,
+        "saved_path": "",
+    }
+    # 이미지 저장소: 내용 해시 기준 1회 저장, URL/크기/썸네일 URL만 반환
+    if store is not None:
+        image_info.update(store.put(img_bytes, kind="generated", ext="png"))
+    if inline:
+        b64_data = base64.b64encode(img_bytes).decode('utf-8')
+        image_info["data_uri"] = f"data:image/png;base64,{b64_data}"
+
+    # 파일로 저장 (저장소 없이 output_dir만 있는 경우) — 같은 초에 생성돼도 겹치지 않도록 내용 해시 포함
+    elif output_dir:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        digest = hashlib.sha256(img_bytes).hexdigest()[:8]
+        img_filename = f"blog_image_{timestamp}_{index}_{digest}.png"
+        img_path = output_dir / img_filename
+
+        with open(img_path, 'wb') as f:
+            f.write(img_bytes)
+
+        image_info["saved_path"] = str(img_path)
+        print(f"[OK] 이미지 저장: {img_path}")
+    return image_info
+
+
+def iter_images(prompts: list, gemini_client=None, output_dir: Path = None,
+                inline: bool = True, store=None, timeout: float = None):
     """
-    Gemini Imagen API로 이미지 생성.
+    프롬프트별 이미지를 동시에 생성하며 완료되는 순서대로 이미지 정보를 yield.
+    동시 실행 수는 IMAGE_GEN_WORKERS, 1장당 제한 시간은 timeout(기본 IMAGE_GEN_TIMEOUT_SEC).
+    실패/타임아웃된 이미지는 건너뛴다 (에러 전파 없음).
+
+    Args:
+        inline: True면 data_uri(base64) 포함, False면 저장소 URL만 (store 필요)
+        store: image_store.ImageStore — 지정 시 output_dir 대신 저장소에 저장
+    """
+    gemini_client = gemini_client or get_client()
+    prompts = list(prompts[:MAX_IMAGES])  # 최대 3개
+    if not prompts or gemini_client is None:
+        return
+    timeout = IMAGE_GEN_TIMEOUT_SEC if timeout is None else timeout
+
+    started: dict[int, float] = {}
+    pool = ThreadPoolExecutor(max_workers=min(IMAGE_GEN_WORKERS, len(prompts)),
+                              thread_name_prefix="imagen")
+    pending = {
+        pool.submit(_generate_one, gemini_client, img_prompt, started, i): i
+        for i, img_prompt in enumerate(prompts)
+    }
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for fut in done:
+                i = pending.pop(fut)
+                img_prompt = prompts[i]
+                try:
+                    img_bytes = fut.result()
+                except Exception as e:
+                    print(f"[WARN] 이미지 생성 실패: prompt={img_prompt[:50]}..., error={e}")
+                    continue
+                if not img_bytes:
+                    print(f"[WARN] 이미지 생성 실패 (빈 결과): prompt={img_prompt[:50]}...")
+                    continue
+                try:
+                    image_info = _build_image_info(img_bytes, img_prompt, i + 1, output_dir, inline, store)
+                except Exception as e:
+                    print(f"[WARN] 이미지 저장 실패: prompt={img_prompt[:50]}..., error={e}")
+                    continue
+                print(f"[OK] 이미지 {i+1} 생성 완료: {img_prompt[:50]}...")
+                yield image_info
+
+            now = time.monotonic()
+            for fut, i in list(pending.items()):
+                if i in started and now - started[i] > timeout:
+                    # 실행 중인 호출은 중단할 수 없으므로 결과만 버린다
+                    print(f"[WARN] 이미지 생성 타임아웃 ({timeout:.0f}초): prompt={prompts[i][:50]}...")
+                    del pending[fut]
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def generate_images(prompts: list, gemini_client=None, output_dir: Path = None,
+                    inline: bool = True, store=None, timeout: float = None) -> list:
+    """
+    Gemini Imagen API로 이미지 생성 (프롬프트별 동시 생성, 결과는 프롬프트 순서).
     
     Args:
         prompts: 영문 이미지 생성 프롬프트 리스트
-        gemini_client: google.genai.Client 인스턴스
+        gemini_client: google.genai.Client 인스턴스 (생략 시 공유 클라이언트)
         output_dir: 이미지 저장 디렉토리 (없으면 저장 안 함)
+        inline: False면 data_uri 없이 저장소 URL/크기만 반환 (store 필요)
+        store: image_store.ImageStore — 지정 시 output_dir 대신 저장소에 저장
+        timeout: 1장당 제한 시간(초)
     
     Returns:
         이미지 정보 딕셔너리 리스트:
-        [{"data_uri": "data:image/png;base64,...", "prompt": "생성 프롬프트", "saved_path": "저장경로"}]
+        [{"data_uri": "data:image/png;base64,...", "prompt": "생성 프롬프트", "index": 1, "saved_path": "저장경로"}]
+        store 지정 시 + {"hash", "url", "width", "height", "bytes", "thumb_url", "webp_url"}
     """
-    from google.genai import types
-    
-    images = []
-    
-    for i, img_prompt in enumerate(prompts[:3]):  # 최대 3개
-        try:
-            response = gemini_client.models.generate_images(
-                model='imagen-4.0-fast-generate-001',
-                prompt=img_prompt,
-                config=types.GenerateImagesConfig(
-                    number_of_images=1,
-                )
-            )
-            
-            if not response.generated_images:
-                print(f"[WARN] 이미지 생성 실패 (빈 결과): prompt={img_prompt[:50]}...")
-                continue
-            
-            generated = response.generated_images[0]
-            
-            # base64 인코딩된 이미지 데이터
-            img_bytes = generated.image.image_bytes
-            b64_data = base64.b64encode(img_bytes).decode('utf-8')
-            data_uri = f"data:image/png;base64,{b64_data}"
-            
-            image_info = {
-                "data_uri": data_uri,
-                "prompt": img_prompt,
-                "index": i + 1,
-                "saved_path": ""
-            }
-            
-            # 파일로 저장 (output_dir이 있는 경우)
-            if output_dir:
-                output_dir = Path(output_dir)
-                output_dir.mkdir(parents=True, exist_ok=True)
-                
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                img_filename = f"blog_image_{timestamp}_{i+1}.png"
-                img_path = output_dir / img_filename
-                
-                with open(img_path, 'wb') as f:
-                    f.write(img_bytes)
-                
-                image_info["saved_path"] = str(img_path)
-                print(f"[OK] 이미지 저장: {img_path}")
-            
-            images.append(image_info)
-            print(f"[OK] 이미지 {i+1} 생성 완료: {img_prompt[:50]}...")
-            
-        except Exception as e:
-            print(f"[WARN] 이미지 생성 실패: prompt={img_prompt[:50]}..., error={e}")
-            continue
-    
+    images = list(iter_images(prompts, gemini_client, output_dir, inline, store, timeout))
+    images.sort(key=lambda img: img["index"])
     return images
 
 
-def generate_images_for_blog(blog_content: str, gemini_client, target_audience: str = "일반 시민", content_angle: str = "정보전달형", output_dir: Path = None) -> list:
+def generate_images_for_blog(blog_content: str, gemini_client=None, target_audience: str = "일반 시민", content_angle: str = "정보전달형", output_dir: Path = None,
+                             inline: bool = True, store=None) -> list:
     """
     블로그 본문에 맞는 이미지를 AI로 직접 생성하는 메인 함수.
     
     Args:
         blog_content: 블로그 본문 텍스트
-        gemini_client: google.genai.Client 인스턴스
+        gemini_client: google.genai.Client 인스턴스 (생략 시 공유 클라이언트)
         target_audience: 타겟 독자
         content_angle: 콘텐츠 앵글
         output_dir: 이미지 저장 디렉토리
+        inline / store: generate_images 참고
     
     Returns:
         이미지 정보 리스트 (실패 시 빈 리스트)
@@ -190,7 +265,7 @@ def generate_images_for_blog(blog_content: str, gemini_client, target_audience:
             print(f"  {j+1}. {p[:80]}...")
         
         # Step 2: Imagen으로 이미지 생성
-        images = generate_images(prompts, gemini_client, output_dir)
+        images = generate_images(prompts, gemini_client, output_dir, inline, store)
         
         print(f"[OK] 이미지 {len(images)}장 생성 완료")
         
@@ -0,0 +1,325 @@
+"""
+콘텐츠 주소 이미지 저장소 — image_store.py
+이미지 바이트의 sha256으로 저장해 같은 이미지는 한 번만 기록하고,
+응답에는 base64 대신 고정 URL + 크기만 싣는다. URL이 내용으로 정해지므로 브라우저가 영구 캐시할 수 있다.
+
+app.py에서 import하여 사용:
+  store = get_store(root, url_prefix="/media")
+  info = store.put(data, kind="generated")  # {"hash", "url", "width", "height", "bytes", "thumb_url", "webp_url"}
+  store.resolve(name) -> Path | None         # /media/<name> 라우트용 (저장소 밖 경로 차단)
+  store.add_refs(owner, urls)                # 블로그 패키지(output_id)가 쓰는 이미지 참조 기록
+  store.release(owner)                       # 패키지 삭제 시 참조 해제
+  store.gc(budget=None)                      # 참조 없는 추출/생성 이미지 정리 (유지보수 스케줄러가 GC_INTERVAL_SEC마다 호출)
+  find_media_urls(text, "/media") -> list    # 저장 본문에 박힌 저장소 이미지 URL (add_refs용)
+  store.stats() -> dict
+
+저장 구조: {root}/{hash[:2]}/{hash}.{ext}
+  변형본: {hash}_thumb.webp (긴 변 THUMB_SIZE), {hash}.webp (원본이 WebP가 아닐 때)
+  Pillow가 없으면 변형본 없이 원본만 저장 (thumb_url/webp_url은 원본 URL)
+메타데이터: {root}/_store.sqlite3
+
+정리 대상은 GC_KINDS의 종류별 유예 기간이 지나도록 어떤 패키지도 참조하지 않은 이미지:
+  extracted (업로드 자료에서 추출) — MEDIA_UNREFERENCED_TTL_HOURS
+  generated (Imagen 생성)          — MEDIA_GENERATED_TTL_DAYS (내보낸 글에 URL이 박혀 있을 수 있어 길게)
+"""
+
+import hashlib
+import io
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+THUMB_SIZE = 480
+WEBP_QUALITY = 82
+DB_FILENAME = "_store.sqlite3"
+GC_INTERVAL_SEC = 3600
+MEDIA_UNREFERENCED_TTL_HOURS = float(os.getenv("MEDIA_UNREFERENCED_TTL_HOURS", "24"))
+MEDIA_GENERATED_TTL_DAYS = float(os.getenv("MEDIA_GENERATED_TTL_DAYS", "30"))
+# kind → 참조 없이 남겨 두는 시간(시간 단위)
+GC_KINDS = {
+    "extracted": MEDIA_UNREFERENCED_TTL_HOURS,
+    "generated": MEDIA_GENERATED_TTL_DAYS * 24,
+}
+
+_HASH_IN_URL = re.compile(r"/([0-9a-f]{64})(?:_thumb)?\.[a-z0-9]+$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash          TEXT PRIMARY KEY,
+    ext           TEXT NOT NULL,
+    kind          TEXT NOT NULL DEFAULT '',
+    bytes         INTEGER NOT NULL DEFAULT 0,
+    variant_bytes INTEGER NOT NULL DEFAULT 0,
+    width         INTEGER NOT NULL DEFAULT 0,
+    height        INTEGER NOT NULL DEFAULT 0,
+    has_variants  INTEGER NOT NULL DEFAULT 0,
+    created_at    REAL NOT NULL,
+    last_used_at  REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS refs (
+    hash        TEXT NOT NULL,
+    owner       TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    PRIMARY KEY (hash, owner)
+);
+CREATE INDEX IF NOT EXISTS idx_refs_owner ON refs(owner);
+"""
+
+# 매직 바이트 → 확장자
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+
+
+def sniff_ext(data: bytes, default: str = "png") -> str:
+    for magic, ext in _SIGNATURES:
+        if data.startswith(magic):
+            return ext
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    return default
+
+
+class ImageStore:
+    """root 디렉토리 하나에 대응하는 저장소."""
+
+    def __init__(self, root: Path, url_prefix: str = "/media"):
+        self.root = Path(root)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.db_path = self.root / DB_FILENAME
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ──────────────────────────────────────────
+    # 경로 / URL
+    # ──────────────────────────────────────────
+
+    @staticmethod
+    def _rel(digest: str, suffix: str) -> str:
+        return f"{digest[:2]}/{digest}{suffix}"
+
+    def url(self, digest: str, suffix: str) -> str:
+        return f"{self.url_prefix}/{self._rel(digest, suffix)}"
+
+    def resolve(self, name: str) -> Path | None:
+        """URL 경로 → 파일 경로. 저장소 밖이거나 없는 파일이면 None."""
+        path = (self.root / name).resolve()
+        root = self.root.resolve()
+        if root not in path.parents or path.name == DB_FILENAME or not path.is_file():
+            return None
+        return path
+
+    def _info(self, row) -> dict:
+        digest, ext = row["hash"], row["ext"]
+        original = self.url(digest, f".{ext}")
+        has_variants = bool(row["has_variants"])
+        return {
+            "hash": digest,
+            "url": original,
+            "width": row["width"],
+            "height": row["height"],
+            "bytes": row["bytes"],
+            "thumb_url": self.url(digest, "_thumb.webp") if has_variants else original,
+            "webp_url": self.url(digest, ".webp") if has_variants and ext != "webp" else original,
+        }
+
+    # ──────────────────────────────────────────
+    # 저장
+    # ──────────────────────────────────────────
+
+    def put(self, data: bytes, kind: str = "", ext: str | None = None) -> dict:
+        """이미지 저장 (이미 있으면 기록 없이 기존 정보 반환)."""
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            if row is not None and (self.root / self._rel(digest, f".{row['ext']}")).exists():
+                conn.execute("UPDATE blobs SET last_used_at = ? WHERE hash = ?", (now, digest))
+                return self._info(row)
+
+        ext = (ext or sniff_ext(data)).lstrip(".").lower().replace("jpeg", "jpg")
+        path = self.root / self._rel(digest, f".{ext}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+        width, height, variant_bytes, has_variants = self._make_variants(data, digest, ext)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO blobs "
+                "(hash, ext, kind, bytes, variant_bytes, width, height, has_variants, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (digest, ext, kind, len(data), variant_bytes, width, height, int(has_variants), now, now),
+            )
+            row = conn.execute("SELECT * FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        return self._info(row)
+
+    def _make_variants(self, data: bytes, digest: str, ext: str) -> tuple[int, int, int, bool]:
+        """(width, height, 변형본 바이트 합, 변형본 생성 여부). Pillow가 없으면 크기만 PyMuPDF로."""
+        try:
+            from PIL import Image
+        except ImportError:
+            return (*_probe_size(data), 0, False)
+
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                img.load()
+                width, height = img.size
+                rgb = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+                written = 0
+                if ext != "webp":
+                    written += self._save_webp(rgb, digest, ".webp")
+                thumb = rgb.copy()
+                thumb.thumbnail((THUMB_SIZE, THUMB_SIZE))
+                written += self._save_webp(thumb, digest, "_thumb.webp")
+                return width, height, written, True
+        except Exception as e:
+            print(f"[WARN] 이미지 변형본 생성 실패 ({digest[:12]}): {e}")
+            return (*_probe_size(data), 0, False)
+
+    def _save_webp(self, img, digest: str, suffix: str) -> int:
+        path = self.root / self._rel(digest, suffix)
+        buf = io.BytesIO()
+        img.save(buf, format="WEBP", quality=WEBP_QUALITY, method=4)
+        path.write_bytes(buf.getvalue())
+        return buf.tell()
+
+    # ──────────────────────────────────────────
+    # 참조 / 정리
+    # ──────────────────────────────────────────
+
+    def add_refs(self, owner: str, urls: list[str]) -> int:
+        """owner(블로그 패키지 output_id)가 사용하는 저장소 이미지 URL 참조 기록. 저장소 URL이 아니면 무시."""
+        hashes = {m.group(1) for m in map(_HASH_IN_URL.search, urls or []) if m}
+        if not owner or not hashes:
+            return 0
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO refs (hash, owner, created_at) VALUES (?, ?, ?)",
+                [(h, owner, now) for h in hashes],
+            )
+            conn.executemany("UPDATE blobs SET last_used_at = ? WHERE hash = ?", [(now, h) for h in hashes])
+        return len(hashes)
+
+    def release(self, owner: str):
+        """owner의 참조 해제 (이미지는 유예 기간 후 gc에서 삭제)."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE blobs SET last_used_at = ? WHERE hash IN (SELECT hash FROM refs WHERE owner = ?)",
+                (now, owner),
+            )
+            conn.execute("DELETE FROM refs WHERE owner = ?", (owner,))
+
+    def gc(self, ttl_hours: float | None = None, budget=None) -> dict:
+        """
+        참조가 없고 종류별 유예 기간(GC_KINDS, ttl_hours 지정 시 모든 종류에 그 값) 동안
+        쓰이지 않은 이미지를 파일(변형본 포함)과 함께 삭제.
+        budget(maintenance.Budget)이 다하면 멈추고 partial=True를 돌려준다.
+        """
+        now = time.time()
+        params = []
+        for kind, kind_ttl in GC_KINDS.items():
+            params += [kind, now - (kind_ttl if ttl_hours is None else ttl_hours) * 3600]
+        expired = " OR ".join(["(kind = ? AND last_used_at < ?)"] * len(GC_KINDS))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT hash, ext, bytes, variant_bytes FROM blobs b "
+                f"WHERE ({expired}) "
+                f"AND NOT EXISTS (SELECT 1 FROM refs r WHERE r.hash = b.hash)",
+                params,
+            ).fetchall()
+
+        removed, freed = 0, 0
+        for row in rows:
+            if budget is not None and budget.exceeded():
+                return {"removed": removed, "freed_bytes": freed, "partial": True}
+            digest = row["hash"]
+            for suffix in (f".{row['ext']}", ".webp", "_thumb.webp"):
+                try:
+                    (self.root / self._rel(digest, suffix)).unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"[WARN] 이미지 파일 삭제 실패 ({digest[:12]}{suffix}): {e}")
+            with self._connect() as conn:
+                conn.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+            removed += 1
+            freed += row["bytes"] + row["variant_bytes"]
+        if removed:
+            print(f"[OK] 참조 없는 이미지 정리: {removed}개 ({freed / 1024 / 1024:.1f}MB)")
+        return {"removed": removed, "freed_bytes": freed}
+
+    # ──────────────────────────────────────────
+    # 조회
+    # ──────────────────────────────────────────
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n, COALESCE(SUM(bytes), 0) AS b, COALESCE(SUM(variant_bytes), 0) AS v FROM blobs"
+            ).fetchone()
+            unreferenced = conn.execute(
+                "SELECT COUNT(*) FROM blobs b WHERE NOT EXISTS (SELECT 1 FROM refs r WHERE r.hash = b.hash)"
+            ).fetchone()[0]
+            owners = conn.execute("SELECT COUNT(DISTINCT owner) FROM refs").fetchone()[0]
+            by_kind = {r["kind"] or "other": {"count": r["n"], "bytes": r["b"] + r["v"]} for r in conn.execute(
+                "SELECT kind, COUNT(*) AS n, COALESCE(SUM(bytes), 0) AS b, COALESCE(SUM(variant_bytes), 0) AS v "
+                "FROM blobs GROUP BY kind"
+            )}
+        return {
+            "images": row["n"],
+            "bytes": row["b"],
+            "variant_bytes": row["v"],
+            "disk_bytes": row["b"] + row["v"],
+            "unreferenced": unreferenced,
+            "owners": owners,
+            "by_kind": by_kind,
+        }
+
+
+def find_media_urls(text: str, url_prefix: str = "/media") -> list[str]:
+    """본문(마크다운/HTML)에 들어 있는 저장소 이미지 URL 목록 (중복 제거, 등장 순)."""
+    pattern = re.escape(url_prefix.rstrip("/")) + r"/[0-9a-f]{2}/[0-9a-f]{64}(?:_thumb)?\.[a-z0-9]+"
+    return list(dict.fromkeys(re.findall(pattern, text or "")))
+
+
+def _probe_size(data: bytes) -> tuple[int, int]:
+    try:
+        import fitz
+        pix = fitz.Pixmap(data)
+        return pix.width, pix.height
+    except Exception:
+        return 0, 0
+
+
+_stores: dict[str, ImageStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(root: Path | str, url_prefix: str = "/media") -> ImageStore:
+    """root별 저장소 싱글턴."""
+    key = str(Path(root).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = ImageStore(Path(root), url_prefix)
+            _stores[key] = store
+        return store
@@ -0,0 +1,311 @@
+"""
+비동기 작업 큐 — job_queue.py
+/api/blog/generate 처럼 수십 초 걸리는 작업을 waitress 요청 스레드 밖에서 실행한다.
+
+app.py에서 import하여 사용:
+  configure(jobs_dir, max_workers, max_pending)
+  submit(kind, func, *args) -> job_id        # func(ctx, *args) -> dict
+  get_job(job_id) -> dict | None
+  wait_events(job_id, after_seq, timeout) -> list[dict]
+  cancel(job_id) -> bool
+
+- 워커 풀 크기와 대기열 길이를 제한 (대시보드 요청 스레드 보호)
+- 단계(stage) 전환 시마다 JSON으로 저장 → 브라우저 새로고침/서버 재시작 후에도 결과 조회 가능
+- 이벤트는 메모리에 seq 번호로 쌓고, SSE/폴링 양쪽에서 같은 데이터를 읽는다
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+# app.py에서 외부 주입: job_queue.configure(JOBS_DIR, ...)
+JOBS_DIR = Path(os.path.expanduser("~")) / "mcp-data" / "outputs" / "jobs"
+MAX_WORKERS = int(os.getenv("BLOG_JOB_WORKERS", "2"))
+MAX_PENDING = int(os.getenv("BLOG_JOB_MAX_PENDING", "20"))
+JOB_TTL_DAYS = 7
+# 메모리에 유지하는 이벤트 수 (토큰 스트리밍 등으로 무한히 늘어나지 않도록)
+MAX_EVENTS = 2000
+
+ACTIVE_STATES = ("queued", "running")
+FINAL_STATES = ("done", "failed", "cancelled")
+
+_executor: ThreadPoolExecutor | None = None
+_jobs: dict[str, dict] = {}
+_lock = threading.Lock()
+_cond = threading.Condition(_lock)
+
+
+class JobFailed(Exception):
+    """작업 실패를 사용자 메시지와 함께 알리는 예외 (HTTP 상태코드 포함)."""
+
+    def __init__(self, message: str, status: int = 500):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+class QueueFull(Exception):
+    """대기 작업이 MAX_PENDING을 넘었을 때."""
+
+
+class JobCancelled(Exception):
+    """사용자가 작업을 취소했을 때 워커 내부에서 사용."""
+
+
+class JobContext:
+    """워커 함수에 전달되는 진행상황 보고 객체."""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+
+    def stage(self, name: str, message: str = "", progress: int | None = None):
+        """파이프라인 단계 전환 — 저장 + 이벤트 발행."""
+        with _cond:
+            job = _jobs.get(self.job_id)
+            if not job:
+                return
+            now = datetime.now().isoformat()
+            if job["stages"] and not job["stages"][-1].get("finished_at"):
+                job["stages"][-1]["finished_at"] = now
+            job["stages"].append({"name": name, "message": message, "started_at": now})
+            job["stage"] = name
+            job["message"] = message
+            if progress is not None:
+                job["progress"] = max(0, min(100, int(progress)))
+            _append_event(job, "stage", {
+                "stage": name, "message": message, "progress": job["progress"],
+            })
+            _persist(job)
+        self.check_cancelled()
+
+    def emit(self, event_type: str, data: dict):
+        """단계 전환 없이 이벤트만 발행 (저장하지 않음)."""
+        with _cond:
+            job = _jobs.get(self.job_id)
+            if job:
+                _append_event(job, event_type, data)
+
+    @property
+    def cancelled(self) -> bool:
+        with _lock:
+            job = _jobs.get(self.job_id)
+            return bool(job and job.get("cancel_requested"))
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled()
+
+
+# ──────────────────────────────────────────
+# 내부 유틸
+# ──────────────────────────────────────────
+
+def _append_event(job: dict, event_type: str, data: dict):
+    """_cond를 잡은 상태에서 호출."""
+    job["event_seq"] += 1
+    job["events"].append({"seq": job["event_seq"], "type": event_type, "data": data})
+    if len(job["events"]) > MAX_EVENTS:
+        del job["events"][: len(job["events"]) - MAX_EVENTS]
+    job["updated_at"] = datetime.now().isoformat()
+    _cond.notify_all()
+
+
+def _public_view(job: dict) -> dict:
+    return {k: v for k, v in job.items() if k not in ("events", "cancel_requested")}
+
+
+def _persist(job: dict):
+    """작업 상태를 JSON으로 저장 (임시 파일 → rename)."""
+    try:
+        JOBS_DIR.mkdir(parents=True, exist_ok=True)
+        path = JOBS_DIR / f"{job['job_id']}.json"
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_public_view(job), f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"[WARN] 작업 상태 저장 실패 ({job.get('job_id')}): {e}")
+
+
+def _load_from_disk(job_id: str) -> dict | None:
+    path = JOBS_DIR / f"{job_id}.json"
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            job = json.load(f)
+    except Exception:
+        return None
+    # 이 프로세스가 모르는 실행 중 작업 = 서버 재시작으로 중단된 작업
+    if job.get("status") in ACTIVE_STATES:
+        job["status"] = "failed"
+        job["error"] = "서버 재시작으로 작업이 중단되었습니다. 다시 시도해주세요."
+    job["events"] = []
+    job["event_seq"] = job.get("event_seq", 0)
+    return job
+
+
+def _run(job_id: str, func, args: tuple):
+    ctx = JobContext(job_id)
+    with _cond:
+        job = _jobs[job_id]
+        if job.get("cancel_requested"):
+            job["status"] = "cancelled"
+            _append_event(job, "end", {"status": "cancelled"})
+            _persist(job)
+            return
+        job["status"] = "running"
+        job["started_at"] = datetime.now().isoformat()
+        _append_event(job, "status", {"status": "running"})
+        _persist(job)
+
+    started = time.monotonic()
+    status, result, error, http_status = "done", None, "", 200
+    try:
+        result = func(ctx, *args)
+    except JobCancelled:
+        status, error, http_status = "cancelled", "사용자가 작업을 취소했습니다.", 499
+    except JobFailed as e:
+        status, error, http_status = "failed", e.message, e.status
+    except Exception as e:
+        status, error, http_status = "failed", f"작업 실패: {e}", 500
+        print(f"[ERROR] 작업 실패 ({job_id}): {e}")
+
+    with _cond:
+        job = _jobs[job_id]
+        now = datetime.now().isoformat()
+        if job["stages"] and not job["stages"][-1].get("finished_at"):
+            job["stages"][-1]["finished_at"] = now
+        job["status"] = status
+        job["result"] = result
+        job["error"] = error
+        job["http_status"] = http_status
+        job["finished_at"] = now
+        job["elapsed_sec"] = round(time.monotonic() - started, 2)
+        if status == "done":
+            job["progress"] = 100
+        _append_event(job, "end", {"status": status, "error": error})
+        _persist(job)
+
+
+# ──────────────────────────────────────────
+# 공개 API
+# ──────────────────────────────────────────
+
+def configure(jobs_dir: Path | str | None = None, max_workers: int | None = None,
+              max_pending: int | None = None):
+    """작업 저장 경로/워커 수 설정. 첫 submit 전에 호출해야 워커 수가 반영된다."""
+    global JOBS_DIR, MAX_WORKERS, MAX_PENDING
+    if jobs_dir:
+        JOBS_DIR = Path(jobs_dir)
+    if max_workers:
+        MAX_WORKERS = max(1, int(max_workers))
+    if max_pending:
+        MAX_PENDING = max(1, int(max_pending))
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="blog-job")
+    return _executor
+
+
+def submit(kind: str, func, *args, meta: dict | None = None) -> str:
+    """작업 등록 후 job_id 즉시 반환. func(ctx, *args)의 반환 dict가 result가 된다."""
+    with _cond:
+        pending = sum(1 for j in _jobs.values() if j["status"] in ACTIVE_STATES)
+        if pending >= MAX_PENDING:
+            raise QueueFull(f"대기 중인 작업이 너무 많습니다 ({pending}개). 잠시 후 다시 시도해주세요.")
+
+        job_id = f"JOB_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        job = {
+            "job_id": job_id,
+            "kind": kind,
+            "status": "queued",
+            "stage": "queued",
+            "message": "",
+            "progress": 0,
+            "stages": [],
+            "result": None,
+            "error": "",
+            "http_status": None,
+            "meta": meta or {},
+            "created_at": datetime.now().isoformat(),
+            "updated_at": datetime.now().isoformat(),
+            "events": [],
+            "event_seq": 0,
+            "cancel_requested": False,
+        }
+        _jobs[job_id] = job
+        _append_event(job, "status", {"status": "queued", "position": pending})
+        _persist(job)
+
+    _get_executor().submit(_run, job_id, func, args)
+    return job_id
+
+
+def get_job(job_id: str) -> dict | None:
+    """작업 상태 조회 (메모리 → 디스크 순)."""
+    with _lock:
+        job = _jobs.get(job_id)
+        if job:
+            return _public_view(job)
+    job = _load_from_disk(job_id)
+    return _public_view(job) if job else None
+
+
+def wait_events(job_id: str, after_seq: int = 0, timeout: float = 15.0) -> tuple[list[dict], bool]:
+    """
+    after_seq 이후 이벤트를 반환. 새 이벤트가 없으면 timeout까지 대기.
+    반환: (events, finished)
+    """
+    deadline = time.monotonic() + timeout
+    with _cond:
+        while True:
+            job = _jobs.get(job_id)
+            if job is None:
+                return [], True
+            events = [e for e in job["events"] if e["seq"] > after_seq]
+            finished = job["status"] in FINAL_STATES
+            if events or finished:
+                return events, finished
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return [], False
+            _cond.wait(remaining)
+
+
+def cancel(job_id: str) -> bool:
+    """취소 요청. 대기 중이면 시작 전에, 실행 중이면 다음 단계 경계에서 중단된다."""
+    with _cond:
+        job = _jobs.get(job_id)
+        if not job or job["status"] in FINAL_STATES:
+            return False
+        job["cancel_requested"] = True
+        _append_event(job, "status", {"status": "cancelling"})
+        return True
+
+
+def prune_jobs(max_age_days: int = JOB_TTL_DAYS) -> int:
+    """오래된 작업 파일/메모리 항목 정리. 삭제 개수 반환."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for fp in JOBS_DIR.glob("JOB_*.json"):
+        try:
+            if fp.stat().st_mtime < cutoff:
+                fp.unlink()
+                removed += 1
+        except Exception:
+            pass
+    with _lock:
+        for job_id in [j for j, job in _jobs.items()
+                       if job["status"] in FINAL_STATES and not (JOBS_DIR / f"{j}.json").exists()]:
+            _jobs.pop(job_id, None)
+    return removed
@@ -0,0 +1,268 @@
+"""
+백그라운드 유지보수 스케줄러 — maintenance.py
+오래 떠 있는 서버의 디스크 사용량이 계속 늘지 않도록 정리 작업(TTL 삭제, 임시 파일 회수,
+수집 폴더 압축, 캐시 정리 등)을 프로세스 안의 스레드 1개가 주기적으로 실행한다.
+
+- 작업마다 실행 간격(interval_sec), 간격 흔들기(jitter, 비율), 실행 시간 예산(budget_sec)
+- 예산은 협조식: 작업 함수가 budget.exceeded()를 확인해 멈추고 나머지는 다음 실행으로 넘긴다
+- MAINT_{NAME}_INTERVAL_SEC / MAINT_{NAME}_BUDGET_SEC 환경변수로 작업별 재정의
+- MAINTENANCE_DISABLED=1: 스레드를 띄우지 않음 (run_now로 수동 실행은 가능)
+
+app.py에서 import하여 사용:
+  scheduler = get_scheduler()
+  scheduler.register(name, fn, interval_sec, jitter=0.1, budget_sec=30, initial_delay=30)
+      # fn(budget) -> dict | int | None
+  scheduler.start() / scheduler.stop()
+  scheduler.run_now(name) -> dict            # 다음 루프에서 바로 실행 (관리자 API)
+  scheduler.status() -> dict                 # 작업별 마지막 실행 결과
+  sweep_files(paths, max_age_sec, budget)    # mtime 기준 파일/폴더 삭제
+  prune_versions(groups, keep, max_age_sec, budget)  # 그룹별 최신 keep개 외 오래된 버전 삭제
+"""
+
+import os
+import random
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+MAINTENANCE_DISABLED = os.getenv("MAINTENANCE_DISABLED", "0") == "1"
+# 대기 중 최대 수면 시간 — run_now/stop 외에도 주기적으로 깨어 예정 시각을 확인
+_MAX_SLEEP_SEC = 60.0
+
+
+class Budget:
+    """작업 1회 실행 시간 예산 (monotonic 기준)."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self._deadline = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self._deadline - time.monotonic())
+
+    def exceeded(self) -> bool:
+        return time.monotonic() >= self._deadline
+
+
+class Task:
+    def __init__(self, name: str, fn: Callable, interval_sec: float, jitter: float,
+                 budget_sec: float, initial_delay: float):
+        env = name.upper()
+        self.name = name
+        self.fn = fn
+        self.interval_sec = float(os.getenv(f"MAINT_{env}_INTERVAL_SEC", interval_sec))
+        self.budget_sec = float(os.getenv(f"MAINT_{env}_BUDGET_SEC", budget_sec))
+        self.jitter = max(0.0, min(jitter, 0.9))
+        self.next_run = time.time() + initial_delay * (1 + random.uniform(0, self.jitter))
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.over_budget = 0
+        self.last_started_at: float | None = None
+        self.last_duration_ms: float | None = None
+        self.last_status: str | None = None
+        self.last_result = None
+        self.last_error: str | None = None
+
+    def schedule_next(self):
+        spread = 1 + random.uniform(-self.jitter, self.jitter)
+        self.next_run = time.time() + self.interval_sec * spread
+
+    def view(self) -> dict:
+        return {
+            "name": self.name,
+            "interval_sec": self.interval_sec,
+            "jitter": self.jitter,
+            "budget_sec": self.budget_sec,
+            "running": self.running,
+            "next_run_at": self.next_run,
+            "runs": self.runs,
+            "failures": self.failures,
+            "over_budget": self.over_budget,
+            "last_started_at": self.last_started_at,
+            "last_duration_ms": self.last_duration_ms,
+            "last_status": self.last_status,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+        }
+
+
+class Scheduler:
+    """등록된 작업을 예정 시각 순서대로 스레드 1개에서 하나씩 실행."""
+
+    def __init__(self):
+        self._tasks: dict[str, Task] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, name: str, fn: Callable, interval_sec: float, *, jitter: float = 0.1,
+                 budget_sec: float = 30.0, initial_delay: float = 30.0):
+        """작업 등록 (같은 이름이면 교체). fn(budget)은 결과 dict/int를 반환한다."""
+        with self._lock:
+            self._tasks[name] = Task(name, fn, interval_sec, jitter, budget_sec, initial_delay)
+        self._wake.set()
+
+    def start(self) -> bool:
+        if MAINTENANCE_DISABLED:
+            print("[INFO] 유지보수 스케줄러 비활성화 (MAINTENANCE_DISABLED=1)")
+            return False
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return False
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._loop, name="maintenance", daemon=True)
+            self._thread.start()
+        print(f"[OK] 유지보수 스케줄러 시작 ({len(self._tasks)}개 작업)")
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        self._stopping.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def run_now(self, name: str) -> dict | None:
+        """작업을 다음 루프에서 바로 실행하도록 예약. 없는 작업이면 None."""
+        with self._lock:
+            task = self._tasks.get(name)
+            if task is None:
+                return None
+            task.next_run = time.time()
+            view = task.view()
+        self._wake.set()
+        if not (self._thread and self._thread.is_alive()):
+            self._run(task)  # 스레드가 없으면 호출한 쪽에서 바로 실행
+            with self._lock:
+                view = task.view()
+        return view
+
+    def status(self) -> dict:
+        with self._lock:
+            tasks = [t.view() for t in sorted(self._tasks.values(), key=lambda t: t.name)]
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "disabled": MAINTENANCE_DISABLED,
+            "tasks": tasks,
+        }
+
+    def _loop(self):
+        while not self._stopping.is_set():
+            with self._lock:
+                due = sorted((t for t in self._tasks.values() if t.next_run <= time.time()),
+                             key=lambda t: t.next_run)
+                upcoming = min((t.next_run for t in self._tasks.values()), default=None)
+            for task in due:
+                if self._stopping.is_set():
+                    return
+                self._run(task)
+            if due:
+                continue
+            sleep = _MAX_SLEEP_SEC if upcoming is None else min(_MAX_SLEEP_SEC, max(0.0, upcoming - time.time()))
+            self._wake.wait(sleep)
+            self._wake.clear()
+
+    def _run(self, task: Task):
+        with self._lock:
+            if task.running:
+                return
+            task.running = True
+        budget = Budget(task.budget_sec)
+        started = time.perf_counter()
+        task.last_started_at = time.time()
+        status, result, error = "ok", None, None
+        try:
+            result = task.fn(budget)
+            if isinstance(result, dict) and result.get("partial"):
+                status = "partial"
+        except Exception as e:
+            status, error = "error", str(e)[:300]
+            print(f"[WARN] 유지보수 작업 실패 ({task.name}): {e}")
+        duration = time.perf_counter() - started
+        with self._lock:
+            task.running = False
+            task.runs += 1
+            task.failures += status == "error"
+            if duration > task.budget_sec:
+                task.over_budget += 1
+                print(f"[WARN] 유지보수 작업 예산 초과 ({task.name}): {duration:.1f}s > {task.budget_sec:g}s")
+            task.last_duration_ms = round(duration * 1000, 1)
+            task.last_status = status
+            task.last_result = result
+            task.last_error = error
+            task.schedule_next()
+
+
+_scheduler: Scheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+        return _scheduler
+
+
+# ──────────────────────────────────────────
+# 작업에서 쓰는 정리 도구
+# ──────────────────────────────────────────
+
+def _remove(path: Path) -> int:
+    """파일/폴더 삭제 후 해제된 바이트 수 반환."""
+    if path.is_dir():
+        size = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+        shutil.rmtree(path)
+        return size
+    size = path.stat().st_size
+    path.unlink()
+    return size
+
+
+def sweep_files(paths: Iterable[Path], max_age_sec: float, budget: Budget | None = None,
+                on_remove: Callable[[Path], None] | None = None) -> dict:
+    """mtime이 max_age_sec보다 오래된 파일/폴더 삭제. 예산이 다하면 partial=True로 중단."""
+    cutoff = time.time() - max_age_sec
+    removed, freed, scanned = 0, 0, 0
+    for path in paths:
+        if budget and budget.exceeded():
+            return {"removed": removed, "freed_bytes": freed, "scanned": scanned, "partial": True}
+        scanned += 1
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+            freed += _remove(path)
+            removed += 1
+            if on_remove:
+                on_remove(path)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"[WARN] 정리 실패 ({path.name}): {e}")
+    return {"removed": removed, "freed_bytes": freed, "scanned": scanned}
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def prune_versions(groups: dict[str, list[Path]], keep: int, max_age_sec: float,
+                   budget: Budget | None = None) -> dict:
+    """
+    그룹(예: 블로그별 DNA 파일)마다 최신 keep개는 남기고,
+    나머지 중 max_age_sec보다 오래된 것만 삭제한다.
+    """
+    stale: list[Path] = []
+    for paths in groups.values():
+        ordered = sorted(paths, key=_mtime, reverse=True)
+        stale.extend(ordered[keep:])
+    result = sweep_files(stale, max_age_sec, budget)
+    result["groups"] = len(groups)
+    return result
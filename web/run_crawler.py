@@ -2,9 +2,13 @@
 네이버 블로그 크롤러 — run_crawler.py
 app.py에서 import하여 사용:
   get_blog_id(blog_input) -> str | None
-  get_post_list(blog_id, count) -> list[dict]
+  get_post_list(blog_id, count, session=None) -> list[dict]
   get_post_content(blog_id, log_no) -> str
   save_results(blog_id, posts) -> str (folder path)
+  merge_into_store(blog_id, new_posts) -> (str folder path, list[dict] merged posts)
+
+session 인자에는 requests.Session 또는 crawler_engine.CrawlerEngine(같은 get 시그니처)을 넘길 수 있다.
+본문 페이지는 http_cache를 거쳐 받는다 (같은 글을 다시 수집하면 신선도 기간 안에는 네트워크 없이, 이후엔 조건부 요청).
 """
 
 import os
@@ -12,6 +16,8 @@ import re
 import json
 import time
 import shutil
+import tempfile
+import threading
 from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,9 +25,23 @@ from pathlib import Path
 import requests
 from bs4 import BeautifulSoup
 
+from blog_stats import ensure_metrics
+from collection_index import get_index
+from http_cache import get_http_cache
+
 # app.py에서 외부 주입: _run_crawler.OUTPUT_DIR = ...
 OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "mcp-data", "blog-collections")
 
+# 스텁 서버 테스트 시 교체 가능
+MOBILE_BASE = "https://m.blog.naver.com"
+PC_BASE = "https://blog.naver.com"
+
+# 증분 수집 저장소 폴더 접미사: {blog_id}_store
+STORE_SUFFIX = "store"
+
+# 본문을 받지 못한 글의 content — 저장소에 넣지 않아 다음 증분 수집 때 다시 받는다
+FETCH_FAILED_TEXT = "(본문 추출 실패)"
+
 BASE_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -36,15 +56,28 @@ BASE_HEADERS = {
 def _make_session(blog_id: str) -> requests.Session:
     s = requests.Session()
     s.headers.update(BASE_HEADERS)
-    s.headers["Referer"] = f"https://m.blog.naver.com/{blog_id}"
+    s.headers["Referer"] = f"{MOBILE_BASE}/{blog_id}"
     # 쿠키 획득
     try:
-        s.get(f"https://m.blog.naver.com/{blog_id}", timeout=10)
+        s.get(f"{MOBILE_BASE}/{blog_id}", timeout=10)
     except Exception:
         pass
     return s
 
 
+class _LazySession:
+    """첫 요청 때 세션을 만든다 — 캐시 hit만으로 끝나면 쿠키 획득 요청도 보내지 않음."""
+
+    def __init__(self, blog_id: str):
+        self.blog_id = blog_id
+        self._session = None
+
+    def get(self, url: str, **kwargs):
+        if self._session is None:
+            self._session = _make_session(self.blog_id)
+        return self._session.get(url, **kwargs)
+
+
 # ──────────────────────────────────────────
 # 1. 블로그 ID 추출
 # ──────────────────────────────────────────
@@ -69,18 +102,31 @@ def get_blog_id(blog_input: str) -> str | None:
 # 2. 글 목록 가져오기
 # ──────────────────────────────────────────
 
-def get_post_list(blog_id: str, count: int = 10) -> list[dict]:
+def get_post_list(blog_id: str, count: int = 10, session=None,
+                  known_log_nos: set[str] | None = None) -> list[dict]:
     """
     네이버 블로그 포스트 목록 반환.
     반환 형식: [{"title": ..., "logNo": ..., "addDate": ..., "url": ...}, ...]
+    session 미지정 시 새 세션을 만들고 페이지 사이 0.3초 대기 (엔진 사용 시 엔진이 속도 제한).
+
+    known_log_nos 지정 시 증분 모드: 최신 count개 글 범위를 그대로 훑되, 이미 수집한 logNo(정확히 일치)는
+    건너뛰고 나머지만 반환한다. 기존 글도 count에 포함되므로 새 글이 없으면 첫 페이지에서 끝나고,
+    count를 늘리면 그만큼 오래된 글까지 채우며, 저장소에 없는 글(이전에 본문 수집 실패 등)은 다시 받는다.
     """
-    session = _make_session(blog_id)
+    throttle = session is None
+    known = known_log_nos or set()
+    seen = 0
+
+    mobile_base = getattr(session, "mobile_base", MOBILE_BASE)
+    pc_base = getattr(session, "pc_base", PC_BASE)
+    if session is None:
+        session = _make_session(blog_id)
     posts = []
     page = 1
 
-    while len(posts) < count:
+    while seen < count:
         url = (
-            f"https://m.blog.naver.com/api/blogs/{blog_id}/post-list"
+            f"{mobile_base}/api/blogs/{blog_id}/post-list"
             f"?categoryNo=0&page={page}"
         )
         try:
@@ -99,6 +145,11 @@ def get_post_list(blog_id: str, count: int = 10) -> list[dict]:
 
         for item in items:
             log_no = str(item.get("logNo", ""))
+            seen += 1
+            if log_no in known:
+                if seen >= count:
+                    break
+                continue
             title = item.get("titleWithInspectMessage", "").strip() or "(제목 없음)"
             real_blog_id = item.get("domainIdOrBlogId") or blog_id
             add_date_ms = item.get("addDate")
@@ -110,21 +161,22 @@ def get_post_list(blog_id: str, count: int = 10) -> list[dict]:
                     add_date = ""
             else:
                 add_date = ""
-            post_url = f"https://blog.naver.com/{real_blog_id}/{log_no}"
+            post_url = f"{pc_base}/{real_blog_id}/{log_no}"
             posts.append({
                 "title": title,
                 "logNo": log_no,
                 "addDate": add_date,
                 "url": post_url,
             })
-            if len(posts) >= count:
+            if seen >= count:
                 break
 
         # 다음 페이지 없으면 종료
         if len(items) == 0:
             break
         page += 1
-        time.sleep(0.3)
+        if throttle:
+            time.sleep(0.3)
 
     return posts[:count]
 
@@ -142,23 +194,27 @@ def get_post_content(blog_id: str, log_no: str) -> str:
     return result.get("text", "")
 
 
-def get_post_content_with_style(blog_id: str, log_no: str) -> dict:
+def get_post_content_with_style(blog_id: str, log_no: str, session=None,
+                                mobile_base: str = MOBILE_BASE, pc_base: str = PC_BASE) -> dict:
     """
     본문 텍스트 + 시각적 스타일 메타데이터 반환.
     반환: {"text": str, "style_meta": dict}
+    여러 글을 수집할 때는 session을 넘겨 쿠키 획득 요청을 글마다 반복하지 않는다.
     """
-    session = _make_session(blog_id)
+    if session is None:
+        session = _LazySession(blog_id)
+    cache = get_http_cache()
     soup = None
 
     for fetch_url in [
-        f"https://m.blog.naver.com/{blog_id}/{log_no}",
+        f"{mobile_base}/{blog_id}/{log_no}",
         (
-            "https://blog.naver.com/PostView.naver"
+            f"{pc_base}/PostView.naver"
             f"?blogId={blog_id}&logNo={log_no}&redirect=Dlog&widgetTypeCall=true"
         ),
     ]:
         try:
-            resp = session.get(fetch_url, timeout=12)
+            resp = cache.get(fetch_url, session=session, timeout=12)
             resp.raise_for_status()
             candidate = BeautifulSoup(resp.text, "html.parser")
             div = (
@@ -278,6 +334,10 @@ def save_results(blog_id: str, posts: list[dict]) -> str:
     folder = Path(OUTPUT_DIR) / f"{blog_id}_{timestamp}"
     folder.mkdir(parents=True, exist_ok=True)
 
+    # 글 단위 통계 지표는 수집 시 한 번만 계산해 글과 함께 저장
+    for post in posts:
+        ensure_metrics(post)
+
     # app.py가 읽는 _data.json 형식
     data = {
         "blog_id": blog_id,
@@ -289,15 +349,13 @@ def save_results(blog_id: str, posts: list[dict]) -> str:
 
     # 개별 txt (사람이 읽기용)
     for post in posts:
-        log_no = post.get("logNo", "unknown")
-        title = re.sub(r'[\\/:*?"<>|]', "_", post.get("title", ""))[:60]
-        filename = f"{log_no}_{title}.txt"
-        with open(folder / filename, "w", encoding="utf-8") as f:
-            f.write(f"제목: {post.get('title', '')}\n")
-            f.write(f"날짜: {post.get('addDate', '')}\n")
-            f.write(f"URL:  {post.get('url', '')}\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(post.get("content", ""))
+        _write_post_txt(folder, post)
+
+    # 수집 인덱스 갱신 (app.py가 _data.json 전체 스캔 없이 조회)
+    try:
+        get_index(OUTPUT_DIR).record_collection(folder, data)
+    except Exception as e:
+        print(f"[WARN] 수집 인덱스 갱신 실패: {e}")
 
     # 같은 blog_id의 오래된 수집 폴더 정리 (최신 3개만 유지)
     _cleanup_old_collections(Path(OUTPUT_DIR), blog_id, keep=3)
@@ -305,13 +363,157 @@ def save_results(blog_id: str, posts: list[dict]) -> str:
     return str(folder)
 
 
+def _write_post_txt(folder: Path, post: dict):
+    log_no = post.get("logNo", "unknown")
+    title = re.sub(r'[\\/:*?"<>|]', "_", post.get("title", ""))[:60]
+    filename = f"{log_no}_{title}.txt"
+    with open(folder / filename, "w", encoding="utf-8") as f:
+        f.write(f"제목: {post.get('title', '')}\n")
+        f.write(f"날짜: {post.get('addDate', '')}\n")
+        f.write(f"URL:  {post.get('url', '')}\n")
+        f.write("=" * 60 + "\n\n")
+        f.write(post.get("content", ""))
+
+
+def store_folder(blog_id: str) -> Path:
+    """증분 수집용 blog_id별 단일 저장소 폴더."""
+    return Path(OUTPUT_DIR) / f"{blog_id}_{STORE_SUFFIX}"
+
+
+_store_locks: dict[str, threading.Lock] = {}
+_store_locks_guard = threading.Lock()
+
+
+def _store_lock(blog_id: str) -> threading.Lock:
+    with _store_locks_guard:
+        lock = _store_locks.get(blog_id)
+        if lock is None:
+            lock = _store_locks[blog_id] = threading.Lock()
+        return lock
+
+
+def merge_into_store(blog_id: str, new_posts: list[dict]) -> tuple[str, list[dict]]:
+    """
+    새로 받은 글을 OUTPUT_DIR/{blog_id}_store/ 에 병합 저장 (url 기준 중복 제거, 최신 순).
+    본문 수집에 실패한 글(FETCH_FAILED_TEXT)은 새 글이든 기존 글이든 저장하지 않는다 — known 집합에서 빠져 다음에 다시 받음.
+    저장소가 없으면 기존 타임스탬프 수집 폴더들의 글로 초기화하고,
+    병합이 끝나면 저장소에 모두 포함된 타임스탬프 폴더는 삭제한다.
+    반환값: (저장 폴더 경로, 병합된 전체 글 목록)
+    """
+    # 수집 요청과 유지보수(compact_collections)가 같은 저장소를 동시에 병합하지 않도록 blog_id별 잠금
+    with _store_lock(blog_id):
+        return _merge_into_store_locked(blog_id, new_posts)
+
+
+def _merge_into_store_locked(blog_id: str, new_posts: list[dict]) -> tuple[str, list[dict]]:
+    index = get_index(OUTPUT_DIR)
+    folder = store_folder(blog_id)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    # 기존 글 (저장소 + 스냅샷 폴더, 인덱스가 url 기준 중복 제거)
+    existing = index.load_posts(blog_id)
+    new_posts = [p for p in new_posts if p.get("content") != FETCH_FAILED_TEXT]
+    merged: dict[str, dict] = {}
+    for post in new_posts + existing:
+        url = post.get("url")
+        if url and url not in merged and post.get("content") != FETCH_FAILED_TEXT:
+            merged[url] = post
+    posts = sorted(
+        merged.values(),
+        key=lambda p: (p.get("addDate", ""), int(p["logNo"]) if str(p.get("logNo", "")).isdigit() else 0),
+        reverse=True,
+    )
+    for post in posts:
+        ensure_metrics(post)
+
+    data = {
+        "blog_id": blog_id,
+        "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "posts": posts,
+    }
+    data_file = folder / "_data.json"
+    # 임시 파일 이름은 쓰기마다 고유 (_data.*.json.tmp — compact_collections가 오래된 것만 정리)
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=folder, prefix="_data.", suffix=".json.tmp",
+                                     delete=False) as f:
+        tmp = Path(f.name)
+        try:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        except BaseException:
+            f.close()
+            tmp.unlink(missing_ok=True)
+            raise
+    os.replace(tmp, data_file)
+
+    for post in new_posts:
+        _write_post_txt(folder, post)
+
+    try:
+        index.record_collection(folder, data)
+    except Exception as e:
+        print(f"[WARN] 수집 인덱스 갱신 실패: {e}")
+
+    # 저장소가 모든 글을 포함하므로 타임스탬프 스냅샷은 더 이상 필요 없음
+    _cleanup_old_collections(Path(OUTPUT_DIR), blog_id, keep=0)
+
+    return str(folder), posts
+
+
+_SNAPSHOT_FOLDER = re.compile(r"(.+)_\d{8}_\d{6}")
+
+
+def compact_collections(keep: int = 3, budget=None) -> dict:
+    """
+    유지보수용 수집 폴더 정리 (app.py 유지보수 스케줄러에서 호출).
+    - 증분 저장소가 있는 블로그: 남은 타임스탬프 스냅샷을 저장소에 병합하고 스냅샷 삭제
+    - 저장소가 없는 블로그: 타임스탬프 폴더를 최신 keep개만 유지
+    - 중단된 저장소 쓰기의 임시 파일(_data.*.json.tmp) 중 1시간 지난 것 삭제
+    budget(maintenance.Budget)이 다하면 멈추고 partial=True를 돌려준다.
+    """
+    output_dir = Path(OUTPUT_DIR)
+    snapshots: dict[str, list[str]] = {}
+    stale_tmp = 0
+    for item in output_dir.iterdir():
+        if not item.is_dir():
+            continue
+        m = _SNAPSHOT_FOLDER.fullmatch(item.name)
+        if m:
+            snapshots.setdefault(m.group(1), []).append(item.name)
+        # _data.*.json.tmp (merge_into_store) + 예전 고정 이름 _data.json.tmp
+        for tmp in item.glob("_data*.json.tmp"):
+            try:
+                if time.time() - tmp.stat().st_mtime > 3600:
+                    tmp.unlink(missing_ok=True)
+                    stale_tmp += 1
+            except OSError:
+                pass
+
+    merged = trimmed = 0
+    for blog_id, folders in sorted(snapshots.items()):
+        if budget is not None and budget.exceeded():
+            return {"merged": merged, "trimmed": trimmed, "stale_tmp": stale_tmp, "partial": True}
+        if store_folder(blog_id).exists():
+            merge_into_store(blog_id, [])
+            merged += 1
+        elif len(folders) > keep:
+            _cleanup_old_collections(output_dir, blog_id, keep=keep)
+            trimmed += 1
+    return {"merged": merged, "trimmed": trimmed, "stale_tmp": stale_tmp}
+
+
 def _cleanup_old_collections(output_dir: Path, blog_id: str, keep: int = 3):
-    """blog_id에 해당하는 수집 폴더를 최신 keep개만 남기고 삭제."""
+    """
+    blog_id의 타임스탬프 수집 폴더({blog_id}_YYYYMMDD_HHMMSS)를 최신 keep개만 남기고 삭제.
+    증분 저장소({blog_id}_store)와 blog_id가 접두사로 겹치는 다른 블로그 폴더는 건드리지 않는다.
+    """
     try:
-        folders = sorted(output_dir.glob(f"{blog_id}_*"))
-        for old in folders[:-keep]:
+        pattern = re.compile(rf"{re.escape(blog_id)}_\d{{8}}_\d{{6}}")
+        folders = sorted(p for p in output_dir.iterdir()
+                         if p.is_dir() and pattern.fullmatch(p.name))
+        index = get_index(output_dir)
+        for old in (folders[:-keep] if keep else folders):
             try:
                 shutil.rmtree(old)
+                index.remove_collection(old.name)
             except Exception:
                 pass
     except Exception:
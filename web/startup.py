@@ -0,0 +1,192 @@
+"""
+웹 앱 기동 관리 — startup.py
+서버가 요청을 받기 전에 끝내야 하는 일만 app.py import 중에 하고,
+무거운 파서/SDK 미리 불러오기 등은 백그라운드 warm-up 스레드에서 처리한다.
+(오래된 파일 정리 같은 주기 작업은 maintenance.py 스케줄러 담당)
+
+app.py에서 import하여 사용:
+  begin(t0) / mark(phase)          # import 단계별 소요 시간 기록 (t0 = perf_counter 기준점)
+  start_warmup(tasks)              # [(이름, 함수), ...]를 데몬 스레드에서 순서대로 실행
+  status() -> dict                 # /api/ready 응답 (ready, 단계별 시간, warm-up 작업 결과)
+  preload_modules(names)           # 모듈 import만 미리 해 두기 (없는 모듈은 건너뜀)
+  profile_startup(top) -> int      # python app.py --profile-startup: import 시간 리포트 출력
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# STARTUP_PRELOAD=0 이면 warm-up에서 파서/SDK를 미리 import하지 않음 (첫 사용 시 로드)
+STARTUP_PRELOAD = os.getenv("STARTUP_PRELOAD", "1") != "0"
+# 첫 요청 지연을 줄이려고 warm-up에서 미리 불러올 모듈 (app.py에서는 사용하는 함수 안에서 import)
+PRELOAD_MODULES = ("requests", "google.genai", "pdfplumber", "fitz", "docx")
+
+_PHASES_MARKER = "__STARTUP_PHASES__"
+
+_lock = threading.Lock()
+_t0: float | None = None
+_started_perf = 0.0
+_phases: list[dict] = []
+_state = {
+    "ready": False,
+    "started_at": None,
+    "finished_at": None,
+    "tasks": [],
+}
+
+
+def begin(t0: float):
+    """단계 측정 기준점 설정 (app.py 맨 위의 time.perf_counter() 값)."""
+    global _t0
+    _t0 = t0
+
+
+def mark(phase: str):
+    """기준점(또는 직전 단계) 이후 소요 시간을 phase 이름으로 기록."""
+    if _t0 is None:
+        return
+    now = time.perf_counter()
+    elapsed = round((now - _t0) * 1000, 1)
+    prev = _phases[-1]["at_ms"] if _phases else 0.0
+    _phases.append({"phase": phase, "ms": round(elapsed - prev, 1), "at_ms": elapsed})
+
+
+def preload_modules(names=PRELOAD_MODULES) -> dict:
+    """모듈을 미리 import. {모듈: ms 또는 None(미설치)}"""
+    loaded = {}
+    for name in names:
+        started = time.perf_counter()
+        try:
+            __import__(name)
+            loaded[name] = round((time.perf_counter() - started) * 1000, 1)
+        except ImportError:
+            loaded[name] = None
+    return loaded
+
+
+def _run(tasks):
+    for name, fn in tasks:
+        started = time.perf_counter()
+        entry = {"name": name, "ok": True}
+        try:
+            result = fn()
+            if result is not None:
+                entry["result"] = result
+        except Exception as e:
+            entry["ok"] = False
+            entry["error"] = str(e)[:200]
+            print(f"[WARN] warm-up 작업 실패 ({name}): {e}")
+        entry["ms"] = round((time.perf_counter() - started) * 1000, 1)
+        with _lock:
+            _state["tasks"].append(entry)
+    with _lock:
+        _state["ready"] = True
+        _state["finished_at"] = time.time()
+    total = round((time.perf_counter() - _started_perf) * 1000)
+    print(f"[OK] warm-up 완료 ({len(tasks)}개 작업, {total}ms)")
+
+
+def start_warmup(tasks) -> threading.Thread | None:
+    """warm-up 작업을 데몬 스레드에서 실행. 이미 시작했으면 None."""
+    global _started_perf
+    with _lock:
+        if _state["started_at"] is not None:
+            return None
+        _state["started_at"] = time.time()
+    _started_perf = time.perf_counter()
+    thread = threading.Thread(target=_run, args=(list(tasks),), name="startup-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def status() -> dict:
+    with _lock:
+        return {
+            "ready": _state["ready"],
+            "started_at": _state["started_at"],
+            "finished_at": _state["finished_at"],
+            "import_ms": _phases[-1]["at_ms"] if _phases else None,
+            "phases": list(_phases),
+            "tasks": [dict(t) for t in _state["tasks"]],
+        }
+
+
+# ──────────────────────────────────────────
+# python app.py --profile-startup
+# ──────────────────────────────────────────
+
+def _parse_importtime(stderr: str) -> list[dict]:
+    """-X importtime 출력 → [{module, self_us, cumulative_us, depth}]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 줄
+        name = parts[2].rstrip()
+        rows.append({
+            "module": name.strip(),
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+            "depth": (len(name) - len(name.lstrip())) // 2,
+        })
+    return rows
+
+
+def profile_startup(top: int = 25, module: str = "app") -> int:
+    """
+    새 프로세스에서 `python -X importtime -c "import app"`을 실행해
+    패키지별 import 시간, 느린 모듈, app.py 단계별 시간을 출력한다 (서버는 띄우지 않음).
+    """
+    web_dir = Path(__file__).parent
+    code = (
+        "import time, json; t = time.perf_counter()\n"
+        f"import {module}, startup\n"
+        "wall = round((time.perf_counter() - t) * 1000, 1)\n"
+        f"print({_PHASES_MARKER!r} + json.dumps({{'wall_ms': wall, 'phases': startup.status()['phases']}}))\n"
+    )
+    env = dict(os.environ, STARTUP_PRELOAD="0", PYTHONIOENCODING="utf-8")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(web_dir), env=env, capture_output=True, text=True, encoding="utf-8", errors="replace",
+    )
+    if proc.returncode != 0:
+        print(f"[WARN] {module} import 실패 (exit {proc.returncode})")
+        print(proc.stderr[-2000:])
+        return proc.returncode
+
+    rows = _parse_importtime(proc.stderr)
+    summary = {}
+    for line in proc.stdout.splitlines():
+        if line.startswith(_PHASES_MARKER):
+            summary = json.loads(line[len(_PHASES_MARKER):])
+
+    by_package: dict[str, int] = defaultdict(int)
+    for r in rows:
+        by_package[r["module"].split(".")[0]] += r["self_us"]
+
+    print("=" * 60)
+    print(f"  시작 프로파일: import {module}  (총 {summary.get('wall_ms', '?')}ms)")
+    print("=" * 60)
+    print(f"\n[패키지별 import 시간 상위 {top}]")
+    for pkg, us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {us / 1000:9.1f}ms  {pkg}")
+
+    print(f"\n[누적 시간이 긴 모듈 상위 {top}]")
+    for r in sorted(rows, key=lambda r: -r["cumulative_us"])[:top]:
+        print(f"  {r['cumulative_us'] / 1000:9.1f}ms  {'  ' * r['depth']}{r['module']}")
+
+    if summary.get("phases"):
+        print(f"\n[{module}.py 단계별 시간]")
+        for p in summary["phases"]:
+            print(f"  {p['ms']:9.1f}ms  {p['phase']}")
+
+    preload = ", ".join(PRELOAD_MODULES)
+    print(f"\n  ※ warm-up 미리 불러오기 제외하고 측정 ({preload}는 첫 사용 또는 warm-up 때 로드)")
+    return 0